@@ -0,0 +1,77 @@
+"""Time full and sampled data validation of one large batch.
+
+Builds a throwaway feature store part from copies of data/train.csv, split into row groups
+like the ones ingestion writes, and validates it in both modes on a single worker:
+
+    python -m benchmarks.validation_modes --copies 300 --row-group-size 10000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+from shipment.components.data_validation import DataValidation
+from shipment.configuration.dictionary_operations import DictionaryOperation
+from shipment.configuration.parquet_operations import ParquetOperation
+from shipment.constant import FEATURE_STORE_DICTIONARIES_DIR_NAME, SCHEMA_FILE_PATH
+from shipment.entity.artifacts_entity import DataIngestionArtifacts
+from shipment.entity.config_entity import DataValidationConfig
+from shipment.utils.main_utils import MainUtils
+
+
+def build_feature_store(feature_store_dir: str, copies: int, row_group_size: int) -> str:
+    schema_config = MainUtils().read_yaml_file(SCHEMA_FILE_PATH)
+    parquet_op = ParquetOperation(
+        schema_config, DictionaryOperation(os.path.join(feature_store_dir, FEATURE_STORE_DICTIONARIES_DIR_NAME))
+    )
+    # Raw CSV rows look like the documents of the collection
+    records = pd.read_csv("data/train.csv").to_dict(orient="records")
+    table = pa.concat_tables([parquet_op.records_to_table(records)] * copies)
+    file_path = os.path.join(feature_store_dir, "part-00000.parquet")
+    parquet_op.write_tables(
+        (table.slice(start, row_group_size) for start in range(0, table.num_rows, row_group_size)), file_path
+    )
+    return file_path
+
+
+def time_validation(data_validation: DataValidation, file_path: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        report = data_validation.validate([file_path])
+        timings.append(time.perf_counter() - start_time)
+    return min(timings), report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time full and sampled data validation")
+    parser.add_argument("--copies", type=int, default=300, help="copies of data/train.csv in the batch")
+    parser.add_argument("--row-group-size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as feature_store_dir:
+        file_path = build_feature_store(feature_store_dir, args.copies, args.row_group_size)
+        artifacts = DataIngestionArtifacts(feature_store_path=feature_store_dir, n_rows=0)
+        for validation_mode in ("full", "sample"):
+            config = DataValidationConfig(
+                validation_mode=validation_mode,
+                n_workers=1,
+                background_reports=False,
+                data_validation_artifacts_dir=feature_store_dir,
+            )
+            seconds, report = time_validation(DataValidation(artifacts, config), file_path, args.repeat)
+            sample = report.get("sample", {})
+            print(
+                f"{validation_mode:>6}: {seconds:.2f}s, status {report['validation_status']}, "
+                f"{report['n_rows']:,} rows checked of {sample.get('n_population_rows', report['n_rows']):,}"
+                + (f", {sample['n_row_groups']} of {sample['n_population_row_groups']} row groups" if sample else "")
+                + (", escalated" if "escalated_from_sample" in report else "")
+            )
+
+
+if __name__ == "__main__":
+    main()
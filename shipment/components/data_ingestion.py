@@ -0,0 +1,547 @@
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from bson import ObjectId
+
+from shipment.configuration.dictionary_operations import DictionaryOperation
+from shipment.configuration.mongo_operations import MongoDBOperation
+from shipment.configuration.parquet_operations import ROW_INDEX_SCHEMA, ParquetOperation
+from shipment.configuration.row_fingerprint_operations import RowFingerprintOperation
+from shipment.constant import (
+    DATA_INGESTION_SPLIT_BUCKETS,
+    FEATURE_STORE_DICTIONARIES_DIR_NAME,
+    FEATURE_STORE_FILE_EXTENSION,
+    FEATURE_STORE_FILE_PREFIX,
+    FEATURE_STORE_FINGERPRINT_FILE_NAME,
+    FEATURE_STORE_QUARANTINE_DIR_NAME,
+    FEATURE_STORE_ROW_FINGERPRINTS_DIR_NAME,
+    FEATURE_STORE_WATERMARK_FILE_NAME,
+    MONGO_ID_COLUMN,
+)
+from shipment.entity.artifacts_entity import DataIngestionArtifacts
+from shipment.entity.config_entity import DataIngestionConfig
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+
+
+class DataIngestion:
+    def __init__(self, data_ingestion_config: DataIngestionConfig, mongo_op: MongoDBOperation):
+        self.data_ingestion_config = data_ingestion_config
+        self.mongo_op = mongo_op
+        self.utils = MainUtils()
+        self.schema_config = self.utils.read_yaml_file(data_ingestion_config.schema_file_path)
+        self.dictionary_op = DictionaryOperation(
+            os.path.join(data_ingestion_config.feature_store_dir, FEATURE_STORE_DICTIONARIES_DIR_NAME)
+        )
+        self.parquet_op = ParquetOperation(self.schema_config, self.dictionary_op)
+        self.row_fingerprint_op = RowFingerprintOperation(
+            os.path.join(data_ingestion_config.feature_store_dir, FEATURE_STORE_ROW_FINGERPRINTS_DIR_NAME)
+        )
+        self.watermark_file_path = os.path.join(
+            data_ingestion_config.feature_store_dir, FEATURE_STORE_WATERMARK_FILE_NAME
+        )
+        self.fingerprint_file_path = os.path.join(
+            data_ingestion_config.feature_store_dir, FEATURE_STORE_FINGERPRINT_FILE_NAME
+        )
+        # Upper bound of the watermark column used by the last export, see get_watermark_cutoff
+        self.watermark_cutoff: Optional[ObjectId] = None
+
+    def get_feature_store_file_path(self, part: int = 0) -> str:
+        return os.path.join(
+            self.data_ingestion_config.feature_store_dir,
+            f"{FEATURE_STORE_FILE_PREFIX}-{part:05d}{FEATURE_STORE_FILE_EXTENSION}",
+        )
+
+    def get_feature_store_parts(self) -> List[str]:
+        return self.parquet_op.get_part_file_paths(self.data_ingestion_config.feature_store_dir)
+
+    @staticmethod
+    def get_part_number(file_path: str) -> int:
+        file_name = os.path.basename(file_path)
+        return int(file_name[len(FEATURE_STORE_FILE_PREFIX) + 1 : -len(FEATURE_STORE_FILE_EXTENSION)])
+
+    @staticmethod
+    def encode_watermark(value: Any) -> Dict:
+        if isinstance(value, ObjectId):
+            return {"type": "objectid", "value": str(value)}
+        if isinstance(value, datetime):
+            return {"type": "datetime", "value": value.isoformat()}
+        return {"type": "raw", "value": value}
+
+    @staticmethod
+    def decode_watermark(encoded: Dict) -> Any:
+        if encoded["type"] == "objectid":
+            return ObjectId(encoded["value"])
+        if encoded["type"] == "datetime":
+            return datetime.fromisoformat(encoded["value"])
+        return encoded["value"]
+
+    def read_watermark(self) -> Optional[Dict]:
+        """Return the recorded watermark, or None when the feature store has to be rebuilt.
+
+        A watermark recorded for a different column cannot be used to filter the
+        collection, so it is treated like a missing one.
+        """
+        if not os.path.exists(self.watermark_file_path):
+            return None
+
+        watermark = self.utils.read_json_file(self.watermark_file_path)
+        if watermark.get("column") != self.data_ingestion_config.watermark_column:
+            logging.info(f"Ignoring watermark recorded on column {watermark.get('column')}")
+            return None
+        return watermark
+
+    def write_watermark(self, value: Any, parts: List[str]) -> None:
+        self.utils.write_json_file(
+            self.watermark_file_path,
+            {
+                "column": self.data_ingestion_config.watermark_column,
+                "watermark": self.encode_watermark(value),
+                "parts": [os.path.basename(part) for part in parts],
+            },
+        )
+
+    def remove_orphan_parts(self, watermark: Dict) -> None:
+        """Delete the parts, and their row fingerprints, of a run that died before recording its watermark."""
+        for part in self.get_feature_store_parts():
+            if os.path.basename(part) not in watermark["parts"]:
+                logging.info(f"Removing orphan feature store part {part}")
+                os.remove(part)
+                fingerprint_file_path = self.row_fingerprint_op.get_fingerprint_file_path(part)
+                if os.path.exists(fingerprint_file_path):
+                    os.remove(fingerprint_file_path)
+
+    def quarantine_parts(self, part_file_paths: List[str]) -> None:
+        """Move parts that failed validation out of the feature store, into its quarantine directory.
+
+        The watermark keeps its value, so the rejected documents are not fetched again and
+        later batches are ingested and validated on their own. When no part is left, the
+        watermark and source fingerprint are dropped so the next run does a full export.
+        """
+        logging.info("Entered the quarantine_parts method of DataIngestion class")
+        try:
+            quarantine_dir = os.path.join(
+                self.data_ingestion_config.feature_store_dir, FEATURE_STORE_QUARANTINE_DIR_NAME
+            )
+            os.makedirs(quarantine_dir, exist_ok=True)
+            watermark = self.read_watermark()
+            for part_file_path in part_file_paths:
+                if not os.path.exists(part_file_path):
+                    continue
+                quarantine_file_path = os.path.join(
+                    quarantine_dir, f"{datetime.now():%Y%m%d%H%M%S}-{os.path.basename(part_file_path)}"
+                )
+                os.replace(part_file_path, quarantine_file_path)
+                fingerprint_file_path = self.row_fingerprint_op.get_fingerprint_file_path(part_file_path)
+                if os.path.exists(fingerprint_file_path):
+                    os.remove(fingerprint_file_path)
+                logging.info(f"Quarantined feature store part {part_file_path} as {quarantine_file_path}")
+
+            parts = self.get_feature_store_parts()
+            if not parts:
+                for file_path in (self.watermark_file_path, self.fingerprint_file_path):
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+            elif watermark is not None:
+                self.write_watermark(self.decode_watermark(watermark["watermark"]), parts)
+
+            logging.info("Exited the quarantine_parts method of DataIngestion class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_watermark_cutoff(self) -> Optional[ObjectId]:
+        """Smallest ``_id`` an export may not read yet, ``watermark_lag_seconds`` before now.
+
+        ObjectIds are generated by the clients, so concurrent writers can commit a lower
+        ``_id`` after a higher one. Only reading ids older than the lag keeps such late
+        commits above the watermark, as long as writers commit within the lag and their
+        clocks agree with ours. Other watermark columns get no cutoff.
+        """
+        lag_seconds = self.data_ingestion_config.watermark_lag_seconds
+        if self.data_ingestion_config.watermark_column != MONGO_ID_COLUMN or lag_seconds <= 0:
+            return None
+        return ObjectId.from_datetime(datetime.now(timezone.utc) - timedelta(seconds=lag_seconds))
+
+    def get_watermark_query(self, last_value: Any = None) -> Dict:
+        """Filter on the watermark column above ``last_value`` and below the current cutoff."""
+        self.watermark_cutoff = self.get_watermark_cutoff()
+        bounds = {}
+        if last_value is not None:
+            bounds["$gt"] = last_value
+        if self.watermark_cutoff is not None:
+            bounds["$lt"] = self.watermark_cutoff
+        return {self.data_ingestion_config.watermark_column: bounds} if bounds else {}
+
+    def has_documents_after_cutoff(self) -> bool:
+        """Whether the last export left documents behind its cutoff for a later run."""
+        if self.watermark_cutoff is None:
+            return False
+        collection = self.mongo_op.get_collection(
+            self.data_ingestion_config.db_name, self.data_ingestion_config.collection_name
+        )
+        document = collection.find_one({MONGO_ID_COLUMN: {"$gte": self.watermark_cutoff}}, {MONGO_ID_COLUMN: 1})
+        return document is not None
+
+    def get_projection(self) -> Dict:
+        projection = {column: 1 for column in self.parquet_op.arrow_schema.names}
+        projection[self.data_ingestion_config.watermark_column] = 1
+        return projection
+
+    def get_source_fingerprint(self) -> str:
+        """Hash everything that determines the feature store contents.
+
+        That is the state of the source collection plus the query, projection and schema
+        used to export it, so a schema change invalidates the cache as well.
+        """
+        logging.info("Entered the get_source_fingerprint method of DataIngestion class")
+        try:
+            source = {
+                "db_name": self.data_ingestion_config.db_name,
+                "collection_name": self.data_ingestion_config.collection_name,
+                "collection_state": self.mongo_op.get_collection_state(
+                    self.data_ingestion_config.db_name, self.data_ingestion_config.collection_name
+                ),
+                "query": {},
+                "projection": self.get_projection(),
+                "columns": self.schema_config["columns"],
+                "date_format": self.schema_config["date_format"],
+            }
+            fingerprint = hashlib.sha256(json.dumps(source, sort_keys=True, default=str).encode()).hexdigest()
+
+            logging.info("Exited the get_source_fingerprint method of DataIngestion class")
+            return fingerprint
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def is_feature_store_current(self, fingerprint: str) -> bool:
+        if not os.path.exists(self.fingerprint_file_path) or not self.get_feature_store_parts():
+            return False
+        return self.utils.read_json_file(self.fingerprint_file_path).get("fingerprint") == fingerprint
+
+    def iter_batches_from_mongodb(
+        self, query: Optional[Dict] = None, high_water_mark: Optional[Dict] = None
+    ) -> Iterator[pa.Table]:
+        """Yield the documents matching ``query`` as typed Arrow tables of at most ``batch_size`` rows.
+
+        When ``high_water_mark`` is given, its ``value`` is updated in place with the
+        largest watermark column value seen so far.
+        """
+        watermark_column = self.data_ingestion_config.watermark_column
+        projection = self.get_projection()
+        if self.data_ingestion_config.n_workers > 1:
+            batches = self.mongo_op.iter_collection_batches_parallel(
+                self.data_ingestion_config.db_name,
+                self.data_ingestion_config.collection_name,
+                batch_size=self.data_ingestion_config.batch_size,
+                n_workers=self.data_ingestion_config.n_workers,
+                max_prefetch_batches=self.data_ingestion_config.max_prefetch_batches,
+                query=query,
+                projection=projection,
+            )
+        else:
+            batches = self.mongo_op.iter_collection_batches(
+                self.data_ingestion_config.db_name,
+                self.data_ingestion_config.collection_name,
+                batch_size=self.data_ingestion_config.batch_size,
+                query=query,
+                projection=projection,
+            )
+
+        for records in batches:
+            if high_water_mark is not None:
+                values = [
+                    record[watermark_column] for record in records if record.get(watermark_column) is not None
+                ]
+                if values:
+                    batch_max = max(values)
+                    if high_water_mark["value"] is None or batch_max > high_water_mark["value"]:
+                        high_water_mark["value"] = batch_max
+            yield self.parquet_op.records_to_table(records)
+
+    def drop_duplicate_rows(self, tables: Iterator[pa.Table], stats: Dict) -> Iterator[pa.Table]:
+        """Yield ``tables`` without the rows already in the feature store or earlier in the stream.
+
+        Pass-through when deduplication is disabled. ``stats["n_duplicate_rows"]`` counts the
+        rows removed; batches left empty are skipped.
+        """
+        for table in tables:
+            if self.data_ingestion_config.deduplicate:
+                table, n_duplicates = self.row_fingerprint_op.drop_duplicates(table)
+                stats["n_duplicate_rows"] += n_duplicates
+            if table.num_rows:
+                yield table
+
+    def commit_part(self, feature_store_file_path: str) -> None:
+        """Record the row fingerprints of a part that was just written."""
+        if self.data_ingestion_config.deduplicate:
+            self.row_fingerprint_op.save(feature_store_file_path)
+
+    def export_data_into_feature_store(self) -> DataIngestionArtifacts:
+        """Stream the whole collection into the feature store one row group per batch.
+
+        Peak memory is bounded by ``batch_size`` rather than by the size of the collection.
+        The watermark is dropped first, so a run that dies half way is followed by another
+        full export instead of an incremental one on top of a partial store.
+        """
+        logging.info("Entered the export_data_into_feature_store method of DataIngestion class")
+        try:
+            if os.path.exists(self.watermark_file_path):
+                os.remove(self.watermark_file_path)
+            self.row_fingerprint_op.reset()
+
+            feature_store_file_path = self.get_feature_store_file_path()
+            high_water_mark = {"value": None}
+            stats = {"n_duplicate_rows": 0}
+            n_rows = self.parquet_op.write_tables(
+                self.drop_duplicate_rows(
+                    self.iter_batches_from_mongodb(
+                        query=self.get_watermark_query(), high_water_mark=high_water_mark
+                    ),
+                    stats,
+                ),
+                feature_store_file_path,
+            )
+            for part in self.get_feature_store_parts():
+                if part != feature_store_file_path:
+                    os.remove(part)
+            self.commit_part(feature_store_file_path)
+            self.write_watermark(high_water_mark["value"], [feature_store_file_path])
+
+            logging.info("Exited the export_data_into_feature_store method of DataIngestion class")
+            return DataIngestionArtifacts(
+                feature_store_path=self.data_ingestion_config.feature_store_dir,
+                n_rows=n_rows,
+                n_duplicate_rows=stats["n_duplicate_rows"],
+                new_part_file_paths=[feature_store_file_path],
+            )
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def export_new_data_into_feature_store(self) -> DataIngestionArtifacts:
+        """Append the documents added since the last run to the feature store as a new part.
+
+        Only documents whose watermark column is above the recorded high-water mark are
+        fetched, so the cost of a run scales with the number of new documents. Client
+        generated ``_id`` values do not strictly follow commit order when several writers
+        insert at once, so ``_id`` is only read up to ``get_watermark_cutoff``; other
+        watermark columns must be assigned in commit order. Falls back to a full export
+        when no watermark has been recorded yet.
+        """
+        logging.info("Entered the export_new_data_into_feature_store method of DataIngestion class")
+        try:
+            watermark = self.read_watermark()
+            if watermark is None or watermark["watermark"]["value"] is None:
+                logging.info("No usable watermark found, running a full export")
+                return self.export_data_into_feature_store()
+
+            self.remove_orphan_parts(watermark)
+            parts = self.get_feature_store_parts()
+            if self.data_ingestion_config.deduplicate:
+                self.row_fingerprint_op.load(parts)
+            last_value = self.decode_watermark(watermark["watermark"])
+            high_water_mark = {"value": last_value}
+            stats = {"n_duplicate_rows": 0}
+            batches = self.drop_duplicate_rows(
+                self.iter_batches_from_mongodb(
+                    query=self.get_watermark_query(last_value), high_water_mark=high_water_mark
+                ),
+                stats,
+            )
+
+            first_batch = next(batches, None)
+            new_part_file_paths = []
+            if first_batch is None:
+                logging.info(f"No new rows above watermark {last_value}")
+                n_rows = 0
+                # New documents that were all duplicates must not be fetched again
+                if high_water_mark["value"] != last_value:
+                    self.write_watermark(high_water_mark["value"], parts)
+            else:
+                next_part = self.get_part_number(parts[-1]) + 1 if parts else 0
+                feature_store_file_path = self.get_feature_store_file_path(next_part)
+                n_rows = self.parquet_op.write_tables(chain([first_batch], batches), feature_store_file_path)
+                self.commit_part(feature_store_file_path)
+                self.write_watermark(high_water_mark["value"], parts + [feature_store_file_path])
+                new_part_file_paths.append(feature_store_file_path)
+                logging.info(f"Appended {n_rows} rows, watermark moved to {high_water_mark['value']}")
+
+            if stats["n_duplicate_rows"]:
+                logging.info(f"Dropped {stats['n_duplicate_rows']} duplicate rows")
+
+            logging.info("Exited the export_new_data_into_feature_store method of DataIngestion class")
+            return DataIngestionArtifacts(
+                feature_store_path=self.data_ingestion_config.feature_store_dir,
+                n_rows=n_rows,
+                n_duplicate_rows=stats["n_duplicate_rows"],
+                new_part_file_paths=new_part_file_paths,
+            )
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def export_dataframe_into_feature_store(self) -> DataIngestionArtifacts:
+        """Load the collection in one go and write it to the feature store.
+
+        No watermark is recorded, so the next incremental run starts with a full export.
+        """
+        logging.info("Entered the export_dataframe_into_feature_store method of DataIngestion class")
+        try:
+            if os.path.exists(self.watermark_file_path):
+                os.remove(self.watermark_file_path)
+
+            self.row_fingerprint_op.reset()
+
+            df = self.mongo_op.get_collection_as_dataframe(
+                self.data_ingestion_config.db_name, self.data_ingestion_config.collection_name
+            )
+            feature_store_file_path = self.get_feature_store_file_path()
+            table = self.parquet_op.records_to_table(df.to_dict(orient="records"))
+            stats = {"n_duplicate_rows": 0}
+            n_rows = self.parquet_op.write_tables(
+                self.drop_duplicate_rows([table], stats), feature_store_file_path
+            )
+            for part in self.get_feature_store_parts():
+                if part != feature_store_file_path:
+                    os.remove(part)
+            self.commit_part(feature_store_file_path)
+
+            logging.info("Exited the export_dataframe_into_feature_store method of DataIngestion class")
+            return DataIngestionArtifacts(
+                feature_store_path=self.data_ingestion_config.feature_store_dir,
+                n_rows=n_rows,
+                n_duplicate_rows=stats["n_duplicate_rows"],
+                new_part_file_paths=[feature_store_file_path],
+            )
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_test_mask(self, hashes: np.ndarray) -> np.ndarray:
+        """Assign rows to the test split by a stable hash of their split column.
+
+        The assignment only depends on the key, so it does not change as the data grows and
+        every row of a customer lands in the same split.
+        """
+        n_test_buckets = int(self.data_ingestion_config.test_size * DATA_INGESTION_SPLIT_BUCKETS)
+        return hashes % DATA_INGESTION_SPLIT_BUCKETS < n_test_buckets
+
+    def write_part_row_indexes(self, part_file_path: str) -> None:
+        """Write the train and test row index files of one part, reading only its split column."""
+        part = os.path.basename(part_file_path)
+        split_column = self.data_ingestion_config.split_column
+        index_file_paths = [
+            os.path.join(self.data_ingestion_config.train_index_dir, part),
+            os.path.join(self.data_ingestion_config.test_index_dir, part),
+        ]
+        # Underscore names are skipped when an index directory is read, so a partial file never is
+        tmp_file_paths = [
+            os.path.join(os.path.dirname(index_file_path), f"_{part}.tmp") for index_file_path in index_file_paths
+        ]
+        with pq.ParquetWriter(tmp_file_paths[0], ROW_INDEX_SCHEMA) as train_writer, pq.ParquetWriter(
+            tmp_file_paths[1], ROW_INDEX_SCHEMA
+        ) as test_writer:
+            for _, first_row, table in self.parquet_op.iter_row_groups([part_file_path], columns=[split_column]):
+                is_test = self.get_test_mask(
+                    self.parquet_op.get_value_hashes(split_column, table.column(split_column).to_pandas())
+                )
+                rows = np.arange(first_row, first_row + table.num_rows)
+                for writer, split_rows in ((train_writer, rows[~is_test]), (test_writer, rows[is_test])):
+                    writer.write_table(
+                        pa.table({"part": [part] * len(split_rows), "row": split_rows}, schema=ROW_INDEX_SCHEMA)
+                    )
+        for tmp_file_path, index_file_path in zip(tmp_file_paths, index_file_paths):
+            os.replace(tmp_file_path, index_file_path)
+
+    def split_data_as_train_test(self, data_ingestion_artifacts: DataIngestionArtifacts) -> DataIngestionArtifacts:
+        """Keep train and test row index directories with one index file per feature store part.
+
+        Rows are referenced by part and position rather than copied, so the data is not
+        duplicated on disk. The split of a row only depends on its split column, so index
+        files of earlier runs stay valid: only the parts written by this run, or not indexed
+        yet, are read, and files of parts that left the feature store are removed. Use
+        ``ParquetOperation.read_indexed_rows`` with an index directory to load a split.
+        """
+        logging.info("Entered the split_data_as_train_test method of DataIngestion class")
+        try:
+            index_dirs = [self.data_ingestion_config.train_index_dir, self.data_ingestion_config.test_index_dir]
+            parts = {os.path.basename(file_path): file_path for file_path in self.get_feature_store_parts()}
+            for index_dir in index_dirs:
+                os.makedirs(index_dir, exist_ok=True)
+                # Quarantined and orphaned parts, and files of an interrupted run
+                for file_name in os.listdir(index_dir):
+                    if file_name not in parts:
+                        os.remove(os.path.join(index_dir, file_name))
+
+            new_parts = {os.path.basename(file_path) for file_path in data_ingestion_artifacts.new_part_file_paths}
+            for part, part_file_path in parts.items():
+                if part in new_parts or not all(
+                    os.path.exists(os.path.join(index_dir, part)) for index_dir in index_dirs
+                ):
+                    self.write_part_row_indexes(part_file_path)
+
+            n_train_rows, n_test_rows = (
+                sum(pq.ParquetFile(os.path.join(index_dir, part)).metadata.num_rows for part in parts)
+                for index_dir in index_dirs
+            )
+            data_ingestion_artifacts.train_index_dir = self.data_ingestion_config.train_index_dir
+            data_ingestion_artifacts.test_index_dir = self.data_ingestion_config.test_index_dir
+            data_ingestion_artifacts.n_train_rows = n_train_rows
+            data_ingestion_artifacts.n_test_rows = n_test_rows
+
+            logging.info(f"Split feature store into {n_train_rows} train and {n_test_rows} test rows")
+            logging.info("Exited the split_data_as_train_test method of DataIngestion class")
+            return data_ingestion_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def initiate_data_ingestion(self) -> DataIngestionArtifacts:
+        logging.info("Entered the initiate_data_ingestion method of DataIngestion class")
+        try:
+            # Fingerprint before exporting: documents added during the export then show up
+            # as a changed source on the next run instead of being silently cached over
+            fingerprint = self.get_source_fingerprint()
+            if self.data_ingestion_config.use_cache and self.is_feature_store_current(fingerprint):
+                logging.info(f"Feature store is up to date with source fingerprint {fingerprint}")
+                data_ingestion_artifacts = DataIngestionArtifacts(
+                    feature_store_path=self.data_ingestion_config.feature_store_dir,
+                    n_rows=0,
+                    fingerprint=fingerprint,
+                    cache_hit=True,
+                )
+            else:
+                if os.path.exists(self.fingerprint_file_path):
+                    os.remove(self.fingerprint_file_path)
+
+                if self.data_ingestion_config.incremental:
+                    data_ingestion_artifacts = self.export_new_data_into_feature_store()
+                elif self.data_ingestion_config.streaming:
+                    data_ingestion_artifacts = self.export_data_into_feature_store()
+                else:
+                    data_ingestion_artifacts = self.export_dataframe_into_feature_store()
+
+                # Documents left behind the cutoff must not be hidden by a cache hit next run
+                if not self.has_documents_after_cutoff():
+                    self.utils.write_json_file(self.fingerprint_file_path, {"fingerprint": fingerprint})
+                data_ingestion_artifacts.fingerprint = fingerprint
+
+            data_ingestion_artifacts = self.split_data_as_train_test(data_ingestion_artifacts)
+
+            logging.info(f"Data ingestion artifacts: {data_ingestion_artifacts}")
+            logging.info("Exited the initiate_data_ingestion method of DataIngestion class")
+            return data_ingestion_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
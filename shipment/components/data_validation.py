@@ -0,0 +1,822 @@
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from scipy import stats
+
+from shipment.configuration.dictionary_operations import DictionaryOperation
+from shipment.configuration.parquet_operations import PANDAS_TYPES, ParquetOperation
+from shipment.configuration.schema_precheck import SchemaPreCheck
+from shipment.constant import FEATURE_STORE_DICTIONARIES_DIR_NAME, TARGET_COLUMN
+from shipment.entity.artifacts_entity import DataIngestionArtifacts, DataValidationArtifacts
+from shipment.entity.config_entity import DataValidationConfig
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+from shipment.utils.report_utils import ReportUtils
+from shipment.utils.feature_utils import FeatureUtils
+from shipment.utils.sketch_utils import CovarianceAccumulator, HyperLogLog, KLLSketch
+
+
+class DataValidation:
+    def __init__(
+        self, data_ingestion_artifacts: DataIngestionArtifacts, data_validation_config: DataValidationConfig
+    ):
+        self.data_ingestion_artifacts = data_ingestion_artifacts
+        self.data_validation_config = data_validation_config
+        self.utils = MainUtils()
+        self.schema_config = self.utils.read_yaml_file(data_validation_config.schema_file_path)
+        self.parquet_op = ParquetOperation(
+            self.schema_config,
+            DictionaryOperation(
+                os.path.join(data_ingestion_artifacts.feature_store_path, FEATURE_STORE_DICTIONARIES_DIR_NAME)
+            ),
+        )
+        self.ranges = self.schema_config.get("ranges", {})
+        self.allowed_values = self.schema_config.get("allowed_values", {})
+        # Every column has a missing value rule; ones not listed in schema.yaml use the config default
+        max_missing_rates = self.schema_config.get("max_missing_rates", {})
+        self.max_missing_rates = {
+            column: max_missing_rates.get(column, data_validation_config.max_missing_rate)
+            for column in self.schema_config["columns"]
+        }
+        self.drift_numerical_columns = [
+            column for column in self.schema_config["numerical_columns"] if column != TARGET_COLUMN
+        ]
+        self.drift_categorical_columns = self.schema_config["categorical_columns"]
+        self.distinct_count_columns = self.schema_config.get("distinct_count_columns", [])
+        # Features checked for multicollinearity; flags enter as 0/1
+        self.vif_columns = self.drift_numerical_columns + [
+            column for column, column_type in self.schema_config["columns"].items() if column_type == "bool"
+        ]
+        self.report_future: Optional[Future] = None
+        self.schema_precheck = SchemaPreCheck(self.schema_config)
+
+    def validate_file_schemas(self, file_paths: List[str]) -> Dict[str, Dict]:
+        """Footer check of every file; only files with problems are listed."""
+        file_reports = {}
+        for file_path in file_paths:
+            file_report = self.schema_precheck.check_parquet_footer(file_path)
+            if not self.schema_precheck.is_valid(file_report):
+                file_reports[os.path.basename(file_path)] = file_report
+        return file_reports
+
+    def get_empty_report(self) -> Dict:
+        return {
+            "n_rows": 0,
+            "files": {},
+            "ranges": {
+                column: {**bounds, "below_min": 0, "above_max": 0} for column, bounds in self.ranges.items()
+            },
+            "allowed_values": {column: {"n_invalid": 0, "examples": []} for column in self.allowed_values},
+            "missing_values": {
+                column: {"max_rate": max_rate, "n_missing": 0}
+                for column, max_rate in self.max_missing_rates.items()
+            },
+        }
+
+    @staticmethod
+    def iter_column_chunks(file_paths: List[str], column: str):
+        """Yield ``column`` of ``file_paths`` one row group at a time as a pandas series.
+
+        Files are memory-mapped and only the column chunks of ``column`` are decoded, so a
+        worker never receives, or copies, the data of other columns.
+        """
+        for file_path in file_paths:
+            parquet_file = pq.ParquetFile(file_path, memory_map=True)
+            if column not in parquet_file.schema_arrow.names:
+                continue
+            for row_group in range(parquet_file.metadata.num_row_groups):
+                table = parquet_file.read_row_group(row_group, columns=[column])
+                yield table.column(0).to_pandas(types_mapper=PANDAS_TYPES.get)
+
+    @staticmethod
+    def validate_column(
+        file_paths: List[str], column: str, bounds: Dict, allowed: List, max_examples: int
+    ) -> Dict:
+        """Run the missing value, range and allowed value rules of one column over ``file_paths``."""
+        column_report = {"n_missing": 0, "below_min": 0, "above_max": 0, "n_invalid": 0, "examples": []}
+        for series in DataValidation.iter_column_chunks(file_paths, column):
+            column_report["n_missing"] += int(series.isna().sum())
+            if bounds:
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                if "min" in bounds:
+                    column_report["below_min"] += int(np.count_nonzero(values < bounds["min"]))
+                if "max" in bounds:
+                    column_report["above_max"] += int(np.count_nonzero(values > bounds["max"]))
+            if allowed:
+                invalid = series.notna() & ~series.isin(allowed)
+                column_report["n_invalid"] += int(invalid.sum())
+                examples = column_report["examples"]
+                for value in series[invalid].astype(object).unique():
+                    if len(examples) >= max_examples:
+                        break
+                    if value not in examples:
+                        examples.append(value)
+        return column_report
+
+    def map_columns(self, func, tasks: List[Tuple], file_paths: List[str]) -> List:
+        """Apply ``func`` to each per-column task, on a process pool when ``file_paths`` are large.
+
+        Column checks are independent and CPU bound, so processes rather than threads
+        scale them with the number of cores; tasks and results are small, the column data
+        is read by the workers themselves. Workers are spawned, not forked: this also runs
+        on the background report thread, and forking a process with running threads can
+        leave the children deadlocked on locks held by the other threads. Spawned workers
+        import pandas, pyarrow and scipy again, which takes seconds, so files smaller than
+        ``min_parallel_bytes`` are checked inline. They also re-import ``__main__``: a script
+        running the pipeline must do so under ``if __name__ == "__main__":``.
+        """
+        n_workers = min(self.data_validation_config.n_workers, len(tasks))
+        n_bytes = sum(os.path.getsize(file_path) for file_path in file_paths)
+        if n_workers <= 1 or n_bytes < self.data_validation_config.min_parallel_bytes:
+            return [func(*task) for task in tasks]
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=get_context("spawn")) as executor:
+            return list(executor.map(func, *zip(*tasks)))
+
+    def iter_rules(self) -> Iterator[Tuple[str, str, str, float]]:
+        """Yield ``(section, column, counter, max_rate)`` for every rule of a validation report.
+
+        ``max_rate`` is the share of rows allowed to break the rule: the limit of the column
+        for missing values and ``get_max_violation_rate`` for the other rules.
+        """
+        max_violation_rate = self.get_max_violation_rate()
+        for column in self.ranges:
+            yield "ranges", column, "below_min", max_violation_rate
+            yield "ranges", column, "above_max", max_violation_rate
+        for column in self.allowed_values:
+            yield "allowed_values", column, "n_invalid", max_violation_rate
+        for column, max_missing_rate in self.max_missing_rates.items():
+            yield "missing_values", column, "n_missing", max_missing_rate
+
+    def get_max_violation_rate(self) -> float:
+        """Share of rows allowed to break a rule: ``sample_max_violation_rate`` in sample mode,
+        including its escalated full scans, and ``max_violation_rate`` otherwise.
+        """
+        if self.data_validation_config.validation_mode == "sample":
+            return self.data_validation_config.sample_max_violation_rate
+        return self.data_validation_config.max_violation_rate
+
+    def get_validation_status(self, report: Dict) -> bool:
+        """Pass when every file has the expected schema and no rule is broken by more than its
+        ``max_rate`` share of the rows, see ``iter_rules``.
+        """
+        return not report["files"] and all(
+            report[section][column][key] <= max_rate * report["n_rows"]
+            for section, column, key, max_rate in self.iter_rules()
+        )
+
+    def validate_files(self, file_paths: List[str]) -> Dict:
+        """Validate ``file_paths`` with one process pool task per column."""
+        logging.info("Entered the validate_files method of DataValidation class")
+        try:
+            report = self.get_empty_report()
+            report["n_rows"] = sum(pq.ParquetFile(file_path).metadata.num_rows for file_path in file_paths)
+            report["files"] = self.validate_file_schemas(file_paths)
+
+            # Every column has at least its missing value rule
+            rule_columns = self.parquet_op.arrow_schema.names
+            tasks = [
+                (
+                    file_paths,
+                    column,
+                    self.ranges.get(column, {}),
+                    self.allowed_values.get(column, []),
+                    self.data_validation_config.max_examples,
+                )
+                for column in rule_columns
+            ]
+            column_reports = self.map_columns(self.validate_column, tasks, file_paths)
+            for column, column_report in zip(rule_columns, column_reports):
+                report["missing_values"][column]["n_missing"] = column_report["n_missing"]
+                if column in self.ranges:
+                    report["ranges"][column]["below_min"] = column_report["below_min"]
+                    report["ranges"][column]["above_max"] = column_report["above_max"]
+                if column in self.allowed_values:
+                    report["allowed_values"][column]["n_invalid"] = column_report["n_invalid"]
+                    report["allowed_values"][column]["examples"] = column_report["examples"]
+
+            report["validation_status"] = self.get_validation_status(report)
+
+            logging.info("Exited the validate_files method of DataValidation class")
+            return report
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_column_stats(self, column: str, series: pd.Series) -> Dict:
+        """Data quality counts of one column of a chunk; mergeable across chunks with ``merge_column_stats``."""
+        stats = {"n_rows": len(series), "n_missing": int(series.isna().sum())}
+        if column in self.schema_config["numerical_columns"]:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            stats["n_zero"] = int(np.count_nonzero(values == 0))
+            stats["n_negative"] = int(np.count_nonzero(values < 0))
+            stats["min"] = float(values.min()) if len(values) else None
+            stats["max"] = float(values.max()) if len(values) else None
+        elif self.schema_config["columns"][column] == "date":
+            stats["min"] = series.min() if stats["n_missing"] < len(series) else None
+            stats["max"] = series.max() if stats["n_missing"] < len(series) else None
+        if column in self.schema_config["categorical_columns"]:
+            # Low cardinality by definition, so the exact set of values stays small
+            stats["values"] = set(series.dropna().astype(str).unique())
+        return stats
+
+    @staticmethod
+    def merge_column_stats(merged: Dict, stats: Dict) -> None:
+        for key in ("n_rows", "n_missing", "n_zero", "n_negative"):
+            if key in stats:
+                merged[key] += stats[key]
+        for key, pick in (("min", min), ("max", max)):
+            if key in stats:
+                present = [value for value in (merged[key], stats[key]) if value is not None]
+                merged[key] = pick(present) if present else None
+        if "values" in stats:
+            merged["values"] |= stats["values"]
+
+    def get_stratum_keys(self, df: pd.DataFrame) -> np.ndarray:
+        """One uint64 key per row identifying its combination of ``validation_strata`` values."""
+        strata = self.schema_config.get("validation_strata", [])
+        if not strata:
+            return np.zeros(len(df), dtype=np.uint64)
+        return pd.util.hash_pandas_object(df[strata], index=False).to_numpy()
+
+    def get_sample_size(self, n_rows: int) -> int:
+        """Rows needed to estimate a rate within ``sample_error`` at ``sample_confidence``.
+
+        Uses the worst case rate of 0.5 and the finite population correction.
+        """
+        z = stats.norm.ppf(0.5 + self.data_validation_config.sample_confidence / 2)
+        n_infinite = z**2 * 0.25 / self.data_validation_config.sample_error**2
+        return int(np.ceil(n_infinite / (1 + (n_infinite - 1) / max(n_rows, 1))))
+
+    def get_rule_violations(self, df: pd.DataFrame) -> Dict[Tuple[str, str, str], np.ndarray]:
+        """Boolean violation mask of every rule, keyed by ``(section, column, counter)``."""
+        violations = {}
+        for column, bounds in self.ranges.items():
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            violations[("ranges", column, "below_min")] = values < bounds.get("min", -np.inf)
+            violations[("ranges", column, "above_max")] = values > bounds.get("max", np.inf)
+        for column, allowed in self.allowed_values.items():
+            violations[("allowed_values", column, "n_invalid")] = (
+                df[column].notna() & ~df[column].isin(allowed)
+            ).to_numpy()
+        for column in self.max_missing_rates:
+            violations[("missing_values", column, "n_missing")] = df[column].isna().to_numpy()
+        return violations
+
+    def get_rate_interval(
+        self, population: np.ndarray, sampled: np.ndarray, violations: np.ndarray, fpc: float
+    ) -> Tuple[float, float, float]:
+        """Stratified estimate of a violation rate from sampled row groups, with its Wilson score interval.
+
+        ``sampled`` and ``violations`` count the rows of every stratum (columns) in every sampled
+        row group (rows), and strata are weighted by their ``population``. Rows of a row group
+        come from one batch and are not independent, so the variance is that of the row group
+        totals around the estimate, scaled by the finite population correction ``fpc``. The
+        interval uses the effective sample size implied by that variance, so it stays
+        informative at zero violations.
+        """
+        z = stats.norm.ppf(0.5 + self.data_validation_config.sample_confidence / 2)
+        n_sampled = sampled.sum(axis=0)
+        present = n_sampled > 0
+        weights = population[present] / population[present].sum()
+        stratum_rates = violations[:, present].sum(axis=0) / n_sampled[present]
+        rate = float(np.sum(weights * stratum_rates))
+        # Linearized contribution of every row group to the estimate
+        residuals = ((violations[:, present] - sampled[:, present] * stratum_rates) / n_sampled[present]) @ weights
+        n_groups = len(sampled)
+        variance = fpc * n_groups / (n_groups - 1) * float(np.sum(residuals**2)) if n_groups > 1 else 0.0
+        n_effective = rate * (1 - rate) / variance if variance > 0 else float(n_sampled.sum())
+        center = (rate + z**2 / (2 * n_effective)) / (1 + z**2 / n_effective)
+        half_width = (
+            z * np.sqrt(rate * (1 - rate) / n_effective + z**2 / (4 * n_effective**2)) / (1 + z**2 / n_effective)
+        )
+        return rate, float(max(0.0, center - half_width)), float(min(1.0, center + half_width))
+
+    def validate_sample(self, file_paths: List[str]) -> Dict:
+        """Validate a sample of whole row groups of ``file_paths``, stratified by ``validation_strata``.
+
+        A first pass reads only the strata columns to count the rows of every stratum in every
+        row group. Row groups are then drawn in random order, skipping those without rows of a
+        stratum still short of its proportional share of ``get_sample_size`` rows, until every
+        stratum has its share and at least ``sample_min_row_groups`` were drawn. Only drawn row
+        groups are decoded. The report has the layout of ``validate_files``, with sample counts
+        and a confidence interval for the rate of each rule. ``validation_status`` is None when
+        an interval straddles the limit of its rule, i.e. the sample cannot decide.
+        """
+        logging.info("Entered the validate_sample method of DataValidation class")
+        try:
+            report = self.get_empty_report()
+            report["files"] = self.validate_file_schemas(file_paths)
+
+            strata = self.schema_config.get("validation_strata", [])
+            row_groups, group_sizes, stratum_keys = [], [], []
+            for file_path in file_paths:
+                metadata = pq.ParquetFile(file_path).metadata
+                for row_group in range(metadata.num_row_groups):
+                    row_groups.append((file_path, row_group))
+                    group_sizes.append(metadata.row_group(row_group).num_rows)
+                stratum_df = self.parquet_op.read_table(file_path, columns=strata).to_pandas()
+                stratum_keys.append(self.get_stratum_keys(stratum_df))
+            # Stratum of every row, in file and row order
+            positions, strata_keys = pd.factorize(np.concatenate(stratum_keys))
+            n_strata = len(strata_keys)
+            group_starts = np.concatenate([[0], np.cumsum(group_sizes)])
+            group_ids = np.repeat(np.arange(len(row_groups)), group_sizes)
+            group_counts = np.bincount(
+                group_ids * n_strata + positions, minlength=len(row_groups) * n_strata
+            ).reshape(len(row_groups), n_strata)
+            population_counts = group_counts.sum(axis=0)
+            n_rows = int(population_counts.sum())
+            # At least two rows per stratum, so small strata still get a variance estimate
+            quotas = np.minimum(
+                population_counts,
+                np.maximum(2, np.ceil(self.get_sample_size(n_rows) * population_counts / max(n_rows, 1))),
+            )
+
+            drawn = []
+            drawn_counts = np.zeros(n_strata, dtype=np.int64)
+            for group in np.random.default_rng(0).permutation(len(row_groups)).tolist():
+                if len(drawn) >= self.data_validation_config.sample_min_row_groups:
+                    short = drawn_counts < quotas
+                    if not short.any():
+                        break
+                    if not group_counts[group, short].any():
+                        continue
+                drawn.append(group)
+                drawn_counts += group_counts[group]
+            drawn.sort()
+
+            sampled_counts = group_counts[drawn]
+            violation_counts = {}
+            # Every column has at least its missing value rule
+            rule_columns = self.parquet_op.arrow_schema.names
+            for index, group in enumerate(drawn):
+                file_path, row_group = row_groups[group]
+                table = self.parquet_op.read_row_group(file_path, row_group, columns=rule_columns)
+                df = table.to_pandas(types_mapper=PANDAS_TYPES.get)
+                group_positions = positions[group_starts[group] : group_starts[group + 1]]
+                for rule, violated in self.get_rule_violations(df).items():
+                    if not violated.any():
+                        continue
+                    rule_counts = violation_counts.setdefault(rule, np.zeros((len(drawn), n_strata)))
+                    rule_counts[index] = np.bincount(group_positions[violated], minlength=n_strata)
+                    if rule[0] == "allowed_values":
+                        examples = report["allowed_values"][rule[1]]["examples"]
+                        for value in df.loc[violated, rule[1]].astype(object).unique():
+                            if len(examples) < self.data_validation_config.max_examples and value not in examples:
+                                examples.append(value)
+
+            fpc = 1 - len(drawn) / len(row_groups)
+            decided_pass, decided_fail = not report["files"], bool(report["files"])
+            for section, column, key, max_rate in self.iter_rules():
+                rule_counts = violation_counts.get((section, column, key), np.zeros(sampled_counts.shape))
+                counts = report[section][column]
+                counts[key] = int(rule_counts.sum())
+                rate, lower, upper = self.get_rate_interval(population_counts, sampled_counts, rule_counts, fpc)
+                counts[f"{key}_rate"] = {"estimate": rate, "lower": lower, "upper": upper}
+                decided_pass &= upper <= max_rate
+                decided_fail |= lower > max_rate
+
+            report["n_rows"] = int(sampled_counts.sum())
+            report["sample"] = {
+                "n_population_rows": n_rows,
+                "n_row_groups": len(drawn),
+                "n_population_row_groups": len(row_groups),
+                "n_strata": n_strata,
+                "confidence": self.data_validation_config.sample_confidence,
+                "error": self.data_validation_config.sample_error,
+            }
+            report["validation_status"] = True if decided_pass else False if decided_fail else None
+
+            logging.info("Exited the validate_sample method of DataValidation class")
+            return report
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def validate(self, file_paths: List[str]) -> Dict:
+        """Validate ``file_paths`` in the configured mode.
+
+        Files whose footer does not match the schema, or shows a column without any value,
+        fail validation right away, before any data is read. In ``sample`` mode a full scan
+        only runs when the sample cannot decide, or when the files have no more than
+        ``sample_min_row_groups`` row groups; an escalated report keeps the sample summary
+        under ``escalated_from_sample``.
+        Sample mode needs a nonzero ``sample_max_violation_rate`` and missing rate limits:
+        an upper confidence bound is never 0, so a zero tolerance would escalate every clean
+        batch.
+        """
+        if self.data_validation_config.validation_mode == "sample" and any(
+            max_rate <= 0 for *_, max_rate in self.iter_rules()
+        ):
+            raise ValueError(
+                "Sample validation mode needs sample_max_violation_rate and max_missing_rates > 0, otherwise "
+                "every batch escalates to a full scan; use validation_mode='full' for a zero tolerance"
+            )
+
+        file_reports = self.validate_file_schemas(file_paths)
+        if file_reports:
+            logging.info(f"Schema pre-check failed for {len(file_reports)} files, skipping the data scan")
+            report = self.get_empty_report()
+            report["files"] = file_reports
+            report["validation_status"] = False
+            return report
+
+        if self.data_validation_config.validation_mode != "sample":
+            return self.validate_files(file_paths)
+        # A sample of whole row groups would read all of them anyway
+        n_row_groups = len(self.parquet_op.get_row_groups(file_paths))
+        if n_row_groups <= self.data_validation_config.sample_min_row_groups:
+            return self.validate_files(file_paths)
+
+        report = self.validate_sample(file_paths)
+        if report["validation_status"] is None:
+            logging.info("Sampled violation rates are too close to the threshold, escalating to a full scan")
+            sample_report = report
+            report = self.validate_files(file_paths)
+            report["escalated_from_sample"] = sample_report
+        return report
+
+    def sketch_row_group(self, task: Tuple[int, Tuple[str, int]]) -> Dict:
+        """Data quality counts of every column, quantile sketches of the numerical columns and
+        distinct count sketches of the numerical and high-cardinality columns of one row group.
+        """
+        seed, (file_path, row_group) = task
+        table = self.parquet_op.read_row_group(file_path, row_group, columns=self.parquet_op.arrow_schema.names)
+        # ``encoded`` columns stay codes: only their missing values and distinct counts are needed
+        df = table.to_pandas(types_mapper=PANDAS_TYPES.get)
+
+        sketches = {
+            "columns": {column: self.get_column_stats(column, df[column]) for column in df.columns},
+            "numerical": {},
+            "distinct": {},
+            "covariance": CovarianceAccumulator(len(self.vif_columns)),
+        }
+        sketches["covariance"].update(
+            np.column_stack(
+                [df[column].to_numpy(dtype=np.float64, na_value=np.nan) for column in self.vif_columns]
+            )
+        )
+        for column in self.schema_config["numerical_columns"]:
+            sketch = KLLSketch(k=self.data_validation_config.kll_k, seed=seed)
+            sketch.update(df[column].to_numpy(dtype=np.float64, na_value=np.nan))
+            sketches["numerical"][column] = sketch
+        for column in self.schema_config["numerical_columns"] + self.distinct_count_columns:
+            sketch = HyperLogLog(precision=self.data_validation_config.hll_precision)
+            values = df[column].dropna()
+            if column in self.parquet_op.encoded_columns:
+                # Codes map one-to-one to values, so hashing them counts the same distinct values
+                sketch.update(pd.util.hash_array(values.to_numpy(dtype=np.int64)))
+            else:
+                sketch.update(pd.util.hash_pandas_object(values, index=False).to_numpy())
+            sketches["distinct"][column] = sketch
+        return sketches
+
+    def build_sketches(self, file_paths: List[str]) -> Dict:
+        """Profile and sketch every row group of ``file_paths`` on a worker pool and merge the results.
+
+        A single scan yields all of it. Counts and sketches have a fixed size, so memory does
+        not grow with the data and the row groups never need to be sorted or held together.
+        """
+        logging.info("Entered the build_sketches method of DataValidation class")
+        try:
+            tasks = list(enumerate(self.parquet_op.get_row_groups(file_paths)))
+            merged = None
+            with ThreadPoolExecutor(max_workers=self.data_validation_config.n_workers) as executor:
+                for sketches in executor.map(self.sketch_row_group, tasks):
+                    if merged is None:
+                        merged = sketches
+                        continue
+                    for column, stats in sketches["columns"].items():
+                        self.merge_column_stats(merged["columns"][column], stats)
+                    merged["covariance"].merge(sketches["covariance"])
+                    for kind in ("numerical", "distinct"):
+                        for column, sketch in sketches[kind].items():
+                            merged[kind][column].merge(sketch)
+
+            if merged is None:
+                empty = pd.DataFrame(
+                    {column: pd.Series(dtype=object) for column in self.parquet_op.arrow_schema.names}
+                )
+                merged = {
+                    "columns": {column: self.get_column_stats(column, empty[column]) for column in empty.columns},
+                    "numerical": {
+                        column: KLLSketch(k=self.data_validation_config.kll_k)
+                        for column in self.schema_config["numerical_columns"]
+                    },
+                    "distinct": {
+                        column: HyperLogLog(precision=self.data_validation_config.hll_precision)
+                        for column in self.schema_config["numerical_columns"] + self.distinct_count_columns
+                    },
+                    "covariance": CovarianceAccumulator(len(self.vif_columns)),
+                }
+
+            logging.info("Exited the build_sketches method of DataValidation class")
+            return merged
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_profile(self, sketches: Dict) -> Dict:
+        """Per-column data quality profile: missing, zero and negative counts and rates, min/max,
+        cardinality (exact for categorical columns, approximate otherwise) and quantiles, plus
+        the variance inflation factors of the features and those above ``vif_threshold``.
+        """
+        profile = {"n_rows": 0, "columns": {}}
+        for column, stats in sketches["columns"].items():
+            n_rows = stats["n_rows"]
+            profile["n_rows"] = n_rows
+            column_profile = {
+                "n_missing": stats["n_missing"],
+                "null_rate": stats["n_missing"] / n_rows if n_rows else 0.0,
+            }
+            if "n_zero" in stats:
+                n_present = n_rows - stats["n_missing"]
+                column_profile["n_zero"] = stats["n_zero"]
+                column_profile["zero_rate"] = stats["n_zero"] / n_present if n_present else 0.0
+                column_profile["n_negative"] = stats["n_negative"]
+            if "min" in stats:
+                column_profile["min"] = stats["min"]
+                column_profile["max"] = stats["max"]
+            if "values" in stats:
+                column_profile["n_distinct"] = len(stats["values"])
+            elif column in sketches["distinct"]:
+                column_profile["n_distinct"] = round(sketches["distinct"][column].get_count())
+            if column in sketches["numerical"]:
+                column_profile.update(sketches["numerical"][column].to_dict(self.data_validation_config.quantiles))
+            profile["columns"][column] = column_profile
+        vifs = FeatureUtils.get_variance_inflation_factors(
+            sketches["covariance"].get_correlation(), self.vif_columns
+        )
+        profile["vif"] = vifs
+        vif_threshold = self.data_validation_config.vif_threshold
+        profile["multicollinear_columns"] = [
+            column for column, vif in vifs.items() if vif is not None and vif > vif_threshold
+        ]
+        return profile
+
+    def get_bin_edges(self, sketches: Dict) -> Dict[str, Dict]:
+        """Inner bin edges at the sketched deciles of each numerical drift column.
+
+        Quantile edges keep every bin populated even for heavy tailed columns such as Weight.
+        """
+        bin_edges = {}
+        fractions = np.linspace(0, 1, self.data_validation_config.n_bins + 1)[1:-1]
+        for column in self.drift_numerical_columns:
+            sketch = sketches["numerical"][column]
+            if sketch.n == 0:
+                bin_edges[column] = {"edges": [], "quantiles": {}}
+                continue
+            bin_edges[column] = {
+                "edges": np.unique(sketch.get_quantiles(fractions)).tolist(),
+                "quantiles": sketch.to_dict(self.data_validation_config.quantiles)["quantiles"],
+            }
+        return bin_edges
+
+    @staticmethod
+    def count_column(file_paths: List[str], column: str, edges: List[float] = None) -> Dict:
+        """Bin counts of a numerical column over ``edges``, or category counts when ``edges`` is None."""
+        if edges is not None:
+            column_counts = {"counts": np.zeros(len(edges) + 1, dtype=np.int64), "n_missing": 0}
+        else:
+            column_counts = {"counts": {}, "n_missing": 0}
+        for series in DataValidation.iter_column_chunks(file_paths, column):
+            if edges is not None:
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                present = values[~np.isnan(values)]
+                bins = np.searchsorted(np.asarray(edges), present, side="right")
+                column_counts["counts"] += np.bincount(bins, minlength=len(edges) + 1)
+                column_counts["n_missing"] += int(len(values) - len(present))
+            else:
+                for value, count in series.value_counts(dropna=True).items():
+                    column_counts["counts"][str(value)] = column_counts["counts"].get(str(value), 0) + int(count)
+                column_counts["n_missing"] += int(series.isna().sum())
+        if edges is not None:
+            column_counts["counts"] = column_counts["counts"].tolist()
+        return column_counts
+
+    def count_files(self, file_paths: List[str], summary: Dict) -> Dict:
+        """Bin and category counts of ``file_paths`` using the bins of ``summary``, one task per column."""
+        tasks = [(file_paths, column, summary["numerical"][column]["edges"]) for column in summary["numerical"]]
+        tasks += [(file_paths, column, None) for column in summary["categorical"]]
+        results = iter(self.map_columns(self.count_column, tasks, file_paths))
+        return {
+            "n_rows": sum(pq.ParquetFile(file_path).metadata.num_rows for file_path in file_paths),
+            "numerical": {column: next(results) for column in summary["numerical"]},
+            "categorical": {column: next(results) for column in summary["categorical"]},
+        }
+
+    def build_reference_summary(self, file_paths: List[str]) -> Dict:
+        """Compact reference of the training data to compare later batches against.
+
+        Holds binned histograms and quantiles of the numerical columns, frequency tables of
+        the categorical ones and the sketch based profile; its size does not depend on the
+        number of rows.
+        """
+        logging.info("Entered the build_reference_summary method of DataValidation class")
+        try:
+            sketches = self.build_sketches(file_paths)
+            summary = {
+                "profile": self.get_profile(sketches),
+                "numerical": self.get_bin_edges(sketches),
+                "categorical": {column: {} for column in self.drift_categorical_columns},
+            }
+            counts = self.count_files(file_paths, summary)
+            for column, column_counts in counts["numerical"].items():
+                summary["numerical"][column].update(column_counts)
+            for column, column_counts in counts["categorical"].items():
+                summary["categorical"][column].update(column_counts)
+            summary["n_rows"] = counts["n_rows"]
+
+            logging.info("Exited the build_reference_summary method of DataValidation class")
+            return summary
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    @staticmethod
+    def get_psi(expected: np.ndarray, actual: np.ndarray) -> float:
+        """Population stability index between two count vectors over the same bins."""
+        expected = np.clip(expected / max(expected.sum(), 1), 1e-6, None)
+        actual = np.clip(actual / max(actual.sum(), 1), 1e-6, None)
+        return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+    def compare_with_reference(self, summary: Dict, counts: Dict) -> Dict:
+        """Compare the counts of a batch with the reference summary, column by column.
+
+        Numerical columns use PSI and a two-sample KS test on the binned distributions,
+        categorical ones PSI and a chi-square goodness of fit test. Missing values count as a
+        bin of their own, the last one of numerical columns, so a column that goes missing
+        drifts like any other shift. A column drifts when the shift is both significant
+        (p-value below the threshold) and material (PSI above it), so large batches do not
+        flag negligible shifts.
+        """
+        psi_threshold = self.data_validation_config.psi_threshold
+        p_value_threshold = self.data_validation_config.p_value_threshold
+        report = {"n_reference_rows": summary["n_rows"], "n_batch_rows": counts["n_rows"], "columns": {}}
+
+        for column, column_summary in summary["numerical"].items():
+            column_counts = counts["numerical"][column]
+            expected = np.asarray(column_summary["counts"] + [column_summary["n_missing"]], dtype=np.float64)
+            actual = np.asarray(column_counts["counts"] + [column_counts["n_missing"]], dtype=np.float64)
+            n_expected, n_actual = expected.sum(), actual.sum()
+            if n_expected == 0 or n_actual == 0:
+                continue
+            ks_statistic = float(np.max(np.abs(np.cumsum(expected) / n_expected - np.cumsum(actual) / n_actual)))
+            n_effective = n_expected * n_actual / (n_expected + n_actual)
+            p_value = float(stats.kstwobign.sf(np.sqrt(n_effective) * ks_statistic))
+            psi = self.get_psi(expected, actual)
+            edges = [f"{edge:.4g}" for edge in column_summary["edges"]]
+            report["columns"][column] = {
+                "psi": psi,
+                "ks_statistic": ks_statistic,
+                "p_value": p_value,
+                "drift": bool(psi > psi_threshold and p_value < p_value_threshold),
+                "bins": [f"< {edges[0]}" if edges else "all"]
+                + [f"{low} - {high}" for low, high in zip(edges, edges[1:])]
+                + ([f">= {edges[-1]}"] if edges else [])
+                + ["missing"],
+                "reference_counts": expected.tolist(),
+                "batch_counts": actual.tolist(),
+            }
+
+        for column, column_summary in summary["categorical"].items():
+            column_counts = counts["categorical"][column]
+            categories = sorted(set(column_summary["counts"]) | set(column_counts["counts"]))
+            expected = np.array(
+                [column_summary["counts"].get(value, 0) for value in categories] + [column_summary["n_missing"]],
+                dtype=np.float64,
+            )
+            actual = np.array(
+                [column_counts["counts"].get(value, 0) for value in categories] + [column_counts["n_missing"]],
+                dtype=np.float64,
+            )
+            if expected.sum() == 0 or actual.sum() == 0:
+                continue
+            expected_counts = np.clip(expected / expected.sum(), 1e-6, None) * actual.sum()
+            chi2_statistic = float(np.sum((actual - expected_counts) ** 2 / expected_counts))
+            p_value = float(stats.chi2.sf(chi2_statistic, df=max(np.count_nonzero(expected + actual) - 1, 1)))
+            psi = self.get_psi(expected, actual)
+            report["columns"][column] = {
+                "psi": psi,
+                "chi2_statistic": chi2_statistic,
+                "p_value": p_value,
+                "drift": bool(psi > psi_threshold and p_value < p_value_threshold),
+                "bins": categories + ["missing"],
+                "reference_counts": expected.tolist(),
+                "batch_counts": actual.tolist(),
+            }
+
+        report["drift_status"] = any(column_report["drift"] for column_report in report["columns"].values())
+        return report
+
+    def detect_drift(self, summary: Dict, file_paths: List[str]) -> Dict:
+        """Compare ``file_paths`` with the reference; reads only the new batch."""
+        logging.info("Entered the detect_drift method of DataValidation class")
+        try:
+            report = self.compare_with_reference(summary, self.count_files(file_paths, summary))
+
+            logging.info("Exited the detect_drift method of DataValidation class")
+            return report
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def write_detailed_reports(
+        self, latest_summary: Optional[Dict], report: Dict, drift_report: Optional[Dict]
+    ) -> None:
+        """Rebuild the reference summary and profile when the feature store changed, then render
+        the HTML report. This is the slow part of validation; it does not affect the pass/fail
+        decision, so it can run in the background. The rebuilt summary is only promoted to the
+        drift reference when validation passed.
+        """
+        logging.info("Entered the write_detailed_reports method of DataValidation class")
+        try:
+            # The reference only has to be rebuilt when the feature store changed
+            fingerprint = self.data_ingestion_artifacts.fingerprint
+            if latest_summary is not None and fingerprint and latest_summary.get("fingerprint") == fingerprint:
+                summary = latest_summary
+            else:
+                summary = self.build_reference_summary(
+                    self.parquet_op.get_part_file_paths(self.data_ingestion_artifacts.feature_store_path)
+                )
+                summary["fingerprint"] = fingerprint
+                # Only data that passed validation becomes the reference of later drift checks
+                if report["validation_status"]:
+                    self.utils.write_json_file(
+                        self.data_validation_config.latest_reference_summary_file_path, summary
+                    )
+            self.utils.write_json_file(self.data_validation_config.reference_summary_file_path, summary)
+            self.utils.write_json_file(self.data_validation_config.profile_file_path, summary["profile"])
+
+            self.utils.write_text_file(
+                self.data_validation_config.html_report_file_path,
+                ReportUtils().render_validation_report(report, drift_report, summary["profile"]),
+            )
+
+            logging.info("Exited the write_detailed_reports method of DataValidation class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def wait_for_reports(self) -> None:
+        """Block until the background reports are written; re-raises their failure, if any."""
+        if self.report_future is not None:
+            self.report_future.result()
+
+    def initiate_data_validation(self) -> DataValidationArtifacts:
+        """Decide pass/fail and drift, then hand the slow reports to a background thread.
+
+        The returned artifacts already carry the paths of the background reports; call
+        ``wait_for_reports`` before reading them.
+        """
+        logging.info("Entered the initiate_data_validation method of DataValidation class")
+        try:
+            # Only the batch just ingested is checked, so the cost of the gate follows the batch size
+            report = self.validate(self.data_ingestion_artifacts.new_part_file_paths)
+            self.utils.write_json_file(self.data_validation_config.report_file_path, report)
+
+            data_validation_artifacts = DataValidationArtifacts(
+                validation_status=report["validation_status"],
+                report_file_path=self.data_validation_config.report_file_path,
+                reference_summary_file_path=self.data_validation_config.reference_summary_file_path,
+                profile_file_path=self.data_validation_config.profile_file_path,
+                html_report_file_path=self.data_validation_config.html_report_file_path,
+            )
+
+            latest_reference_summary_file_path = self.data_validation_config.latest_reference_summary_file_path
+            latest_summary = None
+            if os.path.exists(latest_reference_summary_file_path):
+                latest_summary = self.utils.read_json_file(latest_reference_summary_file_path)
+
+            drift_report = None
+            if latest_summary is not None and self.data_ingestion_artifacts.new_part_file_paths:
+                drift_report_file_path = self.data_validation_config.drift_report_file_path
+                drift_report = self.detect_drift(latest_summary, self.data_ingestion_artifacts.new_part_file_paths)
+                self.utils.write_json_file(drift_report_file_path, drift_report)
+                data_validation_artifacts.drift_status = drift_report["drift_status"]
+                data_validation_artifacts.drift_report_file_path = drift_report_file_path
+
+            if self.data_validation_config.background_reports:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="validation-reports")
+                self.report_future = executor.submit(
+                    self.write_detailed_reports, latest_summary, report, drift_report
+                )
+                # The thread still runs the task to completion, also when nobody waits for it
+                executor.shutdown(wait=False)
+            else:
+                self.write_detailed_reports(latest_summary, report, drift_report)
+
+            logging.info(f"Data validation artifacts: {data_validation_artifacts}")
+            logging.info("Exited the initiate_data_validation method of DataValidation class")
+            return data_validation_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
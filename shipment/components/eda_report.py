@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from shipment.configuration.parquet_operations import PANDAS_TYPES, ParquetOperation
+from shipment.constant import FEATURE_STORE_FINGERPRINT_FILE_NAME, TARGET_COLUMN
+from shipment.entity.artifacts_entity import EDAReportArtifacts
+from shipment.entity.config_entity import EDAReportConfig
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+from shipment.utils.sketch_utils import KLLSketch
+
+# Group keys derived from the EDA date column
+DATE_PARTS = ("year", "month")
+
+
+class EDAReport:
+    """Target statistics per group for every grouping of the EDA notebook, in one scan.
+
+    Counts and means are exact; medians come from a KLL sketch per group, so memory does
+    not grow with the data. Reports are cached by feature store fingerprint.
+    """
+
+    def __init__(self, eda_report_config: EDAReportConfig):
+        self.eda_report_config = eda_report_config
+        self.utils = MainUtils()
+        self.schema_config = self.utils.read_yaml_file(eda_report_config.schema_file_path)
+        self.parquet_op = ParquetOperation(self.schema_config)
+        self.date_column = self.schema_config["eda_report"]["date_column"]
+        self.group_by: List[Tuple[str, ...]] = [
+            tuple(grouping) for grouping in self.schema_config["eda_report"]["group_by"]
+        ]
+
+    def get_fingerprint(self) -> str:
+        """Key of the report cache: the feature store contents plus the report settings.
+
+        Uses the source fingerprint recorded by data ingestion, or the names, sizes and
+        modification times of the parts when there is none.
+        """
+        fingerprint_file_path = os.path.join(
+            self.eda_report_config.feature_store_dir, FEATURE_STORE_FINGERPRINT_FILE_NAME
+        )
+        if os.path.exists(fingerprint_file_path):
+            data_fingerprint = self.utils.read_json_file(fingerprint_file_path).get("fingerprint")
+        else:
+            data_fingerprint = [
+                (os.path.basename(part), os.path.getsize(part), os.path.getmtime(part))
+                for part in self.parquet_op.get_part_file_paths(self.eda_report_config.feature_store_dir)
+            ]
+        key = {
+            "data": data_fingerprint,
+            "eda_report": self.schema_config["eda_report"],
+            "target": TARGET_COLUMN,
+            "kll_k": self.eda_report_config.kll_k,
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def to_json_value(value):
+        if pd.isna(value):
+            return None
+        return value.item() if hasattr(value, "item") else value
+
+    def update_group_stats(self, df: pd.DataFrame, group_stats: Dict[Tuple[str, ...], Dict]) -> None:
+        """Add the target values of ``df`` to the per-group counters of every grouping."""
+        for grouping in self.group_by:
+            stats = group_stats[grouping]
+            for key, values in df.groupby(list(grouping), observed=True, dropna=False)[TARGET_COLUMN]:
+                values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+                values = values[~np.isnan(values)]
+                if key not in stats:
+                    sketch = KLLSketch(k=self.eda_report_config.kll_k, seed=0)
+                    stats[key] = {"count": 0, "sum": 0.0, "sketch": sketch}
+                stats[key]["count"] += len(values)
+                stats[key]["sum"] += float(values.sum())
+                stats[key]["sketch"].update(values)
+
+    def build_report(self) -> Dict:
+        logging.info("Entered the build_report method of EDAReport class")
+        try:
+            columns = {column for grouping in self.group_by for column in grouping if column not in DATE_PARTS}
+            columns = sorted(columns | {self.date_column, TARGET_COLUMN})
+            group_stats = {grouping: {} for grouping in self.group_by}
+            n_rows = 0
+            for _, _, table in self.parquet_op.iter_row_groups(
+                self.parquet_op.get_part_file_paths(self.eda_report_config.feature_store_dir), columns=columns
+            ):
+                df = table.to_pandas(types_mapper=PANDAS_TYPES.get)
+                dates = df[self.date_column].dt
+                df["year"], df["month"] = dates.year.astype("Int16"), dates.month.astype("Int8")
+                self.update_group_stats(df, group_stats)
+                n_rows += len(df)
+
+            report = {"target": TARGET_COLUMN, "n_rows": n_rows, "groups": {}}
+            for grouping, stats in group_stats.items():
+                rows = []
+                for key, key_stats in stats.items():
+                    key = key if isinstance(key, tuple) else (key,)
+                    row = {column: self.to_json_value(value) for column, value in zip(grouping, key)}
+                    row["count"] = key_stats["count"]
+                    row["mean"] = key_stats["sum"] / key_stats["count"] if key_stats["count"] else None
+                    row["median"] = key_stats["sketch"].get_quantiles([0.5])[0] if key_stats["count"] else None
+                    rows.append(row)
+                rows.sort(key=lambda row: [(row[column] is None, str(row[column])) for column in grouping])
+                report["groups"][", ".join(grouping)] = rows
+
+            logging.info("Exited the build_report method of EDAReport class")
+            return report
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def initiate_eda_report(self) -> EDAReportArtifacts:
+        logging.info("Entered the initiate_eda_report method of EDAReport class")
+        try:
+            fingerprint = self.get_fingerprint()
+            cache_file_path = os.path.join(self.eda_report_config.cache_dir, f"{fingerprint}.json")
+            cache_hit = self.eda_report_config.use_cache and os.path.exists(cache_file_path)
+            if cache_hit:
+                logging.info(f"Reusing the EDA report cached for fingerprint {fingerprint}")
+                report = self.utils.read_json_file(cache_file_path)
+            else:
+                report = self.build_report()
+                report["fingerprint"] = fingerprint
+                self.utils.write_json_file(cache_file_path, report)
+            self.utils.write_json_file(self.eda_report_config.report_file_path, report)
+
+            eda_report_artifacts = EDAReportArtifacts(
+                report_file_path=self.eda_report_config.report_file_path,
+                fingerprint=fingerprint,
+                cache_hit=cache_hit,
+            )
+
+            logging.info(f"EDA report artifacts: {eda_report_artifacts}")
+            logging.info("Exited the initiate_eda_report method of EDAReport class")
+            return eda_report_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+
+if __name__ == "__main__":
+    artifacts = EDAReport(EDAReportConfig()).initiate_eda_report()
+    print(f"EDA report written to {artifacts.report_file_path} (cache hit: {artifacts.cache_hit})")
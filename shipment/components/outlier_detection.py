@@ -0,0 +1,129 @@
+import os
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+from shipment.configuration.dictionary_operations import DictionaryOperation
+from shipment.configuration.parquet_operations import ParquetOperation
+from shipment.constant import FEATURE_STORE_DICTIONARIES_DIR_NAME
+from shipment.entity.artifacts_entity import DataIngestionArtifacts, OutlierDetectionArtifacts
+from shipment.entity.config_entity import OutlierDetectionConfig
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+from shipment.utils.sketch_utils import KLLSketch
+
+# Scales the MAD to the standard deviation of a normal distribution
+MAD_SCALE = 1.4826
+
+
+class OutlierDetection:
+    def __init__(
+        self, data_ingestion_artifacts: DataIngestionArtifacts, outlier_detection_config: OutlierDetectionConfig
+    ):
+        self.data_ingestion_artifacts = data_ingestion_artifacts
+        self.outlier_detection_config = outlier_detection_config
+        self.utils = MainUtils()
+        self.schema_config = self.utils.read_yaml_file(outlier_detection_config.schema_file_path)
+        self.parquet_op = ParquetOperation(
+            self.schema_config,
+            DictionaryOperation(
+                os.path.join(data_ingestion_artifacts.feature_store_path, FEATURE_STORE_DICTIONARIES_DIR_NAME)
+            ),
+        )
+        self.outlier_columns = self.schema_config.get("outlier_columns", [])
+
+    def iter_train_values(self, columns: List[str]):
+        return self.parquet_op.iter_indexed_values(
+            self.data_ingestion_artifacts.feature_store_path,
+            self.data_ingestion_artifacts.train_index_dir,
+            columns,
+        )
+
+    def sketch_columns(self, offsets: Dict[str, float] = None) -> Dict[str, KLLSketch]:
+        """Quantile sketches of the outlier columns, or of their absolute deviations from ``offsets``."""
+        sketches = {
+            column: KLLSketch(k=self.outlier_detection_config.kll_k, seed=0) for column in self.outlier_columns
+        }
+        for chunk in self.iter_train_values(self.outlier_columns):
+            for column, values in chunk.items():
+                if offsets is not None:
+                    values = np.abs(values - offsets[column])
+                sketches[column].update(values)
+        return sketches
+
+    def get_bounds(self) -> Dict[str, Dict]:
+        """Robust bounds of the outlier columns from streaming quantile sketches.
+
+        IQR bounds need a single pass over the training rows. MAD bounds need a second one,
+        since the deviations are taken from the median of the first.
+        """
+        logging.info("Entered the get_bounds method of OutlierDetection class")
+        try:
+            method = self.outlier_detection_config.method
+            sketches = self.sketch_columns()
+            bounds = {}
+            if method == "iqr":
+                multiplier = self.outlier_detection_config.iqr_multiplier
+                for column, sketch in sketches.items():
+                    q1, q3 = sketch.get_quantiles([0.25, 0.75])
+                    bounds[column] = {
+                        "q1": q1,
+                        "q3": q3,
+                        "lower": q1 - multiplier * (q3 - q1),
+                        "upper": q3 + multiplier * (q3 - q1),
+                    }
+            elif method == "mad":
+                multiplier = self.outlier_detection_config.mad_multiplier
+                medians = {column: sketch.get_quantiles([0.5])[0] for column, sketch in sketches.items()}
+                for column, sketch in self.sketch_columns(offsets=medians).items():
+                    mad = sketch.get_quantiles([0.5])[0]
+                    bounds[column] = {
+                        "median": medians[column],
+                        "mad": mad,
+                        "lower": medians[column] - multiplier * MAD_SCALE * mad,
+                        "upper": medians[column] + multiplier * MAD_SCALE * mad,
+                    }
+            else:
+                raise ValueError(f"Unknown outlier detection method: {method}")
+
+            logging.info("Exited the get_bounds method of OutlierDetection class")
+            return bounds
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def count_outliers(self, bounds: Dict[str, Dict]) -> None:
+        """Add the number of training rows below and above the bounds to ``bounds``, chunk by chunk."""
+        for column_bounds in bounds.values():
+            column_bounds["n_below"] = column_bounds["n_above"] = 0
+        for chunk in self.iter_train_values(list(bounds)):
+            for column, values in chunk.items():
+                bounds[column]["n_below"] += int(np.count_nonzero(values < bounds[column]["lower"]))
+                bounds[column]["n_above"] += int(np.count_nonzero(values > bounds[column]["upper"]))
+
+    def initiate_outlier_detection(self) -> OutlierDetectionArtifacts:
+        logging.info("Entered the initiate_outlier_detection method of OutlierDetection class")
+        try:
+            bounds = self.get_bounds()
+            self.count_outliers(bounds)
+            self.utils.write_json_file(
+                self.outlier_detection_config.bounds_file_path,
+                {"method": self.outlier_detection_config.method, "columns": bounds},
+            )
+
+            outlier_detection_artifacts = OutlierDetectionArtifacts(
+                bounds_file_path=self.outlier_detection_config.bounds_file_path,
+                n_outliers={
+                    column: column_bounds["n_below"] + column_bounds["n_above"]
+                    for column, column_bounds in bounds.items()
+                },
+            )
+
+            logging.info(f"Outlier detection artifacts: {outlier_detection_artifacts}")
+            logging.info("Exited the initiate_outlier_detection method of OutlierDetection class")
+            return outlier_detection_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
@@ -0,0 +1,177 @@
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import stats
+
+from shipment.configuration.dictionary_operations import DictionaryOperation
+from shipment.configuration.parquet_operations import ParquetOperation
+from shipment.constant import FEATURE_STORE_DICTIONARIES_DIR_NAME
+from shipment.entity.artifacts_entity import (
+    DataIngestionArtifacts,
+    OutlierDetectionArtifacts,
+    PowerTransformArtifacts,
+)
+from shipment.entity.config_entity import PowerTransformConfig
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+from shipment.utils.sketch_utils import ReservoirSample, YeoJohnsonLikelihood
+
+# Half-width of the first lambda grid of the full fit, centred on the sampled lambda
+FULL_FIT_HALF_WIDTH = 0.5
+# Grid points per full fit pass; each pass narrows the grid tenfold around the best point
+FULL_FIT_GRID_SIZE = 11
+
+
+class PowerTransform:
+    """Yeo-Johnson power transform, like the notebook's PowerTransformer, fitted out of core.
+
+    Lambda is fitted on a bounded reservoir sample of the training values, so the cost of a
+    refit does not grow with the data. The fitted lambdas, and the mean and standard
+    deviation used to standardize the transformed values, are persisted for prediction.
+    With ``outlier_detection_artifacts``, values are capped to the outlier bounds before
+    fitting, and the bounds are persisted with the parameters of their column.
+    """
+
+    def __init__(
+        self,
+        data_ingestion_artifacts: DataIngestionArtifacts,
+        power_transform_config: PowerTransformConfig,
+        outlier_detection_artifacts: Optional[OutlierDetectionArtifacts] = None,
+    ):
+        self.data_ingestion_artifacts = data_ingestion_artifacts
+        self.power_transform_config = power_transform_config
+        self.utils = MainUtils()
+        self.schema_config = self.utils.read_yaml_file(power_transform_config.schema_file_path)
+        self.parquet_op = ParquetOperation(
+            self.schema_config,
+            DictionaryOperation(
+                os.path.join(data_ingestion_artifacts.feature_store_path, FEATURE_STORE_DICTIONARIES_DIR_NAME)
+            ),
+        )
+        self.power_transform_columns = self.schema_config.get("power_transform_columns", [])
+        self.outlier_bounds = {}
+        if outlier_detection_artifacts is not None:
+            bounds = self.utils.read_json_file(outlier_detection_artifacts.bounds_file_path)["columns"]
+            self.outlier_bounds = {
+                column: {"lower": column_bounds["lower"], "upper": column_bounds["upper"]}
+                for column, column_bounds in bounds.items()
+                if column in self.power_transform_columns
+            }
+
+    def iter_train_values(self, columns: List[str]):
+        """Yield chunks of the training values, capped to the outlier bounds of their column."""
+        for chunk in self.parquet_op.iter_indexed_values(
+            self.data_ingestion_artifacts.feature_store_path,
+            self.data_ingestion_artifacts.train_index_dir,
+            columns,
+        ):
+            for column, column_bounds in self.outlier_bounds.items():
+                if column in chunk:
+                    chunk[column] = np.clip(chunk[column], column_bounds["lower"], column_bounds["upper"])
+            yield chunk
+
+    def get_params(self) -> Dict[str, Dict]:
+        """Fit lambda per column on a reservoir sample, in one pass over the training rows."""
+        logging.info("Entered the get_params method of PowerTransform class")
+        try:
+            samples = {
+                column: ReservoirSample(size=self.power_transform_config.sample_size, seed=0)
+                for column in self.power_transform_columns
+            }
+            for chunk in self.iter_train_values(self.power_transform_columns):
+                for column, values in chunk.items():
+                    samples[column].update(values)
+
+            params = {}
+            for column, sample in samples.items():
+                lmbda = float(stats.yeojohnson_normmax(sample.values))
+                transformed = stats.yeojohnson(sample.values, lmbda)
+                params[column] = {
+                    "lambda": lmbda,
+                    "mean": float(transformed.mean()),
+                    "std": float(transformed.std()) or 1.0,
+                    "n_rows": sample.n,
+                    "sample_size": len(sample.values),
+                    **self.outlier_bounds.get(column, {}),
+                }
+                logging.info(f"Yeo-Johnson parameters of {column}: {params[column]}")
+
+            logging.info("Exited the get_params method of PowerTransform class")
+            return params
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_full_fit_lambdas(self, lambdas: Dict[str, float]) -> Dict[str, float]:
+        """Lambdas maximizing the log-likelihood of every training value, a diagnostic of the sampled fit.
+
+        Each pass over the training rows evaluates a streaming log-likelihood on a small
+        grid around the current estimate, starting from the sampled ``lambdas``, and the
+        next grid is ten times narrower around the best point. The grid is moved, not
+        narrowed, while the best point is at its edge.
+        """
+        logging.info("Entered the get_full_fit_lambdas method of PowerTransform class")
+        try:
+            centers = dict(lambdas)
+            half_widths = {column: FULL_FIT_HALF_WIDTH for column in lambdas}
+            for _ in range(self.power_transform_config.full_fit_passes):
+                likelihoods = {
+                    column: YeoJohnsonLikelihood(
+                        np.linspace(
+                            centers[column] - half_widths[column],
+                            centers[column] + half_widths[column],
+                            FULL_FIT_GRID_SIZE,
+                        )
+                    )
+                    for column in lambdas
+                }
+                for chunk in self.iter_train_values(list(lambdas)):
+                    for column, values in chunk.items():
+                        likelihoods[column].update(values)
+
+                for column, likelihood in likelihoods.items():
+                    centers[column] = likelihood.get_lambda()
+                    best = int(np.nanargmax(likelihood.get_log_likelihood()))
+                    if 0 < best < FULL_FIT_GRID_SIZE - 1:
+                        half_widths[column] /= 10
+
+            logging.info(f"Full fit lambdas: {centers}")
+            logging.info("Exited the get_full_fit_lambdas method of PowerTransform class")
+            return centers
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def initiate_power_transform(self) -> PowerTransformArtifacts:
+        logging.info("Entered the initiate_power_transform method of PowerTransform class")
+        try:
+            params = self.get_params()
+            if self.power_transform_config.compare_full_fit:
+                full_lambdas = self.get_full_fit_lambdas(
+                    {column: column_params["lambda"] for column, column_params in params.items()}
+                )
+                for column, full_lambda in full_lambdas.items():
+                    params[column]["full_lambda"] = full_lambda
+                    params[column]["lambda_difference"] = params[column]["lambda"] - full_lambda
+            self.utils.write_json_file(
+                self.power_transform_config.params_file_path, {"method": "yeo-johnson", "columns": params}
+            )
+
+            power_transform_artifacts = PowerTransformArtifacts(
+                params_file_path=self.power_transform_config.params_file_path,
+                lambda_differences={
+                    column: column_params["lambda_difference"]
+                    for column, column_params in params.items()
+                    if "lambda_difference" in column_params
+                },
+            )
+
+            logging.info(f"Power transform artifacts: {power_transform_artifacts}")
+            logging.info("Exited the initiate_power_transform method of PowerTransform class")
+            return power_transform_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
@@ -0,0 +1,140 @@
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from shipment.exception import ShippingException
+from shipment.logger import logging
+
+# Below this many pending values the lookup index is not worth rebuilding
+MIN_REBUILD_SIZE = 65_536
+# Hash of a missing value, as given by pandas' hash_pandas_object for a missing category
+MISSING_HASH = np.iinfo(np.uint64).max
+
+
+class ColumnDictionary:
+    """Append-only mapping between the values of one column and dense int32 codes.
+
+    Codes are positions in the dictionary, so they never change once assigned and
+    parts written at different times can share them.
+    """
+
+    def __init__(self, values: Optional[np.ndarray] = None):
+        self.values: List[object] = list(values) if values is not None else []
+        self.index = pd.Index(self.values, dtype=object)
+        # Values added since ``index`` was last built
+        self.pending: Dict[object, int] = {}
+        # Hashes of the first ``len(hashes)`` values, extended as the dictionary grows
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def rebuild_index(self) -> None:
+        self.index = pd.Index(self.values, dtype=object)
+        self.pending = {}
+
+    def encode(self, series: pd.Series) -> np.ndarray:
+        """Return the int32 codes of ``series``, adding unseen values; missing values get -1."""
+        inverse, uniques = pd.factorize(series)
+        unique_codes = self.index.get_indexer(pd.Index(uniques, dtype=object))
+        for position in np.flatnonzero(unique_codes == -1):
+            value = uniques[position]
+            code = self.pending.get(value)
+            if code is None:
+                code = len(self.values)
+                self.values.append(value)
+                self.pending[value] = code
+            unique_codes[position] = code
+
+        # Rebuilding when pending outgrows the index keeps the total rebuild cost linear
+        if len(self.pending) > max(len(self.index), MIN_REBUILD_SIZE):
+            self.rebuild_index()
+
+        codes = np.full(len(inverse), -1, dtype=np.int32)
+        present = inverse != -1
+        codes[present] = unique_codes[inverse[present]]
+        return codes
+
+    def get_hashes(self, codes: np.ndarray) -> np.ndarray:
+        """uint64 hashes of the values of ``codes``, equal to ``hash_pandas_object`` of the values.
+
+        Each dictionary value is hashed once, when first asked for, so the cost per call
+        is the number of codes and not the size of the dictionary.
+        """
+        if len(self.hashes) < len(self.values):
+            new_values = np.asarray(self.values[len(self.hashes) :], dtype=object)
+            self.hashes = np.concatenate([self.hashes, pd.util.hash_array(new_values, categorize=False)])
+        hashes = np.full(len(codes), MISSING_HASH, dtype=np.uint64)
+        present = codes >= 0
+        hashes[present] = self.hashes[codes[present]]
+        return hashes
+
+    def decode(self, codes: np.ndarray) -> pd.Categorical:
+        """View ``codes`` as a categorical over the dictionary; strings are not copied per row."""
+        return pd.Categorical.from_codes(codes, categories=pd.Index(self.values, dtype=object), validate=False)
+
+
+class DictionaryOperation:
+    """Persisted dictionaries of the feature store's ``encoded`` columns, one Parquet file per column."""
+
+    def __init__(self, dictionaries_dir: str):
+        self.dictionaries_dir = dictionaries_dir
+        self.dictionaries: Dict[str, ColumnDictionary] = {}
+        self.saved_sizes: Dict[str, int] = {}
+
+    def get_dictionary_file_path(self, column: str) -> str:
+        return os.path.join(self.dictionaries_dir, f"{column}.parquet")
+
+    def get_dictionary(self, column: str) -> ColumnDictionary:
+        """Return the dictionary of ``column``, loading it from disk on first use."""
+        try:
+            if column not in self.dictionaries:
+                file_path = self.get_dictionary_file_path(column)
+                values = None
+                if os.path.exists(file_path):
+                    values = pq.read_table(file_path).column("value").to_numpy(zero_copy_only=False)
+                self.dictionaries[column] = ColumnDictionary(values)
+                self.saved_sizes[column] = len(self.dictionaries[column])
+
+            return self.dictionaries[column]
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def encode(self, column: str, series: pd.Series) -> np.ndarray:
+        return self.get_dictionary(column).encode(series)
+
+    def decode(self, column: str, codes: np.ndarray) -> pd.Categorical:
+        return self.get_dictionary(column).decode(codes)
+
+    def get_hashes(self, column: str, codes: np.ndarray) -> np.ndarray:
+        return self.get_dictionary(column).get_hashes(codes)
+
+    def save(self) -> None:
+        """Write the dictionaries that gained values since they were loaded or last saved.
+
+        Call this before committing a feature store part that uses the new codes.
+        """
+        logging.info("Entered the save method of DictionaryOperation class")
+        try:
+            os.makedirs(self.dictionaries_dir, exist_ok=True)
+            for column, dictionary in self.dictionaries.items():
+                if len(dictionary) == self.saved_sizes[column]:
+                    continue
+
+                file_path = self.get_dictionary_file_path(column)
+                tmp_file_path = file_path + ".tmp"
+                pq.write_table(pa.table({"value": pa.array(dictionary.values, type=pa.string())}), tmp_file_path)
+                os.replace(tmp_file_path, file_path)
+                self.saved_sizes[column] = len(dictionary)
+                logging.info(f"Saved {len(dictionary)} values of the {column} dictionary")
+
+            logging.info("Exited the save method of DictionaryOperation class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
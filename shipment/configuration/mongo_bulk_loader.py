@@ -0,0 +1,102 @@
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterator, List
+
+from pandas import DataFrame
+
+from shipment.configuration.mongo_operations import MongoDBOperation
+from shipment.configuration.schema_precheck import SchemaPreCheck
+from shipment.entity.artifacts_entity import MongoBulkLoadArtifacts
+from shipment.entity.config_entity import MongoBulkLoadConfig
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+
+
+class MongoBulkLoader:
+    """Seed the shipment collection from CSV drops shaped like data/train.csv."""
+
+    def __init__(self, mongo_bulk_load_config: MongoBulkLoadConfig, mongo_op: MongoDBOperation):
+        self.mongo_bulk_load_config = mongo_bulk_load_config
+        self.mongo_op = mongo_op
+        self.utils = MainUtils()
+        self.schema_config = self.utils.read_yaml_file(mongo_bulk_load_config.schema_file_path)
+
+    def dataframe_to_records(self, df: DataFrame) -> List[Dict]:
+        """Convert a typed chunk to BSON-encodable documents, with missing values as nulls."""
+        df = df.astype(object).where(df.notna(), None)
+        return df.to_dict(orient="records")
+
+    def iter_record_batches(self, csv_file_path: str) -> Iterator[List[Dict]]:
+        """Read the CSV in chunks, converting types once per chunk, and yield insert sized batches."""
+        # float64 so that Mongo stores the decimal values exactly as they appear in the CSV
+        for chunk in self.utils.iter_csv_typed(
+            csv_file_path,
+            self.schema_config,
+            chunksize=self.mongo_bulk_load_config.chunk_size,
+            float_dtype="float64",
+        ):
+            records = self.dataframe_to_records(chunk)
+            batch_size = self.mongo_bulk_load_config.insert_batch_size
+            for start in range(0, len(records), batch_size):
+                yield records[start : start + batch_size]
+
+    def load_csv(self, csv_file_path: str) -> MongoBulkLoadArtifacts:
+        """Insert the rows of ``csv_file_path`` with unordered ``insert_many`` batches.
+
+        Up to ``max_in_flight`` batches are being inserted at once while the next chunk is
+        parsed, so the load is bounded by the server rather than by round trips.
+        """
+        logging.info("Entered the load_csv method of MongoBulkLoader class")
+        try:
+            schema_precheck = SchemaPreCheck(self.schema_config)
+            check_report = schema_precheck.check_csv_header(csv_file_path)
+            if not schema_precheck.is_valid(check_report):
+                raise Exception(f"{csv_file_path} does not match the schema: {check_report}")
+
+            collection = self.mongo_op.get_collection(
+                self.mongo_bulk_load_config.db_name, self.mongo_bulk_load_config.collection_name
+            )
+            in_flight: Deque[Future] = deque()
+            n_rows = 0
+            start_time = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=self.mongo_bulk_load_config.max_in_flight) as executor:
+                for records in self.iter_record_batches(csv_file_path):
+                    if len(in_flight) >= self.mongo_bulk_load_config.max_in_flight:
+                        n_rows += len(in_flight.popleft().result().inserted_ids)
+                    in_flight.append(executor.submit(collection.insert_many, records, ordered=False))
+
+                while in_flight:
+                    n_rows += len(in_flight.popleft().result().inserted_ids)
+
+            elapsed_seconds = time.perf_counter() - start_time
+            mongo_bulk_load_artifacts = MongoBulkLoadArtifacts(
+                n_rows=n_rows,
+                elapsed_seconds=elapsed_seconds,
+                rows_per_second=n_rows / elapsed_seconds if elapsed_seconds > 0 else float(n_rows),
+            )
+
+            logging.info(f"Mongo bulk load artifacts: {mongo_bulk_load_artifacts}")
+            logging.info("Exited the load_csv method of MongoBulkLoader class")
+            return mongo_bulk_load_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk load a shipment CSV into MongoDB")
+    parser.add_argument("csv_file_path")
+    parser.add_argument("--collection", default=MongoBulkLoadConfig.collection_name)
+    args = parser.parse_args()
+
+    loader = MongoBulkLoader(MongoBulkLoadConfig(collection_name=args.collection), MongoDBOperation())
+    artifacts = loader.load_csv(args.csv_file_path)
+    print(
+        f"Inserted {artifacts.n_rows} rows in {artifacts.elapsed_seconds:.1f}s "
+        f"({artifacts.rows_per_second:,.0f} rows/sec)"
+    )
@@ -0,0 +1,346 @@
+import os
+import pickle
+import queue
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from pandas import DataFrame
+from pymongo import MongoClient
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from shipment.constant import MONGO_DB_URL_KEY, MONGO_ID_COLUMN
+from shipment.entity.config_entity import MongoClientConfig
+from shipment.exception import ShippingException
+from shipment.logger import logging
+
+_client: Optional[MongoClient] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_mongo_client(mongo_client_config: Optional[MongoClientConfig] = None) -> MongoClient:
+    """Return the process-wide MongoClient, creating it on first use.
+
+    The client owns a connection pool, so sharing it saves the TCP/TLS handshake and the
+    SRV lookup on every call. A forked child gets a client of its own, since MongoClient
+    is not fork-safe. ``mongo_client_config`` only applies when the client is created.
+    """
+    global _client, _client_pid
+
+    try:
+        with _client_lock:
+            if _client is None or _client_pid != os.getpid():
+                logging.info("Creating the shared MongoClient")
+                config = mongo_client_config or MongoClientConfig()
+                _client = MongoClient(
+                    os.getenv(MONGO_DB_URL_KEY),
+                    maxPoolSize=config.max_pool_size,
+                    minPoolSize=config.min_pool_size,
+                    maxIdleTimeMS=config.max_idle_time_ms,
+                    connectTimeoutMS=config.connect_timeout_ms,
+                    serverSelectionTimeoutMS=config.server_selection_timeout_ms,
+                    socketTimeoutMS=config.socket_timeout_ms,
+                    compressors=config.compressors,
+                )
+                _client_pid = os.getpid()
+
+            return _client
+
+    except Exception as e:
+        raise ShippingException(e, sys) from e
+
+
+def close_mongo_client() -> None:
+    global _client, _client_pid
+
+    with _client_lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = None
+        _client_pid = None
+
+
+class MongoDBOperation:
+    def __init__(self, client: Optional[MongoClient] = None):
+        self._client = client
+
+    @property
+    def client(self) -> MongoClient:
+        """The injected client, or the shared process-wide one."""
+        if self._client is not None:
+            return self._client
+        return get_mongo_client()
+
+    def get_database(self, db_name: str) -> Database:
+        logging.info("Entered the get_database method of MongoDBOperation class")
+        try:
+            database = self.client[db_name]
+
+            logging.info("Exited the get_database method of MongoDBOperation class")
+            return database
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_collection(self, db_name: str, collection_name: str) -> Collection:
+        logging.info("Entered the get_collection method of MongoDBOperation class")
+        try:
+            collection = self.get_database(db_name)[collection_name]
+
+            logging.info("Exited the get_collection method of MongoDBOperation class")
+            return collection
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_collection_as_dataframe(self, db_name: str, collection_name: str) -> DataFrame:
+        """Load the whole collection into memory. Only suitable for small collections."""
+        logging.info("Entered the get_collection_as_dataframe method of MongoDBOperation class")
+        try:
+            collection = self.get_collection(db_name, collection_name)
+            df = pd.DataFrame(list(collection.find()))
+            if MONGO_ID_COLUMN in df.columns:
+                df = df.drop(columns=[MONGO_ID_COLUMN])
+
+            logging.info("Exited the get_collection_as_dataframe method of MongoDBOperation class")
+            return df
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def iter_collection_batches(
+        self,
+        db_name: str,
+        collection_name: str,
+        batch_size: int,
+        query: Optional[Dict] = None,
+        projection: Optional[Dict] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Iterator[List[Dict]]:
+        """Yield the documents matching ``query`` as lists of at most ``batch_size`` documents.
+
+        The cursor fetches from the server in ``batch_size`` chunks as well, so at most
+        one batch of documents is held in memory at a time.
+        """
+        logging.info("Entered the iter_collection_batches method of MongoDBOperation class")
+        try:
+            if projection is None:
+                projection = {MONGO_ID_COLUMN: 0}
+
+            collection = self.get_collection(db_name, collection_name)
+            cursor = collection.find(query or {}, projection, batch_size=batch_size)
+            if sort:
+                cursor = cursor.sort(sort)
+            try:
+                while True:
+                    batch = list(islice(cursor, batch_size))
+                    if not batch:
+                        break
+                    yield batch
+            finally:
+                cursor.close()
+
+            logging.info("Exited the iter_collection_batches method of MongoDBOperation class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_id_ranges(
+        self, db_name: str, collection_name: str, n_ranges: int, query: Optional[Dict] = None
+    ) -> List[Tuple[Optional[Any], Optional[Any]]]:
+        """Split the documents matching ``query`` into ``n_ranges`` contiguous ``_id`` ranges.
+
+        Boundaries are taken at evenly spaced positions of the ``_id`` index, so the ranges
+        hold roughly the same number of documents. Each range is ``(lower, upper)`` with
+        ``lower`` inclusive and ``upper`` exclusive; None means unbounded.
+        """
+        logging.info("Entered the get_id_ranges method of MongoDBOperation class")
+        try:
+            collection = self.get_collection(db_name, collection_name)
+            n_documents = collection.count_documents(query or {})
+            n_ranges = max(1, min(n_ranges, n_documents))
+
+            boundaries = []
+            for i in range(1, n_ranges):
+                boundary = list(
+                    collection.find(query or {}, {MONGO_ID_COLUMN: 1})
+                    .sort(MONGO_ID_COLUMN, 1)
+                    .skip(i * n_documents // n_ranges)
+                    .limit(1)
+                )
+                if boundary and (not boundaries or boundary[0][MONGO_ID_COLUMN] > boundaries[-1]):
+                    boundaries.append(boundary[0][MONGO_ID_COLUMN])
+
+            lowers = [None] + boundaries
+            uppers = boundaries + [None]
+
+            logging.info("Exited the get_id_ranges method of MongoDBOperation class")
+            return list(zip(lowers, uppers))
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    @staticmethod
+    def get_range_query(query: Optional[Dict], lower: Optional[Any], upper: Optional[Any]) -> Dict:
+        id_filter = {}
+        if lower is not None:
+            id_filter["$gte"] = lower
+        if upper is not None:
+            id_filter["$lt"] = upper
+
+        if not id_filter:
+            return query or {}
+        if not query:
+            return {MONGO_ID_COLUMN: id_filter}
+        return {"$and": [query, {MONGO_ID_COLUMN: id_filter}]}
+
+    def iter_collection_batches_parallel(
+        self,
+        db_name: str,
+        collection_name: str,
+        batch_size: int,
+        n_workers: int,
+        max_prefetch_batches: int,
+        query: Optional[Dict] = None,
+        projection: Optional[Dict] = None,
+    ) -> Iterator[List[Dict]]:
+        """Read the collection as ``n_workers`` concurrent ``_id`` ranges and yield batches in ``_id`` order.
+
+        Each worker runs its own cursor on a pooled connection. The first
+        ``max_prefetch_batches`` batches of a range wait in memory, which bounds memory at
+        ``n_workers * max_prefetch_batches`` batches; once they are full, the worker spills
+        the rest of its range to a temporary file instead of waiting for the consumer to
+        reach it, so all ranges are read at once even though they are yielded one after the
+        other. Threads are used rather than processes because MongoClient is not fork-safe;
+        the network reads and BSON decoding of the ranges overlap with each other and with
+        the consumer.
+        """
+        logging.info("Entered the iter_collection_batches_parallel method of MongoDBOperation class")
+        try:
+            id_ranges = self.get_id_ranges(db_name, collection_name, n_workers, query=query)
+            range_queues = [queue.Queue(maxsize=max_prefetch_batches) for _ in id_ranges]
+            end_of_range = object()
+            stop = threading.Event()
+
+            def put(range_queue: queue.Queue, item: Any) -> bool:
+                while not stop.is_set():
+                    try:
+                        range_queue.put(item, timeout=0.1)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+
+            def read_range(
+                range_queue: queue.Queue, spill_file_path: str, lower: Optional[Any], upper: Optional[Any]
+            ) -> None:
+                spill_file = None
+                try:
+                    for batch in self.iter_collection_batches(
+                        db_name,
+                        collection_name,
+                        batch_size=batch_size,
+                        query=self.get_range_query(query, lower, upper),
+                        projection=dict(projection) if projection is not None else None,
+                        sort=[(MONGO_ID_COLUMN, 1)],
+                    ):
+                        if stop.is_set():
+                            return
+                        if spill_file is None:
+                            try:
+                                range_queue.put_nowait(batch)
+                                continue
+                            except queue.Full:
+                                # Later batches go to the file too, so the queue keeps the head of the range
+                                spill_file = open(spill_file_path, "wb")
+                        pickle.dump(batch, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+                    if spill_file is not None:
+                        spill_file.close()
+                    put(range_queue, (end_of_range, spill_file is not None))
+                except Exception as e:
+                    put(range_queue, e)
+                finally:
+                    if spill_file is not None:
+                        spill_file.close()
+
+            def iter_spilled(spill_file_path: str) -> Iterator[List[Dict]]:
+                with open(spill_file_path, "rb") as spill_file:
+                    while True:
+                        try:
+                            yield pickle.load(spill_file)
+                        except EOFError:
+                            return
+
+            with tempfile.TemporaryDirectory() as spill_dir, ThreadPoolExecutor(
+                max_workers=len(id_ranges)
+            ) as executor:
+                try:
+                    spill_file_paths = [os.path.join(spill_dir, f"range-{i}.pickle") for i in range(len(id_ranges))]
+                    for range_queue, spill_file_path, id_range in zip(range_queues, spill_file_paths, id_ranges):
+                        executor.submit(read_range, range_queue, spill_file_path, *id_range)
+
+                    for range_queue, spill_file_path in zip(range_queues, spill_file_paths):
+                        while True:
+                            item = range_queue.get()
+                            if isinstance(item, Exception):
+                                raise item
+                            if isinstance(item, tuple) and item[0] is end_of_range:
+                                if item[1]:
+                                    yield from iter_spilled(spill_file_path)
+                                break
+                            yield item
+                finally:
+                    stop.set()
+
+            logging.info("Exited the iter_collection_batches_parallel method of MongoDBOperation class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_collection_state(self, db_name: str, collection_name: str, query: Optional[Dict] = None) -> Dict:
+        """Cheap summary of the collection that changes whenever documents are added or removed.
+
+        Combines the document count, the largest ``_id`` and, where the server allows it,
+        the collection's data size, which also moves on most in-place updates. Without a
+        ``query`` the count is the metadata estimate, so the check does not scan the
+        collection; the largest ``_id`` and data size still catch changes it misses.
+        """
+        logging.info("Entered the get_collection_state method of MongoDBOperation class")
+        try:
+            collection = self.get_collection(db_name, collection_name)
+            last_document = list(
+                collection.find(query or {}, {MONGO_ID_COLUMN: 1}).sort(MONGO_ID_COLUMN, -1).limit(1)
+            )
+            collection_state = {
+                "count": collection.count_documents(query) if query else collection.estimated_document_count(),
+                "max_id": str(last_document[0][MONGO_ID_COLUMN]) if last_document else None,
+                "size": None,
+            }
+            try:
+                collection_state["size"] = self.get_database(db_name).command({"collStats": collection_name})["size"]
+            except Exception as e:
+                logging.info(f"collStats is not available, fingerprinting without it: {e}")
+
+            logging.info("Exited the get_collection_state method of MongoDBOperation class")
+            return collection_state
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def insert_dataframe_as_record(self, data_frame: DataFrame, db_name: str, collection_name: str) -> None:
+        logging.info("Entered the insert_dataframe_as_record method of MongoDBOperation class")
+        try:
+            records = data_frame.to_dict(orient="records")
+            collection = self.get_collection(db_name, collection_name)
+            collection.insert_many(records)
+
+            logging.info("Exited the insert_dataframe_as_record method of MongoDBOperation class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
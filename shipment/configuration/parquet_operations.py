@@ -0,0 +1,270 @@
+import glob
+import os
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from shipment.configuration.dictionary_operations import DictionaryOperation
+from shipment.constant import (
+    FEATURE_STORE_COMPRESSION,
+    FEATURE_STORE_FILE_EXTENSION,
+    FEATURE_STORE_FILE_PREFIX,
+)
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+
+ARROW_TYPES = {
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "string": pa.string(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "date": pa.timestamp("ms"),
+    "bool": pa.bool_(),
+    "encoded": pa.int32(),
+}
+
+# Row index files list feature store rows by part file name and row position within the part
+ROW_INDEX_SCHEMA = pa.schema([("part", pa.string()), ("row", pa.int64())])
+
+# Keep nullable flags as booleans instead of falling back to object columns
+PANDAS_TYPES = {pa.bool_(): pd.BooleanDtype()}
+
+
+class ParquetOperation:
+    def __init__(self, schema_config: Dict, dictionary_op: Optional[DictionaryOperation] = None):
+        self.schema_config = schema_config
+        self.dictionary_op = dictionary_op
+        self.utils = MainUtils()
+        self.arrow_schema = self.get_arrow_schema(schema_config)
+        self.encoded_columns = [
+            column for column, column_type in schema_config["columns"].items() if column_type == "encoded"
+        ]
+
+    @staticmethod
+    def get_arrow_schema(schema_config: Dict) -> pa.Schema:
+        """Build the feature store Arrow schema from the ``columns`` section of schema.yaml."""
+        logging.info("Entered the get_arrow_schema method of ParquetOperation class")
+        try:
+            fields = [
+                pa.field(column, ARROW_TYPES[column_type])
+                for column, column_type in schema_config["columns"].items()
+            ]
+
+            logging.info("Exited the get_arrow_schema method of ParquetOperation class")
+            return pa.schema(fields)
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    @staticmethod
+    def get_part_file_paths(feature_store_dir: str) -> List[str]:
+        """List the part files of a feature store directory in part order."""
+        pattern = f"{FEATURE_STORE_FILE_PREFIX}-*{FEATURE_STORE_FILE_EXTENSION}"
+        return sorted(glob.glob(os.path.join(feature_store_dir, pattern)))
+
+    def records_to_table(self, records: List[Dict]) -> pa.Table:
+        """Convert a batch of documents to a table with the feature store schema.
+
+        Missing fields become nulls and fields that are not in the schema are dropped,
+        so every batch of a collection produces the same schema.
+        """
+        try:
+            df = pd.DataFrame.from_records(records, columns=self.arrow_schema.names)
+            df = self.utils.cast_dataframe(df, self.schema_config)
+            for column in self.encoded_columns:
+                codes = self.dictionary_op.encode(column, df[column])
+                df[column] = pd.arrays.IntegerArray(codes, codes == -1)
+
+            return pa.Table.from_pandas(df, schema=self.arrow_schema, preserve_index=False)
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def write_tables(self, tables: Iterable[pa.Table], file_path: str) -> int:
+        """Stream ``tables`` into ``file_path``, one row group per table.
+
+        The file is zstd compressed, with category columns dictionary encoded. It is written
+        under a temporary name and moved into place once complete, so readers never see a
+        half written file. Returns the number of rows written.
+        """
+        logging.info("Entered the write_tables method of ParquetOperation class")
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            tmp_file_path = file_path + ".tmp"
+            n_rows = 0
+            with pq.ParquetWriter(
+                tmp_file_path, self.arrow_schema, compression=FEATURE_STORE_COMPRESSION
+            ) as writer:
+                for table in tables:
+                    writer.write_table(table, row_group_size=max(table.num_rows, 1))
+                    n_rows += table.num_rows
+            # The part must never become visible before the dictionary entries it refers to
+            if self.dictionary_op is not None:
+                self.dictionary_op.save()
+            os.replace(tmp_file_path, file_path)
+
+            logging.info(f"Wrote {n_rows} rows to {file_path}")
+            logging.info("Exited the write_tables method of ParquetOperation class")
+            return n_rows
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def read_table(self, path: str, columns: Optional[List[str]] = None) -> pa.Table:
+        """Read ``columns`` of a feature store file or directory, memory-mapping the files.
+
+        Only the requested column chunks are read and decoded, so stages should always
+        pass the columns they actually use.
+        """
+        logging.info("Entered the read_table method of ParquetOperation class")
+        try:
+            table = pq.read_table(path, columns=columns, memory_map=True)
+
+            logging.info("Exited the read_table method of ParquetOperation class")
+            return table
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def decode_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Replace the codes of ``encoded`` columns in ``df`` by categoricals over their dictionaries."""
+        for column in self.encoded_columns:
+            if column in df.columns:
+                codes = df[column].fillna(-1).to_numpy(dtype=np.int32)
+                df[column] = self.dictionary_op.decode(column, codes)
+        return df
+
+    def get_value_hashes(self, column: str, series: pd.Series) -> np.ndarray:
+        """uint64 hashes of the values of ``column``, the same whether or not it is ``encoded``.
+
+        Codes of ``encoded`` columns are looked up in the cached hashes of their dictionary
+        instead of being decoded, so the cost does not grow with the dictionary.
+        """
+        if column in self.encoded_columns:
+            return self.dictionary_op.get_hashes(column, series.fillna(-1).to_numpy(dtype=np.int32))
+        return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+    def read_dataframe(self, path: str, columns: Optional[List[str]] = None, decode: bool = False) -> pd.DataFrame:
+        """Read ``columns`` of the feature store as a dataframe with category, boolean and datetime dtypes.
+
+        ``encoded`` columns stay int32 codes unless ``decode`` is set, so stages that do not
+        need the text never pay for it.
+        """
+        logging.info("Entered the read_dataframe method of ParquetOperation class")
+        try:
+            df = self.read_table(path, columns=columns).to_pandas(types_mapper=PANDAS_TYPES.get)
+            if decode:
+                df = self.decode_dataframe(df)
+
+            logging.info("Exited the read_dataframe method of ParquetOperation class")
+            return df
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    @staticmethod
+    def get_row_groups(file_paths: List[str]) -> List[Tuple[str, int]]:
+        """List ``(file_path, row_group)`` pairs, the unit of work for parallel scans."""
+        return [
+            (file_path, row_group)
+            for file_path in file_paths
+            for row_group in range(pq.ParquetFile(file_path).metadata.num_row_groups)
+        ]
+
+    def read_row_group(self, file_path: str, row_group: int, columns: List[str]) -> pa.Table:
+        try:
+            return pq.ParquetFile(file_path, memory_map=True).read_row_group(row_group, columns=columns)
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def iter_row_groups(
+        self, file_paths: List[str], columns: List[str]
+    ) -> Iterator[Tuple[str, int, pa.Table]]:
+        """Yield ``(file_path, first_row, table)`` for every row group of ``file_paths``.
+
+        Only ``columns`` are read and at most one row group is held in memory at a time.
+        """
+        try:
+            for file_path in file_paths:
+                parquet_file = pq.ParquetFile(file_path, memory_map=True)
+                first_row = 0
+                for row_group in range(parquet_file.num_row_groups):
+                    table = parquet_file.read_row_group(row_group, columns=columns)
+                    yield file_path, first_row, table
+                    first_row += table.num_rows
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def iter_indexed_rows(
+        self, feature_store_dir: str, row_index_path: str, columns: Optional[List[str]] = None
+    ) -> Iterator[pa.Table]:
+        """Yield the rows listed in a row index file, or directory of them, one row group at a time.
+
+        Only row groups holding listed rows are read, so memory is bounded by the row group
+        size even when a part holds the whole history.
+        """
+        try:
+            row_index = pq.read_table(row_index_path, schema=ROW_INDEX_SCHEMA).to_pandas()
+            for part, part_rows in row_index.groupby("part", sort=True):
+                parquet_file = pq.ParquetFile(os.path.join(feature_store_dir, part), memory_map=True)
+                rows = np.sort(part_rows["row"].to_numpy())
+                row_group_sizes = [
+                    parquet_file.metadata.row_group(row_group).num_rows
+                    for row_group in range(parquet_file.num_row_groups)
+                ]
+                starts = np.concatenate([[0], np.cumsum(row_group_sizes)])
+                bounds = np.searchsorted(rows, starts)
+                for row_group in range(parquet_file.num_row_groups):
+                    row_group_rows = rows[bounds[row_group] : bounds[row_group + 1]]
+                    if len(row_group_rows) == 0:
+                        continue
+                    table = parquet_file.read_row_group(row_group, columns=columns)
+                    yield table.take(pa.array(row_group_rows - starts[row_group]))
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def iter_indexed_values(
+        self, feature_store_dir: str, row_index_path: str, columns: List[str]
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield ``{column: float64 values}`` for the rows listed in a row index, chunk by chunk."""
+        for table in self.iter_indexed_rows(feature_store_dir, row_index_path, columns=columns):
+            yield {
+                column: table.column(column).to_numpy(zero_copy_only=False).astype(np.float64)
+                for column in columns
+            }
+
+    def read_indexed_rows(
+        self,
+        feature_store_dir: str,
+        row_index_path: str,
+        columns: Optional[List[str]] = None,
+        decode: bool = False,
+    ) -> pd.DataFrame:
+        """Read ``columns`` of the feature store rows listed in a row index file or directory."""
+        logging.info("Entered the read_indexed_rows method of ParquetOperation class")
+        try:
+            tables = list(self.iter_indexed_rows(feature_store_dir, row_index_path, columns=columns))
+            if tables:
+                table = pa.concat_tables(tables)
+            else:
+                table = self.arrow_schema.empty_table()
+                if columns is not None:
+                    table = table.select(columns)
+
+            df = table.to_pandas(types_mapper=PANDAS_TYPES.get)
+            if decode:
+                df = self.decode_dataframe(df)
+
+            logging.info("Exited the read_indexed_rows method of ParquetOperation class")
+            return df
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
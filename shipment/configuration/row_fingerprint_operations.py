@@ -0,0 +1,136 @@
+import os
+import shutil
+import sys
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from shipment.configuration.parquet_operations import PANDAS_TYPES
+from shipment.exception import ShippingException
+from shipment.logger import logging
+
+
+class RowFingerprintOperation:
+    """Persisted 64-bit fingerprints of the feature store rows, one sorted ``.npy`` file per part.
+
+    Saved fingerprints are memory-mapped and probed with binary search, so the history
+    is not loaded into memory. A file only counts while its part is listed, so parts
+    removed as orphans take their fingerprints with them.
+    """
+
+    def __init__(self, fingerprints_dir: str):
+        self.fingerprints_dir = fingerprints_dir
+        self.history: List[np.ndarray] = []
+        # Sorted runs of the fingerprints kept since the last save, smallest last
+        self.pending: List[np.ndarray] = []
+
+    @staticmethod
+    def get_row_fingerprints(table: pa.Table) -> np.ndarray:
+        """Hash every row of ``table`` into a uint64 over normalized column values.
+
+        Numbers and flags are compared as float64, so a batch fresh from MongoDB and the
+        same rows read back from a part give the same fingerprints.
+        """
+        df = table.to_pandas(types_mapper=PANDAS_TYPES.get)
+        for column in df.columns:
+            if pd.api.types.is_numeric_dtype(df[column]) or pd.api.types.is_bool_dtype(df[column]):
+                df[column] = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    def get_fingerprint_file_path(self, part_file_path: str) -> str:
+        file_name = os.path.splitext(os.path.basename(part_file_path))[0]
+        return os.path.join(self.fingerprints_dir, f"{file_name}.npy")
+
+    def write_fingerprints(self, part_file_path: str, fingerprints: np.ndarray) -> np.ndarray:
+        os.makedirs(self.fingerprints_dir, exist_ok=True)
+        file_path = self.get_fingerprint_file_path(part_file_path)
+        tmp_file_path = file_path + ".tmp"
+        with open(tmp_file_path, "wb") as fingerprint_file:
+            np.save(fingerprint_file, np.sort(fingerprints))
+        os.replace(tmp_file_path, file_path)
+        return np.load(file_path, mmap_mode="r")
+
+    def load(self, part_file_paths: List[str]) -> None:
+        """Memory-map the fingerprints of ``part_file_paths``.
+
+        Parts written before fingerprints were kept are hashed once and their file saved.
+        """
+        logging.info("Entered the load method of RowFingerprintOperation class")
+        try:
+            self.history = []
+            for part_file_path in part_file_paths:
+                file_path = self.get_fingerprint_file_path(part_file_path)
+                if os.path.exists(file_path):
+                    self.history.append(np.load(file_path, mmap_mode="r"))
+                else:
+                    logging.info(f"Fingerprinting existing part {part_file_path}")
+                    fingerprints = self.get_row_fingerprints(pq.read_table(part_file_path, memory_map=True))
+                    self.history.append(self.write_fingerprints(part_file_path, fingerprints))
+
+            logging.info("Exited the load method of RowFingerprintOperation class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def is_seen(self, fingerprints: np.ndarray) -> np.ndarray:
+        seen = np.zeros(len(fingerprints), dtype=bool)
+        for run in self.history + self.pending:
+            if len(run):
+                positions = np.minimum(np.searchsorted(run, fingerprints), len(run) - 1)
+                seen |= run[positions] == fingerprints
+        return seen
+
+    def add_pending(self, fingerprints: np.ndarray) -> None:
+        """Keep ``fingerprints`` as a sorted run, merging runs of similar size.
+
+        Runs at least halve in size from first to last, so there are O(log n) of them to
+        probe and every fingerprint is merged O(log n) times.
+        """
+        if len(fingerprints) == 0:
+            return
+        self.pending.append(np.sort(fingerprints))
+        while len(self.pending) > 1 and len(self.pending[-2]) <= 2 * len(self.pending[-1]):
+            last = self.pending.pop()
+            self.pending[-1] = np.sort(np.concatenate([self.pending[-1], last]), kind="mergesort")
+
+    def drop_duplicates(self, table: pa.Table) -> Tuple[pa.Table, int]:
+        """Remove rows of ``table`` seen before, in the history, this run or earlier in ``table``.
+
+        The fingerprints of the kept rows are held until ``save`` is called for their part.
+        Returns the filtered table and the number of rows removed.
+        """
+        try:
+            fingerprints = self.get_row_fingerprints(table)
+            keep = np.zeros(len(fingerprints), dtype=bool)
+            keep[np.unique(fingerprints, return_index=True)[1]] = True
+            keep &= ~self.is_seen(fingerprints)
+            self.add_pending(fingerprints[keep])
+            n_duplicates = int(len(keep) - keep.sum())
+            return (table if n_duplicates == 0 else table.filter(pa.array(keep))), n_duplicates
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def save(self, part_file_path: str) -> None:
+        """Persist the pending fingerprints as those of ``part_file_path`` and add them to the history."""
+        logging.info("Entered the save method of RowFingerprintOperation class")
+        try:
+            fingerprints = np.concatenate(self.pending) if self.pending else np.empty(0, dtype=np.uint64)
+            self.history.append(self.write_fingerprints(part_file_path, fingerprints))
+            self.pending = []
+
+            logging.info(f"Saved {len(fingerprints)} row fingerprints of {part_file_path}")
+            logging.info("Exited the save method of RowFingerprintOperation class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def reset(self) -> None:
+        """Forget all history, for a full export that replaces every part."""
+        if os.path.exists(self.fingerprints_dir):
+            shutil.rmtree(self.fingerprints_dir)
+        self.history = []
+        self.pending = []
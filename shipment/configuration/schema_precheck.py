@@ -0,0 +1,120 @@
+from typing import Dict, List
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from shipment.configuration.mongo_operations import MongoDBOperation
+from shipment.configuration.parquet_operations import ParquetOperation
+from shipment.constant import MONGO_ID_COLUMN
+from shipment.utils.main_utils import MainUtils
+
+
+class SchemaPreCheck:
+    """Check the metadata of a source against schema.yaml without reading its body.
+
+    Reads a Parquet footer, the first row of a CSV or the newest few MongoDB documents, so
+    a drop with renamed or retyped columns is rejected before any full scan.
+    """
+
+    def __init__(self, schema_config: Dict):
+        self.schema_config = schema_config
+        self.utils = MainUtils()
+        self.arrow_schema = ParquetOperation.get_arrow_schema(schema_config)
+
+    def get_missing_columns(self, found_columns: List[str]) -> List[str]:
+        return [column for column in self.schema_config["columns"] if column not in found_columns]
+
+    def get_value_mismatches(self, df: pd.DataFrame) -> Dict:
+        """Columns of ``df`` holding values that do not convert to their schema.yaml type."""
+        cast_df = self.utils.cast_dataframe(df.copy(), self.schema_config)
+        mismatches = {}
+        for column, column_type in self.schema_config["columns"].items():
+            if column not in df.columns:
+                continue
+            unconvertible = df[column].notna() & cast_df[column].isna()
+            if unconvertible.any():
+                example = df.loc[unconvertible, column].iloc[0]
+                mismatches[column] = {"expected": column_type, "found": str(example)}
+        return mismatches
+
+    @staticmethod
+    def get_empty_columns(metadata: pq.FileMetaData) -> List[str]:
+        """Columns without a single value in the file, from the null counts of the footer statistics.
+
+        Ingestion writes a field missing from every document as an all-null column, so this
+        is where a field renamed upstream shows up in a part of the feature store.
+        """
+        if metadata.num_rows == 0:
+            return []
+        empty_columns = []
+        for column in range(metadata.num_columns):
+            n_missing = 0
+            for row_group in range(metadata.num_row_groups):
+                statistics = metadata.row_group(row_group).column(column).statistics
+                if statistics is None or not statistics.has_null_count:
+                    break
+                n_missing += statistics.null_count
+            else:
+                if n_missing == metadata.num_rows:
+                    empty_columns.append(metadata.schema.column(column).name)
+        return empty_columns
+
+    def check_parquet_footer(self, file_path: str) -> Dict:
+        """Check required columns, their types and that they hold values against the file footer,
+        without reading any data.
+        """
+        parquet_file = pq.ParquetFile(file_path)
+        file_schema = parquet_file.schema_arrow
+        dtype_mismatches = {}
+        for expected in self.arrow_schema:
+            if expected.name in file_schema.names:
+                found = file_schema.field(expected.name).type
+                if not found.equals(expected.type):
+                    dtype_mismatches[expected.name] = {"expected": str(expected.type), "found": str(found)}
+        return {
+            "missing_columns": self.get_missing_columns(file_schema.names),
+            "dtype_mismatches": dtype_mismatches,
+            "empty_columns": [
+                column
+                for column in self.get_empty_columns(parquet_file.metadata)
+                if column in self.schema_config["columns"]
+            ],
+        }
+
+    def check_csv_header(self, csv_file_path: str) -> Dict:
+        """Check the header and the first row of a CSV drop."""
+        df = pd.read_csv(csv_file_path, nrows=1, dtype=str)
+        return {
+            "missing_columns": self.get_missing_columns(list(df.columns)),
+            "dtype_mismatches": self.get_value_mismatches(df),
+        }
+
+    def check_mongo_sample(
+        self, mongo_op: MongoDBOperation, db_name: str, collection_name: str, sample_size: int
+    ) -> Dict:
+        """Check the fields and values of the ``sample_size`` newest documents of a collection.
+
+        A field renamed upstream is only missing from documents written after the rename, so
+        the sample is taken from the end of the ``_id`` order rather than the natural order,
+        which starts at the oldest documents. A column counts as missing when none of the
+        sampled documents has it.
+        """
+        collection = mongo_op.get_collection(db_name, collection_name)
+        documents = list(
+            collection.find({}, {MONGO_ID_COLUMN: 0}).sort(MONGO_ID_COLUMN, -1).limit(sample_size)
+        )
+        if not documents:
+            return {"missing_columns": [], "dtype_mismatches": {}}
+        df = pd.DataFrame.from_records(documents)
+        return {
+            "missing_columns": self.get_missing_columns(list(df.columns)),
+            "dtype_mismatches": self.get_value_mismatches(df),
+        }
+
+    @staticmethod
+    def is_valid(check_report: Dict) -> bool:
+        return (
+            not check_report["missing_columns"]
+            and not check_report["dtype_mismatches"]
+            and not check_report.get("empty_columns")
+        )
@@ -0,0 +1,140 @@
+import os
+from datetime import datetime
+
+TIMESTAMP: str = datetime.now().strftime("%m_%d_%Y_%H_%M_%S")
+
+# MongoDB constants
+MONGO_DB_URL_KEY = "MONGO_DB_URL"
+DB_NAME = "shipmentdata"
+COLLECTION_NAME = "ship"
+MONGO_ID_COLUMN = "_id"
+MONGO_MAX_POOL_SIZE = 50
+MONGO_MIN_POOL_SIZE = 0
+MONGO_MAX_IDLE_TIME_MS = 300_000
+MONGO_CONNECT_TIMEOUT_MS = 10_000
+MONGO_SERVER_SELECTION_TIMEOUT_MS = 30_000
+MONGO_SOCKET_TIMEOUT_MS = 300_000
+# Wire compressors in order of preference; ones whose library is missing are skipped by pymongo
+MONGO_COMPRESSORS = "zstd,snappy,zlib"
+
+# Bulk loader constants
+MONGO_BULK_LOAD_CHUNK_SIZE = 50_000
+MONGO_BULK_LOAD_INSERT_BATCH_SIZE = 5_000
+MONGO_BULK_LOAD_MAX_IN_FLIGHT = 4
+
+# Common constants
+TARGET_COLUMN = "Cost"
+CONFIG_DIR = "config"
+SCHEMA_FILE_PATH = os.path.join(CONFIG_DIR, "schema.yaml")
+MODEL_CONFIG_FILE_PATH = os.path.join(CONFIG_DIR, "model.yaml")
+
+ARTIFACTS_ROOT_DIR = "artifacts"
+ARTIFACTS_DIR = os.path.join(ARTIFACTS_ROOT_DIR, TIMESTAMP)
+
+# The feature store outlives a single pipeline run, so it is not timestamped
+FEATURE_STORE_DIR = os.path.join(ARTIFACTS_ROOT_DIR, "feature_store")
+FEATURE_STORE_FILE_PREFIX = "part"
+FEATURE_STORE_FILE_EXTENSION = ".parquet"
+# Leading underscore keeps the file out of Parquet dataset discovery
+FEATURE_STORE_WATERMARK_FILE_NAME = "_watermark.json"
+FEATURE_STORE_FINGERPRINT_FILE_NAME = "_fingerprint.json"
+FEATURE_STORE_DICTIONARIES_DIR_NAME = "_dictionaries"
+FEATURE_STORE_ROW_FINGERPRINTS_DIR_NAME = "_row_fingerprints"
+# Parts that failed validation, moved out of the feature store for inspection
+FEATURE_STORE_QUARANTINE_DIR_NAME = "_quarantine"
+FEATURE_STORE_COMPRESSION = "zstd"
+
+# Data ingestion constants
+DATA_INGESTION_ARTIFACTS_DIR = "DataIngestionArtifacts"
+DATA_INGESTION_STREAMING = True
+DATA_INGESTION_BATCH_SIZE = 10_000
+# Values above 1 read the collection as that many concurrent _id ranges
+DATA_INGESTION_N_WORKERS = 1
+DATA_INGESTION_MAX_PREFETCH_BATCHES = 4
+DATA_INGESTION_USE_CACHE = True
+DATA_INGESTION_INCREMENTAL = True
+# Drop rows identical to a row already in the feature store
+DATA_INGESTION_DEDUPLICATE = True
+DATA_INGESTION_WATERMARK_COLUMN = MONGO_ID_COLUMN
+# Client-generated ObjectIds can commit out of order under concurrent writers, so _id is only
+# read up to this many seconds before now; it must exceed the longest insert of any writer
+DATA_INGESTION_WATERMARK_LAG_SECONDS = 300
+DATA_INGESTION_SPLIT_COLUMN = "Customer Id"
+DATA_INGESTION_TEST_SIZE = 0.2
+DATA_INGESTION_SPLIT_BUCKETS = 10_000
+# Row index directories, with the train or test rows of every feature store part in a file named after it
+DATA_INGESTION_TRAIN_INDEX_DIR_NAME = "train_index"
+DATA_INGESTION_TEST_INDEX_DIR_NAME = "test_index"
+
+# Data validation constants
+DATA_VALIDATION_ARTIFACTS_DIR = "DataValidationArtifacts"
+DATA_VALIDATION_REPORT_FILE_NAME = "report.json"
+DATA_VALIDATION_MAX_EXAMPLES = 5
+# Documents read from the source collection to check its fields before ingestion
+DATA_VALIDATION_PRECHECK_SAMPLE_SIZE = 10
+# Share of rows allowed to break a rule before validation fails
+DATA_VALIDATION_MAX_VIOLATION_RATE = 0.0
+# Share of missing values allowed in a column without an entry under max_missing_rates in
+# schema.yaml. A field renamed or dropped upstream arrives as a column of nulls.
+DATA_VALIDATION_MAX_MISSING_RATE = 0.05
+# "full" checks every row; "sample" checks a stratified sample of row groups and falls back to "full"
+# when a sampled violation rate is too close to DATA_VALIDATION_SAMPLE_MAX_VIOLATION_RATE
+DATA_VALIDATION_MODE = "full"
+# Tolerance of sample mode, which replaces DATA_VALIDATION_MAX_VIOLATION_RATE there. It must
+# be above 0: a sampled upper bound can never reach 0, so a zero tolerance would make every
+# clean batch undecided and escalate it to a full scan. Sample mode rejects 0.
+DATA_VALIDATION_SAMPLE_MAX_VIOLATION_RATE = 0.01
+DATA_VALIDATION_SAMPLE_CONFIDENCE = 0.95
+DATA_VALIDATION_SAMPLE_ERROR = 0.01
+# Sample mode reads whole row groups, one per ingested batch. Rows of a batch tend to share
+# their problems, so a sample spans at least this many row groups; smaller batches are
+# checked in full.
+DATA_VALIDATION_SAMPLE_MIN_ROW_GROUPS = 30
+DATA_VALIDATION_DRIFT_REPORT_FILE_NAME = "drift_report.json"
+DATA_VALIDATION_REFERENCE_SUMMARY_FILE_NAME = "reference_summary.json"
+# The reference of the latest training run, compared against by the next run
+DATA_VALIDATION_REFERENCE_DIR = os.path.join(ARTIFACTS_ROOT_DIR, "drift_reference")
+DATA_VALIDATION_N_BINS = 10
+DATA_VALIDATION_QUANTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+DATA_VALIDATION_PROFILE_FILE_NAME = "profile.json"
+DATA_VALIDATION_HTML_REPORT_FILE_NAME = "report.html"
+# Build the reference summary, profile and HTML report while later stages already run
+DATA_VALIDATION_BACKGROUND_REPORTS = True
+DATA_VALIDATION_N_WORKERS = os.cpu_count() or 1
+# Column checks of smaller batches run inline: starting the spawned worker processes takes
+# longer than checking them. Workers re-import __main__, so scripts running the pipeline
+# with parallel checks must guard it with if __name__ == "__main__":
+DATA_VALIDATION_MIN_PARALLEL_BYTES = 128 * 1024 * 1024
+DATA_VALIDATION_KLL_K = 200
+DATA_VALIDATION_HLL_PRECISION = 14
+# Features with a variance inflation factor above this are reported as multicollinear
+DATA_VALIDATION_VIF_THRESHOLD = 10.0
+DATA_VALIDATION_PSI_THRESHOLD = 0.2
+DATA_VALIDATION_P_VALUE_THRESHOLD = 0.05
+
+# Outlier detection constants
+OUTLIER_DETECTION_ARTIFACTS_DIR = "OutlierDetectionArtifacts"
+OUTLIER_DETECTION_BOUNDS_FILE_NAME = "outlier_bounds.json"
+# "iqr": [Q1 - k * IQR, Q3 + k * IQR]; "mad": median -/+ k * 1.4826 * MAD
+OUTLIER_DETECTION_METHOD = "iqr"
+OUTLIER_DETECTION_IQR_MULTIPLIER = 1.5
+OUTLIER_DETECTION_MAD_MULTIPLIER = 3.5
+OUTLIER_DETECTION_KLL_K = 200
+
+# EDA report constants
+EDA_REPORT_ARTIFACTS_DIR = "EDAReportArtifacts"
+EDA_REPORT_FILE_NAME = "eda_report.json"
+# Reports of earlier runs, reused while the feature store fingerprint is unchanged
+EDA_REPORT_CACHE_DIR = os.path.join(ARTIFACTS_ROOT_DIR, "eda_cache")
+EDA_REPORT_KLL_K = 200
+
+# Power transform constants
+POWER_TRANSFORM_ARTIFACTS_DIR = "PowerTransformArtifacts"
+POWER_TRANSFORM_PARAMS_FILE_NAME = "power_transform.json"
+# Lambdas are fitted on a uniform sample of this many training values per column
+POWER_TRANSFORM_SAMPLE_SIZE = 10000
+# Diagnostic: also fit lambda on every training value and report the difference. Off by
+# default, since each full fit pass transforms every training value 11 times
+POWER_TRANSFORM_COMPARE_FULL_FIT = False
+# Streaming passes of the full fit; each narrows the lambda grid tenfold
+POWER_TRANSFORM_FULL_FIT_PASSES = 3
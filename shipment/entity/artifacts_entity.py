@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class DataIngestionArtifacts:
+    feature_store_path: str
+    n_rows: int
+    fingerprint: str = ""
+    cache_hit: bool = False
+    n_duplicate_rows: int = 0
+    # Parts written by this run, i.e. the batch that is new to downstream stages
+    new_part_file_paths: List[str] = field(default_factory=list)
+    train_index_dir: str = ""
+    test_index_dir: str = ""
+    n_train_rows: int = 0
+    n_test_rows: int = 0
+
+
+@dataclass
+class DataValidationArtifacts:
+    validation_status: bool
+    report_file_path: str
+    # Written in the background, see DataValidation.wait_for_reports
+    reference_summary_file_path: str = ""
+    profile_file_path: str = ""
+    html_report_file_path: str = ""
+    drift_status: bool = False
+    drift_report_file_path: str = ""
+
+
+@dataclass
+class OutlierDetectionArtifacts:
+    bounds_file_path: str
+    # Column -> number of training rows outside the bounds
+    n_outliers: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class PowerTransformArtifacts:
+    params_file_path: str
+    # Column -> fitted lambda minus the lambda of a full fit, when one was made
+    lambda_differences: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class EDAReportArtifacts:
+    report_file_path: str
+    fingerprint: str
+    cache_hit: bool = False
+
+
+@dataclass
+class MongoBulkLoadArtifacts:
+    n_rows: int
+    elapsed_seconds: float
+    rows_per_second: float
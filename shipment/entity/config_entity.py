@@ -0,0 +1,117 @@
+import os
+from dataclasses import dataclass, field
+from typing import List
+
+from shipment.constant import *
+
+
+@dataclass
+class MongoClientConfig:
+    max_pool_size: int = MONGO_MAX_POOL_SIZE
+    min_pool_size: int = MONGO_MIN_POOL_SIZE
+    max_idle_time_ms: int = MONGO_MAX_IDLE_TIME_MS
+    connect_timeout_ms: int = MONGO_CONNECT_TIMEOUT_MS
+    server_selection_timeout_ms: int = MONGO_SERVER_SELECTION_TIMEOUT_MS
+    socket_timeout_ms: int = MONGO_SOCKET_TIMEOUT_MS
+    compressors: str = MONGO_COMPRESSORS
+
+
+@dataclass
+class DataIngestionConfig:
+    db_name: str = DB_NAME
+    collection_name: str = COLLECTION_NAME
+    schema_file_path: str = SCHEMA_FILE_PATH
+    streaming: bool = DATA_INGESTION_STREAMING
+    batch_size: int = DATA_INGESTION_BATCH_SIZE
+    n_workers: int = DATA_INGESTION_N_WORKERS
+    max_prefetch_batches: int = DATA_INGESTION_MAX_PREFETCH_BATCHES
+    use_cache: bool = DATA_INGESTION_USE_CACHE
+    incremental: bool = DATA_INGESTION_INCREMENTAL
+    watermark_column: str = DATA_INGESTION_WATERMARK_COLUMN
+    watermark_lag_seconds: int = DATA_INGESTION_WATERMARK_LAG_SECONDS
+    deduplicate: bool = DATA_INGESTION_DEDUPLICATE
+    split_column: str = DATA_INGESTION_SPLIT_COLUMN
+    test_size: float = DATA_INGESTION_TEST_SIZE
+    feature_store_dir: str = os.path.join(FEATURE_STORE_DIR, COLLECTION_NAME)
+    data_ingestion_artifacts_dir: str = os.path.join(ARTIFACTS_DIR, DATA_INGESTION_ARTIFACTS_DIR)
+    train_index_dir: str = os.path.join(data_ingestion_artifacts_dir, DATA_INGESTION_TRAIN_INDEX_DIR_NAME)
+    test_index_dir: str = os.path.join(data_ingestion_artifacts_dir, DATA_INGESTION_TEST_INDEX_DIR_NAME)
+
+
+@dataclass
+class MongoBulkLoadConfig:
+    db_name: str = DB_NAME
+    collection_name: str = COLLECTION_NAME
+    schema_file_path: str = SCHEMA_FILE_PATH
+    chunk_size: int = MONGO_BULK_LOAD_CHUNK_SIZE
+    insert_batch_size: int = MONGO_BULK_LOAD_INSERT_BATCH_SIZE
+    max_in_flight: int = MONGO_BULK_LOAD_MAX_IN_FLIGHT
+
+
+@dataclass
+class DataValidationConfig:
+    schema_file_path: str = SCHEMA_FILE_PATH
+    max_examples: int = DATA_VALIDATION_MAX_EXAMPLES
+    precheck_sample_size: int = DATA_VALIDATION_PRECHECK_SAMPLE_SIZE
+    max_violation_rate: float = DATA_VALIDATION_MAX_VIOLATION_RATE
+    max_missing_rate: float = DATA_VALIDATION_MAX_MISSING_RATE
+    validation_mode: str = DATA_VALIDATION_MODE
+    sample_max_violation_rate: float = DATA_VALIDATION_SAMPLE_MAX_VIOLATION_RATE
+    sample_confidence: float = DATA_VALIDATION_SAMPLE_CONFIDENCE
+    sample_error: float = DATA_VALIDATION_SAMPLE_ERROR
+    sample_min_row_groups: int = DATA_VALIDATION_SAMPLE_MIN_ROW_GROUPS
+    data_validation_artifacts_dir: str = os.path.join(ARTIFACTS_DIR, DATA_VALIDATION_ARTIFACTS_DIR)
+    report_file_path: str = os.path.join(data_validation_artifacts_dir, DATA_VALIDATION_REPORT_FILE_NAME)
+    drift_report_file_path: str = os.path.join(
+        data_validation_artifacts_dir, DATA_VALIDATION_DRIFT_REPORT_FILE_NAME
+    )
+    reference_summary_file_path: str = os.path.join(
+        data_validation_artifacts_dir, DATA_VALIDATION_REFERENCE_SUMMARY_FILE_NAME
+    )
+    latest_reference_summary_file_path: str = os.path.join(
+        DATA_VALIDATION_REFERENCE_DIR, COLLECTION_NAME, DATA_VALIDATION_REFERENCE_SUMMARY_FILE_NAME
+    )
+    n_bins: int = DATA_VALIDATION_N_BINS
+    quantiles: List[float] = field(default_factory=lambda: list(DATA_VALIDATION_QUANTILES))
+    profile_file_path: str = os.path.join(data_validation_artifacts_dir, DATA_VALIDATION_PROFILE_FILE_NAME)
+    html_report_file_path: str = os.path.join(data_validation_artifacts_dir, DATA_VALIDATION_HTML_REPORT_FILE_NAME)
+    background_reports: bool = DATA_VALIDATION_BACKGROUND_REPORTS
+    n_workers: int = DATA_VALIDATION_N_WORKERS
+    min_parallel_bytes: int = DATA_VALIDATION_MIN_PARALLEL_BYTES
+    kll_k: int = DATA_VALIDATION_KLL_K
+    hll_precision: int = DATA_VALIDATION_HLL_PRECISION
+    vif_threshold: float = DATA_VALIDATION_VIF_THRESHOLD
+    psi_threshold: float = DATA_VALIDATION_PSI_THRESHOLD
+    p_value_threshold: float = DATA_VALIDATION_P_VALUE_THRESHOLD
+
+
+@dataclass
+class OutlierDetectionConfig:
+    schema_file_path: str = SCHEMA_FILE_PATH
+    method: str = OUTLIER_DETECTION_METHOD
+    iqr_multiplier: float = OUTLIER_DETECTION_IQR_MULTIPLIER
+    mad_multiplier: float = OUTLIER_DETECTION_MAD_MULTIPLIER
+    kll_k: int = OUTLIER_DETECTION_KLL_K
+    outlier_detection_artifacts_dir: str = os.path.join(ARTIFACTS_DIR, OUTLIER_DETECTION_ARTIFACTS_DIR)
+    bounds_file_path: str = os.path.join(outlier_detection_artifacts_dir, OUTLIER_DETECTION_BOUNDS_FILE_NAME)
+
+
+@dataclass
+class PowerTransformConfig:
+    schema_file_path: str = SCHEMA_FILE_PATH
+    sample_size: int = POWER_TRANSFORM_SAMPLE_SIZE
+    compare_full_fit: bool = POWER_TRANSFORM_COMPARE_FULL_FIT
+    full_fit_passes: int = POWER_TRANSFORM_FULL_FIT_PASSES
+    power_transform_artifacts_dir: str = os.path.join(ARTIFACTS_DIR, POWER_TRANSFORM_ARTIFACTS_DIR)
+    params_file_path: str = os.path.join(power_transform_artifacts_dir, POWER_TRANSFORM_PARAMS_FILE_NAME)
+
+
+@dataclass
+class EDAReportConfig:
+    schema_file_path: str = SCHEMA_FILE_PATH
+    feature_store_dir: str = os.path.join(FEATURE_STORE_DIR, COLLECTION_NAME)
+    cache_dir: str = os.path.join(EDA_REPORT_CACHE_DIR, COLLECTION_NAME)
+    use_cache: bool = True
+    kll_k: int = EDA_REPORT_KLL_K
+    eda_report_artifacts_dir: str = os.path.join(ARTIFACTS_DIR, EDA_REPORT_ARTIFACTS_DIR)
+    report_file_path: str = os.path.join(eda_report_artifacts_dir, EDA_REPORT_FILE_NAME)
@@ -0,0 +1,21 @@
+import sys
+
+
+def error_message_detail(error: Exception, error_detail: sys) -> str:
+    _, _, exc_tb = error_detail.exc_info()
+    if exc_tb is None:
+        return str(error)
+
+    file_name = exc_tb.tb_frame.f_code.co_filename
+    return "Error occurred in python script name [{0}] line number [{1}] error message [{2}]".format(
+        file_name, exc_tb.tb_lineno, str(error)
+    )
+
+
+class ShippingException(Exception):
+    def __init__(self, error_message: Exception, error_detail: sys):
+        super().__init__(error_message)
+        self.error_message = error_message_detail(error_message, error_detail=error_detail)
+
+    def __str__(self) -> str:
+        return self.error_message
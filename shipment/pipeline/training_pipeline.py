@@ -0,0 +1,143 @@
+import sys
+
+from shipment.components.data_ingestion import DataIngestion
+from shipment.components.data_validation import DataValidation
+from shipment.components.outlier_detection import OutlierDetection
+from shipment.components.power_transform import PowerTransform
+from shipment.configuration.mongo_operations import MongoDBOperation
+from shipment.configuration.schema_precheck import SchemaPreCheck
+from shipment.entity.artifacts_entity import (
+    DataIngestionArtifacts,
+    DataValidationArtifacts,
+    OutlierDetectionArtifacts,
+    PowerTransformArtifacts,
+)
+from shipment.entity.config_entity import (
+    DataIngestionConfig,
+    DataValidationConfig,
+    OutlierDetectionConfig,
+    PowerTransformConfig,
+)
+from shipment.exception import ShippingException
+from shipment.logger import logging
+from shipment.utils.main_utils import MainUtils
+
+
+class TrainPipeline:
+    def __init__(self):
+        self.data_ingestion_config = DataIngestionConfig()
+        self.data_validation_config = DataValidationConfig()
+        self.outlier_detection_config = OutlierDetectionConfig()
+        self.power_transform_config = PowerTransformConfig()
+        self.mongo_op = MongoDBOperation()
+        self.data_ingestion = None
+        self.data_validation = None
+
+    def start_schema_precheck(self) -> None:
+        """Reject a source collection whose fields do not match schema.yaml before exporting it."""
+        logging.info("Entered the start_schema_precheck method of TrainPipeline class")
+        try:
+            schema_config = MainUtils().read_yaml_file(self.data_validation_config.schema_file_path)
+            schema_precheck = SchemaPreCheck(schema_config)
+            check_report = schema_precheck.check_mongo_sample(
+                self.mongo_op,
+                self.data_ingestion_config.db_name,
+                self.data_ingestion_config.collection_name,
+                self.data_validation_config.precheck_sample_size,
+            )
+            if not schema_precheck.is_valid(check_report):
+                raise Exception(f"Source collection does not match the schema: {check_report}")
+
+            logging.info("Exited the start_schema_precheck method of TrainPipeline class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def start_data_ingestion(self) -> DataIngestionArtifacts:
+        logging.info("Entered the start_data_ingestion method of TrainPipeline class")
+        try:
+            # Kept so that run_pipeline can quarantine a batch that fails validation
+            self.data_ingestion = DataIngestion(
+                data_ingestion_config=self.data_ingestion_config, mongo_op=self.mongo_op
+            )
+            data_ingestion_artifacts = self.data_ingestion.initiate_data_ingestion()
+
+            logging.info("Exited the start_data_ingestion method of TrainPipeline class")
+            return data_ingestion_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def start_data_validation(self, data_ingestion_artifacts: DataIngestionArtifacts) -> DataValidationArtifacts:
+        logging.info("Entered the start_data_validation method of TrainPipeline class")
+        try:
+            # Kept so that run_pipeline can wait for the reports rendered in the background
+            self.data_validation = DataValidation(
+                data_ingestion_artifacts=data_ingestion_artifacts,
+                data_validation_config=self.data_validation_config,
+            )
+            data_validation_artifacts = self.data_validation.initiate_data_validation()
+
+            logging.info("Exited the start_data_validation method of TrainPipeline class")
+            return data_validation_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def start_outlier_detection(
+        self, data_ingestion_artifacts: DataIngestionArtifacts
+    ) -> OutlierDetectionArtifacts:
+        logging.info("Entered the start_outlier_detection method of TrainPipeline class")
+        try:
+            outlier_detection = OutlierDetection(
+                data_ingestion_artifacts=data_ingestion_artifacts,
+                outlier_detection_config=self.outlier_detection_config,
+            )
+            outlier_detection_artifacts = outlier_detection.initiate_outlier_detection()
+
+            logging.info("Exited the start_outlier_detection method of TrainPipeline class")
+            return outlier_detection_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def start_power_transform(
+        self,
+        data_ingestion_artifacts: DataIngestionArtifacts,
+        outlier_detection_artifacts: OutlierDetectionArtifacts,
+    ) -> PowerTransformArtifacts:
+        logging.info("Entered the start_power_transform method of TrainPipeline class")
+        try:
+            power_transform = PowerTransform(
+                data_ingestion_artifacts=data_ingestion_artifacts,
+                power_transform_config=self.power_transform_config,
+                outlier_detection_artifacts=outlier_detection_artifacts,
+            )
+            power_transform_artifacts = power_transform.initiate_power_transform()
+
+            logging.info("Exited the start_power_transform method of TrainPipeline class")
+            return power_transform_artifacts
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def run_pipeline(self) -> None:
+        logging.info("Entered the run_pipeline method of TrainPipeline class")
+        try:
+            self.start_schema_precheck()
+            data_ingestion_artifacts = self.start_data_ingestion()
+            data_validation_artifacts = self.start_data_validation(data_ingestion_artifacts)
+            if not data_validation_artifacts.validation_status:
+                self.data_validation.wait_for_reports()
+                self.data_ingestion.quarantine_parts(data_ingestion_artifacts.new_part_file_paths)
+                raise Exception(
+                    f"Data validation failed, see the report at {data_validation_artifacts.report_file_path}"
+                )
+            outlier_detection_artifacts = self.start_outlier_detection(data_ingestion_artifacts)
+            self.start_power_transform(data_ingestion_artifacts, outlier_detection_artifacts)
+            self.data_validation.wait_for_reports()
+
+            logging.info("Exited the run_pipeline method of TrainPipeline class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
@@ -0,0 +1,226 @@
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from scipy import stats
+
+from shipment.exception import ShippingException
+from shipment.logger import logging
+
+# "New Michelle, OH 50777" and military addresses such as "APO AE 89114"
+LOCATION_PATTERN = r"^(?P<city>.+?),? (?P<state>[A-Z]{2}) (?P<zip>\d{5})$"
+# Categories of Customer State, so that its codes are the same in every batch: the states,
+# DC, the territories and the military AA, AE and AP
+STATE_CODES = [
+    "AA", "AE", "AK", "AL", "AP", "AR", "AS", "AZ", "CA", "CO", "CT", "DC", "DE", "FL", "GA", "GU", "HI",
+    "IA", "ID", "IL", "IN", "KS", "KY", "LA", "MA", "MD", "ME", "MI", "MN", "MO", "MP", "MS", "MT", "NC",
+    "ND", "NE", "NH", "NJ", "NM", "NV", "NY", "OH", "OK", "OR", "PA", "PR", "RI", "SC", "SD", "TN", "TX",
+    "UT", "VA", "VI", "VT", "WA", "WI", "WV", "WY",
+]
+
+# Day numbers count days from 1970-01-01, a Thursday; 0000-03-01 is day -719468
+UNIX_EPOCH_WEEKDAY = 3
+CIVIL_EPOCH_OFFSET = 719468
+DAYS_PER_ERA = 146097
+
+
+class FeatureUtils:
+    """Stateless feature derivations shared by training and prediction."""
+
+    @staticmethod
+    def get_codes_and_uniques(series: pd.Series):
+        """Integer codes of ``series`` into its distinct values, -1 for missing values.
+
+        Categorical series, e.g. decoded feature store columns, reuse their categories
+        instead of hashing every row again.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.cat.codes.to_numpy(), pd.Series(series.cat.categories, dtype=object)
+        codes, uniques = pd.factorize(series)
+        return codes, pd.Series(uniques, dtype=object)
+
+    @staticmethod
+    def broadcast_categorical(
+        codes: np.ndarray, unique_values: pd.Series, index: pd.Index, categories: Optional[List[str]] = None
+    ) -> pd.Series:
+        """Categorical of ``unique_values[codes]`` built from codes only; code -1 stays missing.
+
+        Categories are the distinct ``unique_values`` in sorted order, or ``categories`` when
+        given, in which case values outside them are missing too.
+        """
+        if categories is None:
+            categories = sorted(unique_values.dropna().unique())
+        value_codes = pd.Index(categories).get_indexer(unique_values)
+        value_codes = np.append(value_codes, -1)
+        return pd.Series(pd.Categorical.from_codes(value_codes[codes], categories=categories), index=index)
+
+    def parse_customer_location(self, series: pd.Series, zip_prefix_length: int = 3) -> DataFrame:
+        """Split a Customer Location column into city, state and ZIP prefix.
+
+        The regex runs once over the distinct locations and the results are broadcast
+        back to the rows through integer codes. City and state come back as categoricals
+        and the ZIP prefix as int16, with -1 where the location is missing or unparsable.
+        Military addresses such as "APO AE 89114" give the city APO and the state AE.
+        State categories are pinned to ``STATE_CODES``, so their codes are stable. City
+        categories are the sorted cities of ``series`` and differ between batches: encode
+        the city by its label, e.g. with ``DictionaryOperation``, never by its code.
+        """
+        logging.info("Entered the parse_customer_location method of FeatureUtils class")
+        try:
+            codes, uniques = self.get_codes_and_uniques(series)
+            parsed = uniques.astype("str").str.extract(LOCATION_PATTERN)
+
+            zip_prefix = pd.to_numeric(parsed["zip"].str[:zip_prefix_length], errors="coerce")
+            zip_prefix = np.append(zip_prefix.fillna(-1).to_numpy(dtype=np.int16), np.int16(-1))
+            result = DataFrame(
+                {
+                    "Customer City": self.broadcast_categorical(codes, parsed["city"], series.index),
+                    "Customer State": self.broadcast_categorical(
+                        codes, parsed["state"], series.index, categories=STATE_CODES
+                    ),
+                    "Customer Zip Prefix": zip_prefix[codes],
+                },
+                index=series.index,
+            )
+
+            logging.info("Exited the parse_customer_location method of FeatureUtils class")
+            return result
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    @staticmethod
+    def get_day_numbers(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Days since 1970-01-01 of a datetime series as int64, and the mask of missing dates."""
+        missing = series.isna().to_numpy()
+        days = series.to_numpy().astype("datetime64[D]").astype(np.int64)
+        return np.where(missing, 0, days), missing
+
+    @staticmethod
+    def get_civil_dates(days: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Year, month and day of int64 day numbers, in integer arithmetic (Hinnant's civil_from_days).
+
+        Years are counted from March so that the leap day falls at the end of the year.
+        """
+        shifted = days + CIVIL_EPOCH_OFFSET
+        era = shifted // DAYS_PER_ERA
+        day_of_era = shifted - era * DAYS_PER_ERA
+        year_of_era = (
+            day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // (DAYS_PER_ERA - 1)
+        ) // 365
+        day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+        month_from_march = (5 * day_of_year + 2) // 153
+        day = day_of_year - (153 * month_from_march + 2) // 5 + 1
+        month = np.where(month_from_march < 10, month_from_march + 3, month_from_march - 9)
+        year = year_of_era + era * 400 + (month <= 2)
+        return year, month, day
+
+    @staticmethod
+    def get_new_year_day_numbers(year: np.ndarray) -> np.ndarray:
+        """Day numbers of January 1 of ``year``; the inverse of ``get_civil_dates`` for that day."""
+        march_year = year - 1
+        era = march_year // 400
+        year_of_era = march_year - era * 400
+        # January 1 is day 306 of a year counted from March
+        day_of_era = 365 * year_of_era + year_of_era // 4 - year_of_era // 100 + 306
+        return era * DAYS_PER_ERA + day_of_era - CIVIL_EPOCH_OFFSET
+
+    def get_date_features(self, scheduled: pd.Series, delivery: pd.Series) -> DataFrame:
+        """Calendar and delivery lag features of the scheduled and delivery dates.
+
+        Dates are turned into int64 day numbers once and every feature is integer
+        arithmetic over whole arrays, so no per-row datetime objects are created and
+        the same code serves training and prediction. Weekdays run from Monday = 0 and
+        weeks are ISO weeks. Features are nullable and missing where a date is missing.
+        """
+        logging.info("Entered the get_date_features method of FeatureUtils class")
+        try:
+            scheduled_days, scheduled_missing = self.get_day_numbers(scheduled)
+            delivery_days, delivery_missing = self.get_day_numbers(delivery)
+            lag_missing = scheduled_missing | delivery_missing
+            lag = delivery_days - scheduled_days
+
+            weekday = (scheduled_days + UNIX_EPOCH_WEEKDAY) % 7
+            year, month, _ = self.get_civil_dates(scheduled_days)
+            # An ISO week belongs to the year of its Thursday
+            thursday = scheduled_days - weekday + 3
+            thursday_year, _, _ = self.get_civil_dates(thursday)
+            week = (thursday - self.get_new_year_day_numbers(thursday_year)) // 7 + 1
+
+            result = DataFrame(
+                {
+                    "Delivery Lag Days": pd.arrays.IntegerArray(lag.astype(np.int32), lag_missing),
+                    "Scheduled Weekday": pd.arrays.IntegerArray(weekday.astype(np.int8), scheduled_missing),
+                    "Scheduled Week": pd.arrays.IntegerArray(week.astype(np.int8), scheduled_missing),
+                    "Scheduled Month": pd.arrays.IntegerArray(month.astype(np.int8), scheduled_missing),
+                    "Scheduled Year": pd.arrays.IntegerArray(year.astype(np.int16), scheduled_missing),
+                    "Early Delivery": pd.arrays.BooleanArray(lag < 0, lag_missing),
+                    "Late Delivery": pd.arrays.BooleanArray(lag > 0, lag_missing),
+                },
+                index=scheduled.index,
+            )
+
+            logging.info("Exited the get_date_features method of FeatureUtils class")
+            return result
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    @staticmethod
+    def cap_outliers(df: DataFrame, bounds: Dict[str, Dict]) -> DataFrame:
+        """Clip the columns of ``df`` to fitted outlier bounds in place; a constant cost per row.
+
+        ``bounds`` is the ``columns`` section of the outlier bounds artifact. Columns of
+        ``bounds`` missing from ``df`` are skipped.
+        """
+        for column, column_bounds in bounds.items():
+            if column in df.columns:
+                df[column] = df[column].clip(lower=column_bounds["lower"], upper=column_bounds["upper"])
+        return df
+
+    @staticmethod
+    def power_transform(df: DataFrame, params: Dict[str, Dict]) -> DataFrame:
+        """Yeo-Johnson transform and standardize the columns of ``df`` in place with fitted parameters.
+
+        ``params`` is the ``columns`` section of the power transform artifact. Columns fitted
+        on capped values, whose parameters hold ``lower`` and ``upper``, are capped the same
+        way first. Columns of ``params`` missing from ``df`` are skipped.
+        """
+        for column, column_params in params.items():
+            if column in df.columns:
+                values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                if "lower" in column_params:
+                    values = np.clip(values, column_params["lower"], column_params["upper"])
+                transformed = stats.yeojohnson(values, column_params["lambda"])
+                df[column] = (transformed - column_params["mean"]) / column_params["std"]
+        return df
+
+    @staticmethod
+    def get_variance_inflation_factors(
+        correlation: np.ndarray, columns: List[str]
+    ) -> Dict[str, Optional[float]]:
+        """VIF of every column at once, as the diagonal of the inverse correlation matrix.
+
+        VIF_j = 1 / (1 - R_j^2), where R_j^2 comes from regressing column j on all the other
+        columns; this equals the j-th diagonal entry of the inverse correlation matrix.
+        Constant columns get None. The columns of a perfectly collinear set, those loading on
+        an eigenvector with a zero eigenvalue, get infinity; the others keep their VIF, from
+        the pseudo-inverse, which still regresses them on the span of the collinear set.
+        """
+        usable = ~np.isnan(np.diag(correlation))
+        vifs = {column: None for column in columns}
+        if not usable.any():
+            return vifs
+
+        matrix = correlation[np.ix_(usable, usable)]
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        # The rank tolerance of np.linalg.matrix_rank
+        singular = eigenvalues <= eigenvalues.max() * len(matrix) * np.finfo(np.float64).eps
+        diagonal = eigenvectors[:, ~singular] ** 2 @ (1 / eigenvalues[~singular])
+        collinear = (np.abs(eigenvectors[:, singular]) > np.sqrt(np.finfo(np.float64).eps)).any(axis=1)
+        diagonal[collinear] = np.inf
+        for column, vif in zip(np.array(columns)[usable], diagonal):
+            vifs[str(column)] = float(vif)
+        return vifs
@@ -0,0 +1,183 @@
+import json
+import os
+import sys
+from typing import Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+import yaml
+from pandas import DataFrame
+
+from shipment.exception import ShippingException
+from shipment.logger import logging
+
+BOOL_VALUES = {"Yes": True, "No": False, True: True, False: False}
+
+# dtypes used by pd.read_csv for each schema.yaml type. Dates and flags are read as
+# categories so that converting them only touches each distinct value once.
+CSV_DTYPES = {
+    "float": "float32",
+    "double": "float64",
+    "string": "str",
+    "encoded": "str",
+    "category": "category",
+    "date": "category",
+    "bool": "category",
+}
+
+
+class MainUtils:
+    def read_yaml_file(self, filename: str) -> Dict:
+        logging.info("Entered the read_yaml_file method of MainUtils class")
+        try:
+            with open(filename, "rb") as yaml_file:
+                content = yaml.safe_load(yaml_file)
+
+            logging.info("Exited the read_yaml_file method of MainUtils class")
+            return content
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def read_json_file(self, filename: str) -> Dict:
+        logging.info("Entered the read_json_file method of MainUtils class")
+        try:
+            with open(filename, "r") as json_file:
+                content = json.load(json_file)
+
+            logging.info("Exited the read_json_file method of MainUtils class")
+            return content
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def write_json_file(self, filename: str, content: Dict) -> None:
+        """Write ``content`` to ``filename`` atomically so a crash never leaves a partial file."""
+        logging.info("Entered the write_json_file method of MainUtils class")
+        try:
+            dir_name = os.path.dirname(filename)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
+
+            tmp_filename = filename + ".tmp"
+            with open(tmp_filename, "w") as json_file:
+                json.dump(content, json_file, indent=4, default=str)
+            os.replace(tmp_filename, filename)
+
+            logging.info("Exited the write_json_file method of MainUtils class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def write_text_file(self, filename: str, content: str) -> None:
+        """Write ``content`` to ``filename`` atomically so a crash never leaves a partial file."""
+        logging.info("Entered the write_text_file method of MainUtils class")
+        try:
+            dir_name = os.path.dirname(filename)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
+
+            tmp_filename = filename + ".tmp"
+            with open(tmp_filename, "w", encoding="utf-8") as text_file:
+                text_file.write(content)
+            os.replace(tmp_filename, filename)
+
+            logging.info("Exited the write_text_file method of MainUtils class")
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def map_unique_values(self, series: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+        """Apply ``func`` to the distinct values of ``series`` only and broadcast the result back.
+
+        Shipment columns such as dates repeat heavily, so this is much cheaper than
+        converting every element. Missing values stay missing.
+        """
+        codes, uniques = pd.factorize(series)
+        converted = pd.Series(func(pd.Series(uniques, dtype=object))).reset_index(drop=True)
+        result = converted.reindex(codes)
+        result.index = series.index
+        return result
+
+    def cast_dataframe(self, df: DataFrame, schema_config: Dict, float_dtype: str = "float32") -> DataFrame:
+        """Convert the columns of ``df`` in place to the types declared in schema.yaml.
+
+        Values that cannot be converted become missing. Columns of ``df`` that are not in
+        the schema are left untouched. ``float_dtype`` is used for ``float`` columns; pass
+        float64 where values must round-trip exactly, e.g. when writing to MongoDB.
+        """
+        try:
+            date_format = schema_config["date_format"]
+            for column, column_type in schema_config["columns"].items():
+                if column not in df.columns:
+                    continue
+
+                if column_type == "float":
+                    df[column] = pd.to_numeric(df[column], errors="coerce").astype(float_dtype)
+                elif column_type == "double":
+                    df[column] = pd.to_numeric(df[column], errors="coerce").astype("float64")
+                elif column_type == "category":
+                    df[column] = df[column].astype("category")
+                elif column_type == "date":
+                    df[column] = self.map_unique_values(
+                        df[column], lambda values: pd.to_datetime(values, format=date_format, errors="coerce")
+                    )
+                elif column_type == "bool":
+                    df[column] = self.map_unique_values(
+                        df[column], lambda values: values.map(BOOL_VALUES).astype("boolean")
+                    )
+
+            return df
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def get_csv_read_options(
+        self, schema_config: Dict, columns: Optional[List[str]] = None, float_dtype: str = "float32"
+    ) -> Dict:
+        columns = columns or list(schema_config["columns"])
+        csv_dtypes = {**CSV_DTYPES, "float": float_dtype}
+        return {
+            "usecols": columns,
+            "dtype": {column: csv_dtypes[schema_config["columns"][column]] for column in columns},
+        }
+
+    def read_csv_typed(
+        self,
+        filename: str,
+        schema_config: Dict,
+        columns: Optional[List[str]] = None,
+        float_dtype: str = "float32",
+    ) -> DataFrame:
+        """Read ``columns`` of a shipment CSV with the dtypes declared in schema.yaml.
+
+        Numerics load as float32, low-cardinality text as category, Yes/No flags as
+        nullable booleans and dates with the fixed ``date_format``, so nothing is inferred
+        per element.
+        """
+        logging.info("Entered the read_csv_typed method of MainUtils class")
+        try:
+            df = pd.read_csv(filename, **self.get_csv_read_options(schema_config, columns, float_dtype))
+            df = self.cast_dataframe(df, schema_config, float_dtype)
+
+            logging.info("Exited the read_csv_typed method of MainUtils class")
+            return df
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
+
+    def iter_csv_typed(
+        self,
+        filename: str,
+        schema_config: Dict,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        float_dtype: str = "float32",
+    ) -> Iterator[DataFrame]:
+        """Chunked version of ``read_csv_typed``."""
+        try:
+            read_options = self.get_csv_read_options(schema_config, columns, float_dtype)
+            for chunk in pd.read_csv(filename, chunksize=chunksize, **read_options):
+                yield self.cast_dataframe(chunk, schema_config, float_dtype)
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
@@ -0,0 +1,175 @@
+import html
+import sys
+from typing import Dict, List, Optional
+
+from shipment.exception import ShippingException
+from shipment.logger import logging
+
+REPORT_STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; margin-bottom: 2em; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+.fail { color: #b00020; font-weight: bold; }
+.pass { color: #1b5e20; font-weight: bold; }
+.chart { display: inline-block; margin: 0 2em 2em 0; }
+"""
+
+
+class ReportUtils:
+    """Render the JSON validation artifacts as a single self-contained HTML page."""
+
+    @staticmethod
+    def format_value(value) -> str:
+        if isinstance(value, bool):
+            return "yes" if value else "no"
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        return html.escape(str(value)) if value is not None else ""
+
+    def render_table(self, headers: List[str], rows: List[List]) -> str:
+        head = "".join(f"<th>{html.escape(header)}</th>" for header in headers)
+        body = "".join(
+            "<tr>" + "".join(f"<td>{self.format_value(value)}</td>" for value in row) + "</tr>" for row in rows
+        )
+        return f"<table><tr>{head}</tr>{body}</table>"
+
+    @staticmethod
+    def render_bar_chart(title: str, labels: List[str], reference: List[float], batch: List[float]) -> str:
+        """Inline SVG of the reference and batch shares of each bin, side by side."""
+        width, height, bar_width = 24 * len(labels) + 20, 120, 10
+        reference_total, batch_total = max(sum(reference), 1), max(sum(batch), 1)
+        reference_shares = [count / reference_total for count in reference]
+        batch_shares = [count / batch_total for count in batch]
+        scale = (height - 20) / max(reference_shares + batch_shares + [1e-9])
+        bars = []
+        for position, (label, reference_share, batch_share) in enumerate(
+            zip(labels, reference_shares, batch_shares)
+        ):
+            x = 10 + 24 * position
+            for offset, share, color in ((0, reference_share, "#90a4ae"), (bar_width, batch_share, "#e65100")):
+                bar_height = share * scale
+                bars.append(
+                    f'<rect x="{x + offset}" y="{height - bar_height:.1f}" width="{bar_width}" '
+                    f'height="{bar_height:.1f}" fill="{color}"><title>{html.escape(str(label))}: '
+                    f"{share:.1%}</title></rect>"
+                )
+        return (
+            f'<div class="chart"><div>{html.escape(title)}</div>'
+            f'<svg width="{width}" height="{height}">{"".join(bars)}</svg></div>'
+        )
+
+    def render_validation_report(
+        self, report: Dict, drift_report: Optional[Dict] = None, profile: Optional[Dict] = None
+    ) -> str:
+        """HTML page with the validation outcome, the drift tests and histograms, and the data profile."""
+        logging.info("Entered the render_validation_report method of ReportUtils class")
+        try:
+            status = "pass" if report["validation_status"] else "fail"
+            sections = [
+                f'<h1>Data validation report</h1><p>Validation: <span class="{status}">{status}</span>, '
+                f"{report['n_rows']} rows</p>",
+                "<h2>Rules</h2>",
+                self.render_table(
+                    ["column", "min", "max", "below min", "above max"],
+                    [
+                        [column, counts.get("min"), counts.get("max"), counts["below_min"], counts["above_max"]]
+                        for column, counts in report["ranges"].items()
+                    ],
+                ),
+                self.render_table(
+                    ["column", "invalid values", "examples"],
+                    [
+                        [column, counts["n_invalid"], ", ".join(map(str, counts["examples"]))]
+                        for column, counts in report["allowed_values"].items()
+                    ],
+                ),
+                self.render_table(
+                    ["column", "missing values", "max missing rate"],
+                    [
+                        [column, counts["n_missing"], counts["max_rate"]]
+                        for column, counts in report["missing_values"].items()
+                    ],
+                ),
+            ]
+            if report["files"]:
+                sections.append(
+                    self.render_table(
+                        ["file", "missing columns", "dtype mismatches", "empty columns"],
+                        [
+                            [
+                                file_name,
+                                ", ".join(file_report["missing_columns"]),
+                                file_report["dtype_mismatches"],
+                                ", ".join(file_report.get("empty_columns", [])),
+                            ]
+                            for file_name, file_report in report["files"].items()
+                        ],
+                    )
+                )
+
+            if drift_report is not None:
+                status = "fail" if drift_report["drift_status"] else "pass"
+                drift = "yes" if drift_report["drift_status"] else "no"
+                sections.append(
+                    f'<h2>Drift</h2><p>Drift: <span class="{status}">{drift}</span>, '
+                    f"{drift_report['n_batch_rows']} batch rows against {drift_report['n_reference_rows']} "
+                    "reference rows</p>"
+                )
+                sections.append(
+                    self.render_table(
+                        ["column", "PSI", "statistic", "p-value", "drift"],
+                        [
+                            [
+                                column,
+                                column_report["psi"],
+                                column_report.get("ks_statistic", column_report.get("chi2_statistic")),
+                                column_report["p_value"],
+                                column_report["drift"],
+                            ]
+                            for column, column_report in drift_report["columns"].items()
+                        ],
+                    )
+                )
+                sections.extend(
+                    self.render_bar_chart(
+                        column,
+                        column_report["bins"],
+                        column_report["reference_counts"],
+                        column_report["batch_counts"],
+                    )
+                    for column, column_report in drift_report["columns"].items()
+                    if "bins" in column_report
+                )
+
+            if profile is not None:
+                sections.append(f"<h2>Profile</h2><p>{profile['n_rows']} rows</p>")
+                sections.append(
+                    self.render_table(
+                        ["column", "null rate", "zero rate", "negatives", "min", "median", "max", "distinct"],
+                        [
+                            [
+                                column,
+                                column_profile["null_rate"],
+                                column_profile.get("zero_rate"),
+                                column_profile.get("n_negative"),
+                                column_profile.get("min"),
+                                column_profile.get("median"),
+                                column_profile.get("max"),
+                                column_profile.get("n_distinct"),
+                            ]
+                            for column, column_profile in profile["columns"].items()
+                        ],
+                    )
+                )
+
+            page = (
+                f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Data validation report</title>"
+                f"<style>{REPORT_STYLE}</style></head><body>{''.join(sections)}</body></html>"
+            )
+
+            logging.info("Exited the render_validation_report method of ReportUtils class")
+            return page
+
+        except Exception as e:
+            raise ShippingException(e, sys) from e
@@ -0,0 +1,271 @@
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import stats
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Values are kept in levels of compactors; an item at level ``h`` stands for ``2 ** h``
+    input values. When a level outgrows its capacity it is sorted and every other item,
+    starting at a random offset, is promoted to the next level. Memory is O(k log(n / k))
+    and the rank error is roughly 1.7 / k, whatever the number of values.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self.rng = np.random.default_rng(seed)
+
+    def get_capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.get_capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                # An odd item out stays behind so that total weight is preserved exactly
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                items = items[: len(items) - len(keep)]
+                promoted = items[self.rng.integers(2) :: 2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Add ``values``; NaNs are ignored."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold ``other`` into this sketch; sketches of disjoint partitions merge into one of the union."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.compress()
+        return self
+
+    def get_quantiles(self, fractions: Sequence[float]) -> List[float]:
+        if self.n == 0:
+            return [float("nan")] * len(fractions)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0**h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative_weights = items[order], np.cumsum(weights[order])
+        ranks = np.asarray(fractions, dtype=np.float64) * cumulative_weights[-1]
+        positions = np.minimum(np.searchsorted(cumulative_weights, ranks, side="left"), len(items) - 1)
+        return items[positions].tolist()
+
+    def to_dict(self, fractions: Sequence[float]) -> Dict:
+        min_value = min((level.min() for level in self.levels if len(level)), default=float("nan"))
+        max_value = max((level.max() for level in self.levels if len(level)), default=float("nan"))
+        return {
+            "count": self.n,
+            "quantiles": dict(zip(map(str, fractions), self.get_quantiles(fractions))),
+            "median": self.get_quantiles([0.5])[0],
+            # Only retained items are seen, so the extremes are approximate as well
+            "approx_min": float(min_value),
+            "approx_max": float(max_value),
+        }
+
+
+def count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Leading zero bits of non-zero uint64 ``values``, by vectorized binary search."""
+    values = values.copy()
+    zeros = np.zeros(len(values), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        top_bits_clear = values < (np.uint64(1) << np.uint64(64 - shift))
+        zeros[top_bits_clear] += shift
+        values[top_bits_clear] <<= np.uint64(shift)
+    return zeros
+
+
+class HyperLogLog:
+    """Mergeable distinct count sketch (Flajolet et al., 2007) over 64-bit hashes.
+
+    Uses ``2 ** precision`` one-byte registers; the standard error is about
+    1.04 / sqrt(2 ** precision), i.e. 0.8% at the default precision of 14.
+    """
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.n_registers = 1 << precision
+        self.registers = np.zeros(self.n_registers, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray) -> None:
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return
+        register_index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        # A sentinel bit below the remaining bits caps the rank when they are all zero
+        remaining = (hashes << np.uint64(self.precision)) | (np.uint64(1) << np.uint64(self.precision - 1))
+        ranks = count_leading_zeros(remaining) + 1
+        np.maximum.at(self.registers, register_index, ranks)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def get_count(self) -> float:
+        m = self.n_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        n_empty = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and n_empty:
+            # Linear counting is more accurate while many registers are still empty
+            estimate = m * np.log(m / n_empty)
+        return float(estimate)
+
+
+class CovarianceAccumulator:
+    """Mergeable running means and co-moments of a fixed set of columns (Chan et al., 1979).
+
+    Rows with a missing value in any column are skipped, so every pair of columns is
+    estimated over the same rows and the correlation matrix stays positive semi-definite.
+    """
+
+    def __init__(self, n_columns: int):
+        self.n = 0
+        self.mean = np.zeros(n_columns)
+        self.comoment = np.zeros((n_columns, n_columns))
+
+    def merge_moments(self, n: int, mean: np.ndarray, comoment: np.ndarray) -> None:
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self.mean
+        self.comoment += comoment + np.outer(delta, delta) * self.n * n / total
+        self.mean += delta * n / total
+        self.n = total
+
+    def update(self, values: np.ndarray) -> None:
+        """Add the rows of a 2-d float array with one column per accumulated column."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return
+        mean = values.mean(axis=0)
+        centered = values - mean
+        self.merge_moments(len(values), mean, centered.T @ centered)
+
+    def merge(self, other: "CovarianceAccumulator") -> "CovarianceAccumulator":
+        self.merge_moments(other.n, other.mean, other.comoment)
+        return self
+
+    def get_correlation(self) -> np.ndarray:
+        """Pearson correlation matrix; NaN in the rows and columns of constant columns."""
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.comoment / np.outer(std, std)
+
+
+class ReservoirSample:
+    """Uniform sample of at most ``size`` values of a stream.
+
+    Every value gets a random priority and the ``size`` smallest are kept, which gives
+    each value the same chance of being sampled, chunk by chunk and across merges.
+    """
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        self.size = size
+        self.n = 0
+        self.values = np.empty(0, dtype=np.float64)
+        self.priorities = np.empty(0, dtype=np.float64)
+        self.rng = np.random.default_rng(seed)
+
+    def keep_smallest(self, values: np.ndarray, priorities: np.ndarray) -> None:
+        if len(values) > self.size:
+            keep = np.argpartition(priorities, self.size)[: self.size]
+            values, priorities = values[keep], priorities[keep]
+        self.values, self.priorities = values, priorities
+
+    def update(self, values: np.ndarray) -> None:
+        """Add ``values``; NaNs are ignored."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.keep_smallest(
+            np.concatenate([self.values, values]),
+            np.concatenate([self.priorities, self.rng.random(len(values))]),
+        )
+
+    def merge(self, other: "ReservoirSample") -> "ReservoirSample":
+        self.n += other.n
+        self.keep_smallest(
+            np.concatenate([self.values, other.values]), np.concatenate([self.priorities, other.priorities])
+        )
+        return self
+
+
+class YeoJohnsonLikelihood:
+    """Streaming Yeo-Johnson log-likelihood of a column over a fixed grid of lambdas.
+
+    For every lambda the running mean and second moment of the transformed values are
+    kept (Chan et al., 1979), plus the sum of sign(x) * log1p(|x|); together they give
+    the profile log-likelihood that scipy maximizes, without holding the column.
+    """
+
+    def __init__(self, lambdas: np.ndarray):
+        self.lambdas = np.asarray(lambdas, dtype=np.float64)
+        self.n = 0
+        self.mean = np.zeros(len(self.lambdas))
+        self.moment = np.zeros(len(self.lambdas))
+        self.log_sum = 0.0
+
+    def merge_moments(self, n: int, mean: np.ndarray, moment: np.ndarray, log_sum: float) -> None:
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self.mean
+        self.moment += moment + delta**2 * self.n * n / total
+        self.mean += delta * n / total
+        self.n = total
+        self.log_sum += log_sum
+
+    def update(self, values: np.ndarray) -> None:
+        """Add ``values``; NaNs are ignored."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        mean, moment = np.empty(len(self.lambdas)), np.empty(len(self.lambdas))
+        for position, lmbda in enumerate(self.lambdas):
+            transformed = stats.yeojohnson(values, lmbda)
+            mean[position] = transformed.mean()
+            moment[position] = np.sum((transformed - mean[position]) ** 2)
+        self.merge_moments(len(values), mean, moment, float(np.sum(np.sign(values) * np.log1p(np.abs(values)))))
+
+    def merge(self, other: "YeoJohnsonLikelihood") -> "YeoJohnsonLikelihood":
+        self.merge_moments(other.n, other.mean, other.moment, other.log_sum)
+        return self
+
+    def get_log_likelihood(self) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            return -self.n / 2 * np.log(self.moment / self.n) + (self.lambdas - 1) * self.log_sum
+
+    def get_lambda(self) -> float:
+        """Lambda of the highest log-likelihood, refined by a parabola through the best grid point."""
+        log_likelihood = self.get_log_likelihood()
+        best = int(np.nanargmax(log_likelihood))
+        if 0 < best < len(self.lambdas) - 1:
+            before, at, after = log_likelihood[best - 1 : best + 2]
+            curvature = before - 2 * at + after
+            if curvature < 0:
+                step = self.lambdas[best + 1] - self.lambdas[best]
+                return float(self.lambdas[best] + step * (before - after) / (2 * curvature))
+        return float(self.lambdas[best])
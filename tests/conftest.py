@@ -0,0 +1,54 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from shipment.components.data_ingestion import DataIngestion
+from shipment.configuration.mongo_operations import MongoDBOperation
+from shipment.entity.config_entity import DataIngestionConfig
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SCHEMA_FILE_PATH = str(ROOT_DIR / "config" / "schema.yaml")
+DB_NAME = "shipmentdata"
+COLLECTION_NAME = "ship"
+
+
+@pytest.fixture(scope="session")
+def shipment_df() -> pd.DataFrame:
+    return pd.read_csv(ROOT_DIR / "data" / "train.csv").sample(frac=1, random_state=1)
+
+
+@pytest.fixture
+def mongo_op() -> MongoDBOperation:
+    mongomock = pytest.importorskip("mongomock")
+    return MongoDBOperation(client=mongomock.MongoClient())
+
+
+@pytest.fixture
+def data_ingestion_config(tmp_path) -> DataIngestionConfig:
+    return DataIngestionConfig(
+        db_name=DB_NAME,
+        collection_name=COLLECTION_NAME,
+        schema_file_path=SCHEMA_FILE_PATH,
+        batch_size=500,
+        # mongomock ids are generated just now, so no lag or nothing would be read
+        watermark_lag_seconds=0,
+        feature_store_dir=str(tmp_path / "feature_store"),
+        data_ingestion_artifacts_dir=str(tmp_path / "ingestion"),
+        train_index_dir=str(tmp_path / "ingestion" / "train_index"),
+        test_index_dir=str(tmp_path / "ingestion" / "test_index"),
+    )
+
+
+@pytest.fixture
+def ingest(mongo_op, data_ingestion_config):
+    """Insert ``df`` into the collection, if given, then run data ingestion with ``kwargs`` set on the config."""
+
+    def ingest(df: pd.DataFrame = None, **kwargs):
+        if df is not None:
+            mongo_op.insert_dataframe_as_record(df, DB_NAME, COLLECTION_NAME)
+        data_ingestion = DataIngestion(replace(data_ingestion_config, **kwargs), mongo_op)
+        return data_ingestion, data_ingestion.initiate_data_ingestion()
+
+    return ingest
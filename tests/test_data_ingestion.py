@@ -0,0 +1,124 @@
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+
+import pyarrow.parquet as pq
+from bson import ObjectId
+
+from shipment.entity.artifacts_entity import DataIngestionArtifacts
+from tests.conftest import COLLECTION_NAME, DB_NAME
+
+
+def get_old_ids(n: int, age: timedelta = timedelta(hours=1)) -> list:
+    timestamp = int((datetime.now(timezone.utc) - age).timestamp())
+    return [ObjectId(f"{timestamp:08x}{i:016x}") for i in range(n)]
+
+
+def test_incremental_ingestion_appends_only_new_documents(ingest, shipment_df):
+    data_ingestion, artifacts = ingest(shipment_df.iloc[:1_000])
+    assert artifacts.n_rows == 1_000
+    first_watermark = data_ingestion.read_watermark()
+
+    data_ingestion, artifacts = ingest(shipment_df.iloc[1_000:1_400])
+    assert artifacts.n_rows == 400
+    assert [os.path.basename(path) for path in artifacts.new_part_file_paths] == ["part-00001.parquet"]
+
+    watermark = data_ingestion.read_watermark()
+    assert watermark["parts"] == ["part-00000.parquet", "part-00001.parquet"]
+    assert ObjectId(watermark["watermark"]["value"]) > ObjectId(first_watermark["watermark"]["value"])
+
+    _, artifacts = ingest()
+    assert artifacts.cache_hit
+
+
+def test_parts_missing_from_the_watermark_are_removed(ingest, shipment_df):
+    data_ingestion, _ = ingest(shipment_df.iloc[:1_000])
+    # A run that wrote its part but died before recording the watermark
+    orphan_file_path = data_ingestion.get_feature_store_file_path(1)
+    shutil.copy(data_ingestion.get_feature_store_file_path(0), orphan_file_path)
+
+    data_ingestion, artifacts = ingest(shipment_df.iloc[1_000:1_200])
+
+    # The orphan is deleted before the new part takes its number
+    assert artifacts.n_rows == 200
+    assert pq.ParquetFile(orphan_file_path).metadata.num_rows == 200
+    assert data_ingestion.read_watermark()["parts"] == ["part-00000.parquet", "part-00001.parquet"]
+
+
+def test_documents_inside_the_lag_wait_for_a_later_run(ingest, mongo_op, shipment_df):
+    old_df = shipment_df.iloc[:600].assign(_id=get_old_ids(600))
+    mongo_op.insert_dataframe_as_record(old_df, DB_NAME, COLLECTION_NAME)
+    data_ingestion, artifacts = ingest(shipment_df.iloc[600:800], watermark_lag_seconds=300)
+
+    assert artifacts.n_rows == 600
+    assert data_ingestion.has_documents_after_cutoff()
+    assert not os.path.exists(data_ingestion.fingerprint_file_path)
+
+    # Once the fresh documents are older than the lag they are picked up above the watermark
+    data_ingestion, artifacts = ingest(watermark_lag_seconds=0)
+
+    assert not artifacts.cache_hit
+    assert artifacts.n_rows == 200
+    assert os.path.exists(data_ingestion.fingerprint_file_path)
+
+
+def test_quarantined_parts_leave_the_store_and_are_not_fetched_again(ingest, shipment_df):
+    ingest(shipment_df.iloc[:1_000])
+    data_ingestion, artifacts = ingest(shipment_df.iloc[1_000:1_300])
+    watermark = data_ingestion.read_watermark()
+
+    data_ingestion.quarantine_parts(artifacts.new_part_file_paths)
+
+    quarantine_dir = os.path.join(data_ingestion.data_ingestion_config.feature_store_dir, "_quarantine")
+    assert [file_name.endswith("-part-00001.parquet") for file_name in os.listdir(quarantine_dir)] == [True]
+    assert data_ingestion.read_watermark() == {**watermark, "parts": ["part-00000.parquet"]}
+
+    data_ingestion, artifacts = ingest(shipment_df.iloc[1_300:1_500])
+    assert artifacts.n_rows == 200
+    assert [os.path.basename(path) for path in data_ingestion.get_feature_store_parts()] == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+    ]
+
+
+def test_quarantining_every_part_forces_a_full_export(ingest, shipment_df):
+    data_ingestion, artifacts = ingest(shipment_df.iloc[:500])
+
+    data_ingestion.quarantine_parts(artifacts.new_part_file_paths)
+
+    assert data_ingestion.get_feature_store_parts() == []
+    assert data_ingestion.read_watermark() is None
+    assert not os.path.exists(data_ingestion.fingerprint_file_path)
+
+
+def test_split_indexes_only_new_parts_and_keeps_customers_on_one_side(ingest, shipment_df):
+    data_ingestion, artifacts = ingest(shipment_df.iloc[:1_000])
+    config = data_ingestion.data_ingestion_config
+    first_index_file_path = os.path.join(config.train_index_dir, "part-00000.parquet")
+    first_index = pq.read_table(first_index_file_path)
+    first_modified = os.stat(first_index_file_path).st_mtime_ns
+
+    data_ingestion, artifacts = ingest(shipment_df.iloc[1_000:1_400])
+
+    # The first part keeps its index file; only the appended part is read
+    assert os.stat(first_index_file_path).st_mtime_ns == first_modified
+    assert pq.read_table(first_index_file_path).equals(first_index)
+    assert sorted(os.listdir(config.train_index_dir)) == ["part-00000.parquet", "part-00001.parquet"]
+    assert artifacts.n_train_rows + artifacts.n_test_rows == 1_400
+    assert 0.1 < artifacts.n_test_rows / 1_400 < 0.3
+
+    parquet_op = data_ingestion.parquet_op
+    train_df, test_df = (
+        parquet_op.read_indexed_rows(config.feature_store_dir, index_dir, columns=["Customer Id"], decode=True)
+        for index_dir in (config.train_index_dir, config.test_index_dir)
+    )
+    assert len(train_df) == artifacts.n_train_rows and len(test_df) == artifacts.n_test_rows
+    assert not set(train_df["Customer Id"]) & set(test_df["Customer Id"])
+
+    # A quarantined part leaves the split with its rows
+    data_ingestion.quarantine_parts(artifacts.new_part_file_paths)
+    artifacts = data_ingestion.split_data_as_train_test(
+        DataIngestionArtifacts(feature_store_path=config.feature_store_dir, n_rows=0)
+    )
+    assert os.listdir(config.train_index_dir) == os.listdir(config.test_index_dir) == ["part-00000.parquet"]
+    assert artifacts.n_train_rows + artifacts.n_test_rows == 1_000
@@ -0,0 +1,260 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from shipment.components.data_validation import DataValidation
+from shipment.entity.artifacts_entity import DataIngestionArtifacts
+from shipment.entity.config_entity import DataValidationConfig
+from tests.conftest import SCHEMA_FILE_PATH
+
+
+@pytest.fixture
+def data_validation_config(tmp_path) -> DataValidationConfig:
+    return DataValidationConfig(
+        schema_file_path=SCHEMA_FILE_PATH,
+        data_validation_artifacts_dir=str(tmp_path / "validation"),
+        background_reports=False,
+    )
+
+
+@pytest.fixture
+def data_validation(tmp_path, data_validation_config) -> DataValidation:
+    return DataValidation(
+        DataIngestionArtifacts(feature_store_path=str(tmp_path), n_rows=0), data_validation_config
+    )
+
+
+def test_rate_interval_of_single_row_groups_is_the_wilson_interval(data_validation):
+    # 100 row groups of one row each, 5 of them violating, from a huge population
+    violations = np.zeros((100, 1))
+    violations[:5] = 1
+    rate, lower, upper = data_validation.get_rate_interval(np.array([10**12]), np.ones((100, 1)), violations, 1.0)
+
+    wilson = stats.binomtest(5, 100).proportion_ci(confidence_level=0.95, method="wilson")
+    assert rate == 0.05
+    # The variance of 100 clusters has 99 degrees of freedom
+    assert lower == pytest.approx(wilson.low, rel=1e-2)
+    assert upper == pytest.approx(wilson.high, rel=1e-2)
+
+
+def test_rate_interval_stays_informative_at_zero_violations(data_validation):
+    sampled = np.array([[300, 100], [200, 0]])
+    rate, lower, upper = data_validation.get_rate_interval(
+        np.array([10**12, 10**12]), sampled, np.zeros(sampled.shape), 1.0
+    )
+
+    z = stats.norm.ppf(0.975)
+    assert rate == 0.0
+    assert lower == pytest.approx(0.0, abs=1e-12)
+    assert upper == pytest.approx(z**2 / (600 + z**2))
+
+
+def test_rate_interval_of_sampled_row_groups_has_its_nominal_coverage(data_validation):
+    rng = np.random.default_rng(0)
+    # 200 row groups of 50 rows in two strata; violations cluster in a few bad row groups
+    n_groups, n_drawn = 200, 40
+    population_rows = rng.multinomial(50, [0.7, 0.3], size=n_groups)
+    group_rates = np.where(rng.random(n_groups) < 0.1, 0.2, 0.005)
+    population_violations = rng.binomial(population_rows, group_rates[:, None])
+    true_rate = population_violations.sum() / population_rows.sum()
+
+    n_covered = 0
+    for _ in range(1_000):
+        drawn = rng.choice(n_groups, n_drawn, replace=False)
+        _, lower, upper = data_validation.get_rate_interval(
+            population_rows.sum(axis=0), population_rows[drawn], population_violations[drawn], 1 - n_drawn / n_groups
+        )
+        n_covered += lower <= true_rate <= upper
+
+    assert n_covered / 1_000 > 0.92
+
+
+def test_full_mode_counts_range_and_allowed_value_violations(ingest, shipment_df, data_validation_config):
+    df = shipment_df.iloc[:1_000].copy()
+    df.loc[df.index[:7], "Height"] = -1.0
+    df.loc[df.index[10:13], "Artist Reputation"] = 1.5
+    df.loc[df.index[20:24], "Material"] = "Plastic"
+    df.loc[df.index[30:32], "Transport"] = "Spaceways"
+    _, artifacts = ingest(df)
+    report = DataValidation(artifacts, data_validation_config).validate(artifacts.new_part_file_paths)
+
+    assert report["n_rows"] == 1_000
+    assert report["ranges"]["Height"]["below_min"] == 7
+    assert report["ranges"]["Artist Reputation"]["above_max"] == 3
+    assert report["allowed_values"]["Material"] == {"n_invalid": 4, "examples": ["Plastic"]}
+    assert report["allowed_values"]["Transport"] == {"n_invalid": 2, "examples": ["Spaceways"]}
+    # Nothing else is flagged: the rest of the batch is clean data
+    assert sum(counts[key] for counts in report["ranges"].values() for key in ("below_min", "above_max")) == 10
+    assert sum(counts["n_invalid"] for counts in report["allowed_values"].values()) == 6
+    assert report["validation_status"] is False
+
+    config = replace(data_validation_config, max_violation_rate=0.007)
+    assert DataValidation(artifacts, config).validate(artifacts.new_part_file_paths)["validation_status"] is True
+
+
+def test_missing_values_are_counted_against_the_column_limit(ingest, shipment_df, data_validation_config):
+    _, artifacts = ingest(shipment_df.iloc[:1_000])
+    report = DataValidation(artifacts, data_validation_config).validate(artifacts.new_part_file_paths)
+
+    assert report["validation_status"] is True
+    assert report["missing_values"]["Weight"] == {
+        "max_rate": 0.2,
+        "n_missing": int(shipment_df["Weight"].iloc[:1_000].isna().sum()),
+    }
+    assert report["missing_values"]["Cost"] == {"max_rate": 0.05, "n_missing": 0}
+
+
+@pytest.mark.parametrize("validation_mode", ["full", "sample"])
+def test_suddenly_missing_column_fails_the_gate(ingest, shipment_df, data_validation_config, validation_mode):
+    config = replace(data_validation_config, validation_mode=validation_mode, sample_error=0.05)
+    df = shipment_df.iloc[:3_000].copy()
+    df.loc[df.index[::2], "Weight"] = None
+    _, artifacts = ingest(df, batch_size=50)
+    report = DataValidation(artifacts, config).validate(artifacts.new_part_file_paths)
+
+    assert report["validation_status"] is False
+    assert report["files"] == {}
+    assert "escalated_from_sample" not in report
+    if validation_mode == "full":
+        assert report["missing_values"]["Weight"]["n_missing"] == df["Weight"].isna().sum()
+    else:
+        assert report["missing_values"]["Weight"]["n_missing_rate"]["lower"] > 0.2
+
+
+def test_all_null_column_breaks_its_missing_value_rule(ingest, shipment_df, data_validation_config):
+    _, artifacts = ingest(shipment_df.iloc[:1_000].rename(columns={"Weight": "weight"}))
+    report = DataValidation(artifacts, data_validation_config).validate_files(artifacts.new_part_file_paths)
+
+    assert report["missing_values"]["Weight"]["n_missing"] == 1_000
+    assert report["validation_status"] is False
+
+
+def test_sample_mode_decides_clean_and_bad_batches_from_the_sample(
+    ingest, shipment_df, data_validation_config
+):
+    config = replace(
+        data_validation_config, validation_mode="sample", sample_max_violation_rate=0.02, sample_error=0.05
+    )
+    # 60 row groups of 50 rows, of which the sample reads 30
+    _, artifacts = ingest(shipment_df.iloc[:3_000], batch_size=50)
+    report = DataValidation(artifacts, config).validate(artifacts.new_part_file_paths)
+
+    assert report["validation_status"] is True
+    assert "escalated_from_sample" not in report
+    assert report["sample"]["n_population_row_groups"] == 60
+    assert report["sample"]["n_row_groups"] == 30
+    assert report["n_rows"] == 1_500
+
+    bad_df = shipment_df.iloc[3_000:6_000].copy()
+    bad_df["Material"] = "Plastic"
+    _, artifacts = ingest(bad_df, batch_size=50)
+    report = DataValidation(artifacts, config).validate(artifacts.new_part_file_paths)
+
+    assert report["validation_status"] is False
+    assert "escalated_from_sample" not in report
+    assert report["allowed_values"]["Material"]["examples"] == ["Plastic"]
+
+
+def test_sample_mode_checks_batches_with_few_row_groups_in_full(ingest, shipment_df, data_validation_config):
+    config = replace(data_validation_config, validation_mode="sample", sample_max_violation_rate=0.02)
+    _, artifacts = ingest(shipment_df.iloc[:3_000])
+    report = DataValidation(artifacts, config).validate(artifacts.new_part_file_paths)
+
+    assert "sample" not in report
+    assert report["n_rows"] == 3_000
+
+
+def test_sample_mode_rejects_a_zero_tolerance(ingest, shipment_df, data_validation_config):
+    config = replace(data_validation_config, validation_mode="sample", sample_max_violation_rate=0.0)
+    _, artifacts = ingest(shipment_df.iloc[:500])
+
+    with pytest.raises(ValueError, match="sample_max_violation_rate"):
+        DataValidation(artifacts, config).validate(artifacts.new_part_file_paths)
+
+
+def test_process_pool_from_a_background_thread_matches_the_inline_run(
+    ingest, shipment_df, data_validation_config
+):
+    _, artifacts = ingest(shipment_df.iloc[:2_000])
+    file_paths = artifacts.new_part_file_paths
+
+    inline = DataValidation(artifacts, replace(data_validation_config, n_workers=1))
+    pooled = DataValidation(artifacts, replace(data_validation_config, n_workers=2, min_parallel_bytes=0))
+    # Background reports map columns from a worker thread of a process that has other threads running
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pooled_report = executor.submit(pooled.validate, file_paths).result(timeout=120)
+        pooled_summary = executor.submit(pooled.build_reference_summary, file_paths).result(timeout=120)
+
+    assert pooled_report == inline.validate(file_paths)
+    assert pooled_summary == inline.build_reference_summary(file_paths)
+
+
+def test_small_batches_are_checked_without_starting_worker_processes(
+    ingest, shipment_df, data_validation_config, monkeypatch
+):
+    _, artifacts = ingest(shipment_df.iloc[:2_000])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("worker processes started for a small batch")
+
+    monkeypatch.setattr("shipment.components.data_validation.ProcessPoolExecutor", fail)
+    data_validation = DataValidation(artifacts, replace(data_validation_config, n_workers=4))
+
+    assert data_validation.validate(artifacts.new_part_file_paths)["validation_status"] is True
+
+
+def test_drift_statistics_of_a_shifted_batch(data_validation):
+    summary = {
+        "n_rows": 1_000,
+        "numerical": {"Height": {"edges": [1.0, 2.0, 3.0], "counts": [250, 250, 250, 250], "n_missing": 0}},
+        "categorical": {"Material": {"counts": {"Brass": 500, "Stone": 500}, "n_missing": 0}},
+    }
+    counts = {
+        "n_rows": 1_000,
+        "numerical": {"Height": {"counts": [100, 150, 300, 350], "n_missing": 100}},
+        "categorical": {"Material": {"counts": {"Brass": 300, "Stone": 600}, "n_missing": 100}},
+    }
+
+    report = data_validation.compare_with_reference(summary, counts)
+
+    height = report["columns"]["Height"]
+    assert height["bins"][-1] == "missing"
+    assert height["batch_counts"] == [100, 150, 300, 350, 100]
+    # Reference and batch CDFs over the bins, missing last: 0.25, 0.5, 0.75, 1, 1 against 0.1, 0.25, 0.55, 0.9, 1
+    assert height["ks_statistic"] == pytest.approx(0.25)
+    assert height["p_value"] == pytest.approx(stats.kstwobign.sf(np.sqrt(500) * 0.25))
+    expected, actual = np.array([0.25, 0.25, 0.25, 0.25, 1e-6]), np.array([0.1, 0.15, 0.3, 0.35, 0.1])
+    assert height["psi"] == pytest.approx(np.sum((actual - expected) * np.log(actual / expected)))
+    assert height["drift"] is True
+
+    material = report["columns"]["Material"]
+    assert material["bins"] == ["Brass", "Stone", "missing"]
+    # The missing bin is empty in the reference and expects the floor frequency of 1e-6
+    chi2_statistic = 200**2 / 500 + 100**2 / 500 + (100 - 1e-3) ** 2 / 1e-3
+    assert material["chi2_statistic"] == pytest.approx(chi2_statistic)
+    assert material["p_value"] == pytest.approx(stats.chi2.sf(chi2_statistic, df=2))
+    assert material["drift"] is True
+
+
+def test_drift_flags_shifted_and_missing_columns_but_not_a_clean_batch(ingest, shipment_df, data_validation_config):
+    _, reference_artifacts = ingest(shipment_df.iloc[:3_000])
+    data_validation = DataValidation(reference_artifacts, data_validation_config)
+    summary = data_validation.build_reference_summary(reference_artifacts.new_part_file_paths)
+
+    _, clean_artifacts = ingest(shipment_df.iloc[3_000:6_000])
+    clean_report = data_validation.detect_drift(summary, clean_artifacts.new_part_file_paths)
+
+    assert clean_report["drift_status"] is False
+
+    shifted_df = shipment_df.iloc[:3_000].copy()
+    shifted_df["Height"] = shifted_df["Height"] * 3
+    shifted_df["Weight"] = None
+    shifted_df["Transport"] = None
+    _, shifted_artifacts = ingest(shifted_df)
+    shifted_report = data_validation.detect_drift(summary, shifted_artifacts.new_part_file_paths)
+
+    drifted = {column for column, column_report in shifted_report["columns"].items() if column_report["drift"]}
+    assert drifted == {"Height", "Weight", "Transport"}
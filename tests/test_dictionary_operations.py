@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from shipment.configuration.dictionary_operations import MISSING_HASH, DictionaryOperation
+
+
+def test_codes_decode_to_the_same_values_after_a_reload(tmp_path):
+    dictionaries_dir = str(tmp_path / "_dictionaries")
+    first = pd.Series(["Ohio", None, "Texas", "Ohio"])
+    dictionary_op = DictionaryOperation(dictionaries_dir)
+    first_codes = dictionary_op.encode("Customer Location", first)
+    dictionary_op.save()
+
+    reloaded_op = DictionaryOperation(dictionaries_dir)
+    second = pd.Series(["Utah", "Texas", np.nan])
+    second_codes = reloaded_op.encode("Customer Location", second)
+
+    assert first_codes.tolist() == [0, -1, 1, 0]
+    # Known values keep their codes, new ones are appended
+    assert second_codes.tolist() == [2, 1, -1]
+    assert reloaded_op.decode("Customer Location", first_codes).tolist() == ["Ohio", np.nan, "Texas", "Ohio"]
+    assert reloaded_op.decode("Customer Location", second_codes).tolist() == ["Utah", "Texas", np.nan]
+
+
+def test_hashes_match_pandas_before_and_after_a_reload(tmp_path):
+    dictionaries_dir = str(tmp_path / "_dictionaries")
+    values = pd.Series(["Ohio", None, "Texas", "Ohio"])
+    dictionary_op = DictionaryOperation(dictionaries_dir)
+    codes = dictionary_op.encode("Artist Name", values)
+    hashes = dictionary_op.get_hashes("Artist Name", codes)
+    dictionary_op.save()
+
+    reloaded_hashes = DictionaryOperation(dictionaries_dir).get_hashes("Artist Name", codes)
+
+    expected = pd.util.hash_pandas_object(values.astype("category"), index=False).to_numpy()
+    np.testing.assert_array_equal(hashes, expected)
+    np.testing.assert_array_equal(reloaded_hashes, expected)
+    assert hashes[1] == MISSING_HASH
+
+
+def test_save_writes_only_the_dictionaries_that_grew(tmp_path):
+    dictionaries_dir = str(tmp_path / "_dictionaries")
+    dictionary_op = DictionaryOperation(dictionaries_dir)
+    dictionary_op.encode("Customer Id", pd.Series(["a", "b"]))
+    dictionary_op.encode("Artist Name", pd.Series(["c"]))
+    dictionary_op.save()
+    artist_file_path = dictionary_op.get_dictionary_file_path("Artist Name")
+    os.utime(artist_file_path, (0, 0))
+
+    dictionary_op.encode("Customer Id", pd.Series(["c"]))
+    dictionary_op.encode("Artist Name", pd.Series(["c"]))
+    dictionary_op.save()
+
+    assert os.stat(artist_file_path).st_mtime == 0
+    assert DictionaryOperation(dictionaries_dir).decode("Customer Id", np.arange(3)).tolist() == ["a", "b", "c"]
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from shipment.components.eda_report import EDAReport
+from shipment.entity.config_entity import EDAReportConfig
+from shipment.utils.main_utils import MainUtils
+from tests.conftest import SCHEMA_FILE_PATH
+
+
+@pytest.fixture
+def eda_report_config(data_ingestion_config, tmp_path) -> EDAReportConfig:
+    return EDAReportConfig(
+        schema_file_path=SCHEMA_FILE_PATH,
+        feature_store_dir=data_ingestion_config.feature_store_dir,
+        cache_dir=str(tmp_path / "eda_cache"),
+        report_file_path=str(tmp_path / "eda" / "eda_report.json"),
+    )
+
+
+def test_group_stats_match_pandas(ingest, eda_report_config, shipment_df):
+    _, ingestion_artifacts = ingest(shipment_df)
+    assert ingestion_artifacts.n_duplicate_rows == 0
+    df = MainUtils().cast_dataframe(shipment_df.copy(), MainUtils().read_yaml_file(SCHEMA_FILE_PATH))
+    df["year"] = df["Scheduled Date"].dt.year
+
+    report = EDAReport(eda_report_config).build_report()
+
+    assert report["n_rows"] == len(df)
+    for grouping in ("International", "Remote Location", "year"):
+        rows = {row[grouping]: row for row in report["groups"][grouping]}
+        for key, values in df.groupby(grouping, dropna=False)["Cost"]:
+            row = rows.pop(None if pd.isna(key) else key)
+            assert row["count"] == len(values)
+            assert row["mean"] == pytest.approx(values.mean(), rel=1e-9)
+            # The median comes from a sketch, so it is checked by its rank
+            assert (values <= row["median"]).mean() == pytest.approx(0.5, abs=0.05)
+        assert not rows
+
+
+def test_report_is_cached_until_the_feature_store_changes(ingest, eda_report_config, shipment_df):
+    ingest(shipment_df.iloc[:3_000])
+    first = EDAReport(eda_report_config).initiate_eda_report()
+    second = EDAReport(eda_report_config).initiate_eda_report()
+
+    assert not first.cache_hit
+    assert second.cache_hit
+    assert second.fingerprint == first.fingerprint
+
+    ingest(shipment_df.iloc[3_000:])
+    third = EDAReport(eda_report_config).initiate_eda_report()
+
+    assert not third.cache_hit
+    assert third.fingerprint != first.fingerprint
+    assert MainUtils().read_json_file(third.report_file_path)["n_rows"] == len(shipment_df)
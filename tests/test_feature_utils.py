@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from shipment.utils.feature_utils import FeatureUtils
+
+
+def regress_vif(values: np.ndarray, column: int) -> float:
+    """VIF by its definition, 1 / (1 - R^2) of a least squares fit on the other columns."""
+    target = values[:, column]
+    others = np.column_stack([np.ones(len(values)), np.delete(values, column, axis=1)])
+    residuals = target - others @ np.linalg.lstsq(others, target, rcond=None)[0]
+    r_squared = 1 - residuals.var() / target.var()
+    return 1 / (1 - r_squared)
+
+
+def test_variance_inflation_factors_match_their_definition():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(5_000, 4))
+    values[:, 3] = values[:, 0] + 0.5 * values[:, 1] + 0.3 * rng.normal(size=5_000)
+    columns = ["a", "b", "c", "d"]
+
+    vifs = FeatureUtils.get_variance_inflation_factors(np.corrcoef(values, rowvar=False), columns)
+
+    for position, column in enumerate(columns):
+        assert vifs[column] == pytest.approx(regress_vif(values, position), rel=1e-8)
+    assert vifs["d"] > 10 > vifs["c"]
+
+
+def test_variance_inflation_factors_of_constant_and_collinear_columns():
+    rng = np.random.default_rng(1)
+    a = rng.normal(size=1_000)
+    b = rng.normal(size=1_000) + 0.5 * a
+    c = rng.normal(size=1_000) + 0.3 * b
+    values = np.column_stack([a, 2 * a, b, c, np.ones(1_000)])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlation = np.corrcoef(values, rowvar=False)
+
+    vifs = FeatureUtils.get_variance_inflation_factors(correlation, ["a", "twice a", "b", "c", "constant"])
+
+    assert vifs["constant"] is None
+    assert vifs["a"] == vifs["twice a"] == np.inf
+    # Columns outside the collinear set keep their VIF, regressed on the span of the others
+    assert vifs["b"] == pytest.approx(regress_vif(values[:, :4], 2), rel=1e-8)
+    assert vifs["c"] == pytest.approx(regress_vif(values[:, :4], 3), rel=1e-8)
+
+
+def test_civil_dates_round_trip_over_four_centuries():
+    days = np.arange(-150_000, 150_000, dtype=np.int64)
+    dates = days.astype("datetime64[D]")
+
+    year, month, day = FeatureUtils.get_civil_dates(days)
+
+    assert (year == dates.astype("datetime64[Y]").astype(np.int64) + 1970).all()
+    assert (month == dates.astype("datetime64[M]").astype(np.int64) % 12 + 1).all()
+    assert (day == (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1).all()
+    assert (FeatureUtils.get_new_year_day_numbers(year[month + day == 2]) == days[month + day == 2]).all()
+
+
+def test_date_features_match_pandas():
+    rng = np.random.default_rng(2)
+    scheduled = pd.Series(pd.to_datetime("1899-12-25") + pd.to_timedelta(rng.integers(0, 90_000, 5_000), unit="D"))
+    delivery = scheduled + pd.to_timedelta(rng.integers(-5, 6, 5_000), unit="D")
+    scheduled = scheduled.astype("datetime64[ms]")
+
+    features = FeatureUtils().get_date_features(scheduled, delivery)
+
+    iso = scheduled.dt.isocalendar()
+    lag = (delivery - scheduled).dt.days
+    assert (features["Delivery Lag Days"] == lag).all()
+    assert (features["Scheduled Weekday"] == scheduled.dt.weekday).all()
+    assert (features["Scheduled Week"] == iso.week).all()
+    assert (features["Scheduled Month"] == scheduled.dt.month).all()
+    assert (features["Scheduled Year"] == scheduled.dt.year).all()
+    assert (features["Early Delivery"] == (lag < 0)).all()
+    assert (features["Late Delivery"] == (lag > 0)).all()
+
+
+def test_date_features_of_missing_dates_are_missing():
+    scheduled = pd.Series(pd.to_datetime(["2021-01-03", None, "2020-12-31"]))
+    delivery = pd.Series(pd.to_datetime(["2021-01-01", "2021-01-05", None]))
+
+    features = FeatureUtils().get_date_features(scheduled, delivery)
+
+    assert features["Scheduled Week"].tolist() == [53, pd.NA, 53]
+    assert features["Scheduled Year"].tolist() == [2021, pd.NA, 2020]
+    assert features["Delivery Lag Days"].tolist() == [-2, pd.NA, pd.NA]
+    assert features["Early Delivery"].tolist() == [True, pd.NA, pd.NA]
+
+
+def test_power_transform_applies_the_fitted_parameters():
+    values = np.random.default_rng(3).lognormal(size=1_000)
+    lmbda = stats.yeojohnson_normmax(values)
+    transformed = stats.yeojohnson(values, lmbda)
+    params = {"Weight": {"lambda": lmbda, "mean": transformed.mean(), "std": transformed.std()}}
+    df = pd.DataFrame({"Weight": values.astype(np.float32), "Cost": np.arange(1_000.0)})
+    df.loc[3, "Weight"] = np.nan
+
+    FeatureUtils.power_transform(df, params)
+
+    assert np.isnan(df.loc[3, "Weight"])
+    present = df["Weight"].notna().to_numpy()
+    expected = (transformed - transformed.mean()) / transformed.std()
+    np.testing.assert_allclose(df["Weight"][present], expected[present], atol=1e-5)
+    assert (df["Cost"] == np.arange(1_000.0)).all()
+
+
+def test_customer_location_of_civilian_and_military_addresses():
+    locations = pd.Series(["New Michelle, OH 50777", "APO AE 89114", "FPO AP 03279", "New Michelle, OH 50777"])
+
+    parsed = FeatureUtils().parse_customer_location(locations)
+
+    assert parsed["Customer City"].tolist() == ["New Michelle", "APO", "FPO", "New Michelle"]
+    assert parsed["Customer State"].tolist() == ["OH", "AE", "AP", "OH"]
+    assert parsed["Customer Zip Prefix"].tolist() == [507, 891, 32, 507]
+
+
+def test_customer_location_of_missing_and_unparsable_values_is_missing():
+    locations = pd.Series(["Lake Amy, XX 12345", None, "somewhere", "Lake Amy, TX 1234", "Lake Amy, TX 12345"])
+
+    parsed = FeatureUtils().parse_customer_location(locations.astype("category"))
+
+    # XX matches the pattern but is not a state code
+    assert parsed["Customer City"].tolist()[:4] == ["Lake Amy", np.nan, np.nan, np.nan]
+    assert parsed["Customer State"].isna().tolist() == [True, True, True, True, False]
+    assert parsed["Customer Zip Prefix"].tolist() == [123, -1, -1, -1, 123]
+
+
+def test_customer_location_codes_do_not_depend_on_the_batch():
+    utils = FeatureUtils()
+    first = utils.parse_customer_location(pd.Series(["Lake Amy, TX 12345", "APO AE 89114"]))
+    second = utils.parse_customer_location(pd.Series(["West Joe, WY 54321", "APO AE 89114", "Lake Amy, TX 12345"]))
+
+    assert first["Customer State"].cat.categories.equals(second["Customer State"].cat.categories)
+    assert first["Customer State"].cat.codes.tolist() == second["Customer State"].cat.codes.tolist()[2:0:-1]
+    # City categories follow the batch, so cities are compared by label
+    assert first["Customer City"].tolist() == second["Customer City"].tolist()[2:0:-1]
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+
+from shipment.configuration.mongo_bulk_loader import MongoBulkLoader
+from shipment.entity.config_entity import MongoBulkLoadConfig
+from shipment.exception import ShippingException
+from tests.conftest import COLLECTION_NAME, DB_NAME, SCHEMA_FILE_PATH
+
+
+@pytest.fixture
+def mongo_bulk_loader(mongo_op) -> MongoBulkLoader:
+    # Small chunks and batches so that a 1,000 row file takes several of each
+    config = MongoBulkLoadConfig(
+        db_name=DB_NAME,
+        collection_name=COLLECTION_NAME,
+        schema_file_path=SCHEMA_FILE_PATH,
+        chunk_size=300,
+        insert_batch_size=128,
+        max_in_flight=2,
+    )
+    return MongoBulkLoader(config, mongo_op)
+
+
+def test_every_row_is_inserted_with_schema_types(mongo_bulk_loader, mongo_op, shipment_df, tmp_path):
+    df = shipment_df.iloc[:1_000]
+    csv_file_path = str(tmp_path / "drop.csv")
+    df.to_csv(csv_file_path, index=False)
+
+    artifacts = mongo_bulk_loader.load_csv(csv_file_path)
+
+    collection = mongo_op.get_collection(DB_NAME, COLLECTION_NAME)
+    assert artifacts.n_rows == len(df)
+    assert collection.count_documents({}) == len(df)
+    document = collection.find_one({"Customer Id": df["Customer Id"].iloc[0]})
+    assert document["International"] is (df["International"].iloc[0] == "Yes")
+    assert document["Scheduled Date"] == datetime.strptime(df["Scheduled Date"].iloc[0], "%m/%d/%y")
+    assert document["Cost"] == df["Cost"].iloc[0]
+    # Missing values are stored as nulls rather than NaN
+    for column in ("Weight", "Transport", "Remote Location"):
+        missing_row = df[df[column].isna()].iloc[0]
+        assert collection.find_one({"Customer Id": missing_row["Customer Id"]})[column] is None
+
+
+def test_csv_with_a_renamed_column_is_rejected_before_any_insert(mongo_bulk_loader, mongo_op, shipment_df, tmp_path):
+    csv_file_path = str(tmp_path / "drop.csv")
+    shipment_df.iloc[:100].rename(columns={"Weight": "weight"}).to_csv(csv_file_path, index=False)
+
+    with pytest.raises(ShippingException, match="does not match the schema"):
+        mongo_bulk_loader.load_csv(csv_file_path)
+
+    assert mongo_op.get_collection(DB_NAME, COLLECTION_NAME).count_documents({}) == 0
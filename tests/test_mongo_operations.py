@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from shipment.configuration.mongo_operations import MongoDBOperation
+from shipment.exception import ShippingException
+
+mongomock = pytest.importorskip("mongomock")
+
+DB_NAME = "shipmentdata"
+COLLECTION_NAME = "ship"
+N_DOCUMENTS = 1003
+
+
+@pytest.fixture
+def mongo_op():
+    mongo_op = MongoDBOperation(client=mongomock.MongoClient())
+    mongo_op.get_collection(DB_NAME, COLLECTION_NAME).insert_many(
+        [{"_id": i, "value": i * 2} for i in range(N_DOCUMENTS)]
+    )
+    return mongo_op
+
+
+def iter_parallel(mongo_op, **kwargs):
+    options = {"batch_size": 50, "n_workers": 4, "max_prefetch_batches": 2, "projection": {"_id": 1, "value": 1}}
+    options.update(kwargs)
+    return mongo_op.iter_collection_batches_parallel(DB_NAME, COLLECTION_NAME, **options)
+
+
+def wait_for_threads(n_threads: int, timeout: float = 5.0) -> int:
+    deadline = time.monotonic() + timeout
+    while threading.active_count() > n_threads and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return threading.active_count()
+
+
+def test_id_ranges_cover_the_collection(mongo_op):
+    id_ranges = mongo_op.get_id_ranges(DB_NAME, COLLECTION_NAME, 4)
+
+    assert len(id_ranges) == 4
+    assert id_ranges[0][0] is None and id_ranges[-1][1] is None
+    assert all(upper == lower for (_, upper), (lower, _) in zip(id_ranges, id_ranges[1:]))
+
+
+def test_parallel_batches_are_complete_and_in_id_order(mongo_op):
+    batches = list(iter_parallel(mongo_op))
+
+    ids = [document["_id"] for batch in batches for document in batch]
+    assert ids == list(range(N_DOCUMENTS))
+    assert all(len(batch) <= 50 for batch in batches)
+    assert all(document["value"] == document["_id"] * 2 for batch in batches for document in batch)
+
+
+def test_parallel_batches_apply_the_query(mongo_op):
+    batches = iter_parallel(mongo_op, query={"value": {"$gte": 1000}})
+
+    assert [document["_id"] for batch in batches for document in batch] == list(range(500, N_DOCUMENTS))
+
+
+def test_closing_early_stops_the_workers(mongo_op):
+    n_threads = threading.active_count()
+    batches = iter_parallel(mongo_op, batch_size=10, max_prefetch_batches=1)
+
+    first_batch = next(batches)
+    batches.close()
+
+    assert [document["_id"] for document in first_batch] == list(range(10))
+    assert wait_for_threads(n_threads) == n_threads
+
+
+def test_worker_errors_reach_the_consumer(mongo_op, monkeypatch):
+    iter_collection_batches = mongo_op.iter_collection_batches
+
+    def failing_iter_collection_batches(*args, query=None, **kwargs):
+        if "$gte" in query.get("_id", {}):
+            raise RuntimeError("range read failed")
+        yield from iter_collection_batches(*args, query=query, **kwargs)
+
+    monkeypatch.setattr(mongo_op, "iter_collection_batches", failing_iter_collection_batches)
+    n_threads = threading.active_count()
+
+    with pytest.raises(ShippingException, match="range read failed"):
+        list(iter_parallel(mongo_op))
+    assert wait_for_threads(n_threads) == n_threads
+
+
+def test_later_ranges_are_read_while_the_first_is_consumed(mongo_op, monkeypatch):
+    iter_collection_batches = mongo_op.iter_collection_batches
+    finished_ranges = []
+
+    def recording_iter_collection_batches(*args, query=None, **kwargs):
+        yield from iter_collection_batches(*args, query=query, **kwargs)
+        finished_ranges.append(query)
+
+    monkeypatch.setattr(mongo_op, "iter_collection_batches", recording_iter_collection_batches)
+    batches = iter_parallel(mongo_op, batch_size=10, max_prefetch_batches=1)
+    first_batch = next(batches)
+
+    # Every range is read to its end while the consumer still holds the first batch
+    deadline = time.monotonic() + 5.0
+    while len(finished_ranges) < 4 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert len(finished_ranges) == 4
+
+    ids = [document["_id"] for batch in [first_batch, *batches] for document in batch]
+    assert ids == list(range(N_DOCUMENTS))
@@ -0,0 +1,94 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from shipment.components.outlier_detection import MAD_SCALE, OutlierDetection
+from shipment.components.power_transform import PowerTransform
+from shipment.entity.config_entity import OutlierDetectionConfig, PowerTransformConfig
+from shipment.utils.feature_utils import FeatureUtils
+from tests.conftest import SCHEMA_FILE_PATH
+
+COLUMNS = ["Price Of Sculpture", "Weight"]
+
+
+@pytest.fixture
+def outlier_detection_config(tmp_path) -> OutlierDetectionConfig:
+    return OutlierDetectionConfig(
+        schema_file_path=SCHEMA_FILE_PATH, bounds_file_path=str(tmp_path / "outliers" / "outlier_bounds.json")
+    )
+
+
+@pytest.fixture
+def ingested(ingest, shipment_df):
+    data_ingestion, artifacts = ingest(shipment_df.iloc[:3_000])
+    train_df = data_ingestion.parquet_op.read_indexed_rows(
+        artifacts.feature_store_path, artifacts.train_index_dir, columns=COLUMNS
+    )
+    return artifacts, {column: train_df[column].dropna().to_numpy(dtype=np.float64) for column in COLUMNS}
+
+
+def test_iqr_bounds_match_numpy_quantiles(ingested, outlier_detection_config):
+    artifacts, train_values = ingested
+    outlier_detection = OutlierDetection(artifacts, outlier_detection_config)
+
+    bounds = outlier_detection.get_bounds()
+    outlier_detection.count_outliers(bounds)
+
+    for column, values in train_values.items():
+        column_bounds = bounds[column]
+        # The sketch is exact up to its rank error, so compare the ranks of its quartiles
+        assert np.mean(values <= column_bounds["q1"]) == pytest.approx(0.25, abs=0.02)
+        assert np.mean(values <= column_bounds["q3"]) == pytest.approx(0.75, abs=0.02)
+        iqr = column_bounds["q3"] - column_bounds["q1"]
+        assert column_bounds["lower"] == pytest.approx(column_bounds["q1"] - 1.5 * iqr)
+        assert column_bounds["upper"] == pytest.approx(column_bounds["q3"] + 1.5 * iqr)
+        assert column_bounds["n_below"] == np.count_nonzero(values < column_bounds["lower"])
+        assert column_bounds["n_above"] == np.count_nonzero(values > column_bounds["upper"])
+    assert bounds["Price Of Sculpture"]["n_above"] > 0
+
+
+def test_mad_bounds_match_numpy_quantiles(ingested, outlier_detection_config):
+    artifacts, train_values = ingested
+    outlier_detection = OutlierDetection(artifacts, replace(outlier_detection_config, method="mad"))
+
+    bounds = outlier_detection.get_bounds()
+
+    for column, values in train_values.items():
+        column_bounds = bounds[column]
+        assert np.mean(values <= column_bounds["median"]) == pytest.approx(0.5, abs=0.02)
+        deviations = np.abs(values - column_bounds["median"])
+        assert np.mean(deviations <= column_bounds["mad"]) == pytest.approx(0.5, abs=0.02)
+        half_width = 3.5 * MAD_SCALE * column_bounds["mad"]
+        assert column_bounds["lower"] == pytest.approx(column_bounds["median"] - half_width)
+        assert column_bounds["upper"] == pytest.approx(column_bounds["median"] + half_width)
+
+
+def test_power_transform_is_fitted_on_capped_values(ingested, outlier_detection_config, tmp_path):
+    artifacts, train_values = ingested
+    outlier_detection_artifacts = OutlierDetection(artifacts, outlier_detection_config).initiate_outlier_detection()
+    # The reservoir holds every training value, so the fit is exact
+    power_transform_config = PowerTransformConfig(
+        schema_file_path=SCHEMA_FILE_PATH,
+        sample_size=10_000,
+        compare_full_fit=False,
+        params_file_path=str(tmp_path / "power_transform" / "params.json"),
+    )
+    power_transform = PowerTransform(artifacts, power_transform_config, outlier_detection_artifacts)
+
+    params = power_transform.get_params()
+
+    for column, values in train_values.items():
+        capped = np.clip(values, params[column]["lower"], params[column]["upper"])
+        assert params[column]["lambda"] == pytest.approx(stats.yeojohnson_normmax(capped), rel=1e-6)
+        assert params[column]["mean"] == pytest.approx(stats.yeojohnson(capped, params[column]["lambda"]).mean())
+    uncapped = PowerTransform(artifacts, power_transform_config).get_params()
+    assert "lower" not in uncapped["Price Of Sculpture"]
+    assert uncapped["Price Of Sculpture"]["lambda"] != pytest.approx(params["Price Of Sculpture"]["lambda"])
+
+    # Prediction caps with the persisted bounds before transforming
+    upper = params["Price Of Sculpture"]["upper"]
+    df = FeatureUtils.power_transform(pd.DataFrame({"Price Of Sculpture": [upper, 1e9]}), params)
+    assert df["Price Of Sculpture"].iloc[0] == df["Price Of Sculpture"].iloc[1]
@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from shipment.configuration.dictionary_operations import DictionaryOperation
+from shipment.configuration.parquet_operations import ParquetOperation
+from shipment.configuration.row_fingerprint_operations import RowFingerprintOperation
+from shipment.utils.main_utils import MainUtils
+from tests.conftest import SCHEMA_FILE_PATH
+
+
+@pytest.fixture
+def parquet_op(tmp_path) -> ParquetOperation:
+    return ParquetOperation(
+        MainUtils().read_yaml_file(SCHEMA_FILE_PATH), DictionaryOperation(str(tmp_path / "_dictionaries"))
+    )
+
+
+@pytest.fixture
+def records(shipment_df) -> list:
+    return shipment_df.iloc[:300].to_dict(orient="records")
+
+
+def test_encoded_bool_and_float32_columns_hash_the_same_when_read_back(tmp_path, parquet_op, records):
+    table = parquet_op.records_to_table(records)
+    part_file_path = str(tmp_path / "part-00000.parquet")
+    parquet_op.write_tables([table], part_file_path)
+
+    read_back = pq.read_table(part_file_path)
+
+    assert {str(read_back.schema.field(column).type) for column in ("Customer Id", "Fragile", "Height")} == {
+        "int32",
+        "bool",
+        "float",
+    }
+    np.testing.assert_array_equal(
+        RowFingerprintOperation.get_row_fingerprints(read_back), RowFingerprintOperation.get_row_fingerprints(table)
+    )
+
+
+def test_duplicates_are_dropped_within_a_batch_and_against_saved_parts(tmp_path, parquet_op, records):
+    fingerprints_dir = str(tmp_path / "_row_fingerprints")
+    part_file_path = str(tmp_path / "part-00000.parquet")
+    row_fingerprint_op = RowFingerprintOperation(fingerprints_dir)
+
+    table, n_duplicates = row_fingerprint_op.drop_duplicates(parquet_op.records_to_table(records + records[:50]))
+    assert (table.num_rows, n_duplicates) == (300, 50)
+    # Later batches of the same run are checked against the pending fingerprints
+    table, n_duplicates = row_fingerprint_op.drop_duplicates(parquet_op.records_to_table(records[100:200]))
+    assert (table.num_rows, n_duplicates) == (0, 100)
+    row_fingerprint_op.save(part_file_path)
+
+    row_fingerprint_op = RowFingerprintOperation(fingerprints_dir)
+    row_fingerprint_op.load([part_file_path])
+    new_records = pd.DataFrame(records[:10]).assign(Cost=-1.0).to_dict(orient="records")
+    table, n_duplicates = row_fingerprint_op.drop_duplicates(parquet_op.records_to_table(records[:20] + new_records))
+    assert (table.num_rows, n_duplicates) == (10, 20)
+
+
+def test_parts_without_saved_fingerprints_are_hashed_on_load(tmp_path, parquet_op, records):
+    part_file_path = str(tmp_path / "part-00000.parquet")
+    parquet_op.write_tables([parquet_op.records_to_table(records)], part_file_path)
+    row_fingerprint_op = RowFingerprintOperation(str(tmp_path / "_row_fingerprints"))
+
+    row_fingerprint_op.load([part_file_path])
+
+    assert os.path.exists(row_fingerprint_op.get_fingerprint_file_path(part_file_path))
+    _, n_duplicates = row_fingerprint_op.drop_duplicates(parquet_op.records_to_table(records))
+    assert n_duplicates == 300
+
+
+def test_ingestion_drops_rows_already_in_earlier_parts(ingest, shipment_df):
+    ingest(shipment_df.iloc[:500])
+
+    # Documents re-inserted with new _ids, alongside new ones and a repeat within the batch
+    _, artifacts = ingest(pd.concat([shipment_df.iloc[:200], shipment_df.iloc[500:700], shipment_df.iloc[500:550]]))
+
+    assert artifacts.n_duplicate_rows == 250
+    assert artifacts.n_rows == 200
+
+
+def test_quarantined_parts_take_their_fingerprints_with_them(ingest, shipment_df):
+    ingest(shipment_df.iloc[:500])
+    data_ingestion, artifacts = ingest(shipment_df.iloc[500:700])
+    fingerprint_file_path = data_ingestion.row_fingerprint_op.get_fingerprint_file_path(
+        artifacts.new_part_file_paths[0]
+    )
+    assert os.path.exists(fingerprint_file_path)
+
+    data_ingestion.quarantine_parts(artifacts.new_part_file_paths)
+
+    assert not os.path.exists(fingerprint_file_path)
+    # The rejected rows are not duplicates of anything left in the store
+    _, artifacts = ingest(shipment_df.iloc[500:700])
+    assert (artifacts.n_rows, artifacts.n_duplicate_rows) == (200, 0)
+
+
+def test_orphaned_parts_take_their_fingerprints_with_them(ingest, shipment_df):
+    data_ingestion, _ = ingest(shipment_df.iloc[:500])
+    # A run that wrote its part and fingerprints but died before recording the watermark
+    orphan_file_path = data_ingestion.get_feature_store_file_path(1)
+    data_ingestion.parquet_op.write_tables(
+        [data_ingestion.parquet_op.records_to_table(shipment_df.iloc[500:700].to_dict(orient="records"))],
+        orphan_file_path,
+    )
+    data_ingestion.row_fingerprint_op.load([orphan_file_path])
+    fingerprint_file_path = data_ingestion.row_fingerprint_op.get_fingerprint_file_path(orphan_file_path)
+    assert os.path.exists(fingerprint_file_path)
+
+    ingest(use_cache=False)
+
+    assert not os.path.exists(orphan_file_path)
+    assert not os.path.exists(fingerprint_file_path)
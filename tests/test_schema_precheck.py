@@ -0,0 +1,72 @@
+import pytest
+
+from shipment.components.data_validation import DataValidation
+from shipment.configuration.schema_precheck import SchemaPreCheck
+from shipment.entity.config_entity import DataValidationConfig
+from shipment.utils.main_utils import MainUtils
+from tests.conftest import COLLECTION_NAME, DB_NAME, SCHEMA_FILE_PATH
+
+RENAMED_COLUMNS = {"Weight": "weight", "Material": "material", "Transport": "transport"}
+
+
+@pytest.fixture
+def schema_precheck() -> SchemaPreCheck:
+    return SchemaPreCheck(MainUtils().read_yaml_file(SCHEMA_FILE_PATH))
+
+
+@pytest.fixture
+def renamed_df(shipment_df):
+    # An upstream rename: the fields are still there, under names the schema does not know
+    return shipment_df.iloc[2_000:3_000].rename(columns=RENAMED_COLUMNS)
+
+
+def test_mongo_sample_sees_fields_renamed_in_the_newest_documents(
+    schema_precheck, mongo_op, shipment_df, renamed_df
+):
+    mongo_op.insert_dataframe_as_record(shipment_df.iloc[:2_000], DB_NAME, COLLECTION_NAME)
+    check_report = schema_precheck.check_mongo_sample(mongo_op, DB_NAME, COLLECTION_NAME, 10)
+    assert schema_precheck.is_valid(check_report)
+
+    mongo_op.insert_dataframe_as_record(renamed_df, DB_NAME, COLLECTION_NAME)
+    check_report = schema_precheck.check_mongo_sample(mongo_op, DB_NAME, COLLECTION_NAME, 10)
+
+    assert not schema_precheck.is_valid(check_report)
+    assert check_report["missing_columns"] == list(RENAMED_COLUMNS)
+
+
+def test_renamed_batch_is_rejected_from_its_footer(schema_precheck, ingest, shipment_df, renamed_df, tmp_path):
+    _, artifacts = ingest(shipment_df.iloc[:2_000])
+    assert schema_precheck.is_valid(schema_precheck.check_parquet_footer(artifacts.new_part_file_paths[0]))
+
+    _, artifacts = ingest(renamed_df)
+    check_report = schema_precheck.check_parquet_footer(artifacts.new_part_file_paths[0])
+
+    assert check_report["empty_columns"] == list(RENAMED_COLUMNS)
+    assert not schema_precheck.is_valid(check_report)
+
+    config = DataValidationConfig(
+        schema_file_path=SCHEMA_FILE_PATH,
+        data_validation_artifacts_dir=str(tmp_path / "validation"),
+        background_reports=False,
+    )
+    report = DataValidation(artifacts, config).validate(artifacts.new_part_file_paths)
+    assert report["validation_status"] is False
+    assert report["files"] == {"part-00001.parquet": check_report}
+
+
+def test_partly_missing_columns_are_not_empty(schema_precheck, ingest, shipment_df):
+    df = shipment_df.iloc[:1_000].copy()
+    df.loc[df.index[:999], "Weight"] = None
+    _, artifacts = ingest(df)
+
+    assert schema_precheck.check_parquet_footer(artifacts.new_part_file_paths[0])["empty_columns"] == []
+
+
+def test_csv_header_with_a_renamed_column_is_rejected(schema_precheck, shipment_df, tmp_path):
+    csv_file_path = tmp_path / "drop.csv"
+    shipment_df.iloc[:5].rename(columns={"Weight": "weight"}).to_csv(csv_file_path, index=False)
+
+    check_report = schema_precheck.check_csv_header(str(csv_file_path))
+
+    assert check_report["missing_columns"] == ["Weight"]
+    assert not schema_precheck.is_valid(check_report)
@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from shipment.utils.sketch_utils import (
+    CovarianceAccumulator,
+    HyperLogLog,
+    KLLSketch,
+    ReservoirSample,
+    YeoJohnsonLikelihood,
+    count_leading_zeros,
+)
+
+
+def get_rank_errors(sketch: KLLSketch, values: np.ndarray, fractions) -> np.ndarray:
+    sorted_values = np.sort(values)
+    quantiles = sketch.get_quantiles(fractions)
+    ranks = np.searchsorted(sorted_values, quantiles, side="right") / len(values)
+    return np.abs(ranks - np.asarray(fractions))
+
+
+def test_kll_quantiles_are_within_the_rank_error():
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    sketch = KLLSketch(k=200, seed=0)
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+
+    fractions = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+    assert sketch.n == len(values)
+    assert get_rank_errors(sketch, values, fractions).max() < 0.02
+
+
+def test_kll_memory_does_not_grow_with_the_data():
+    sketch = KLLSketch(k=100, seed=0)
+    sketch.update(np.arange(1_000_000, dtype=np.float64))
+
+    assert sum(len(level) for level in sketch.levels) < 1_000
+
+
+def test_kll_keeps_the_total_weight():
+    sketch = KLLSketch(k=50, seed=0)
+    for size in (1, 7, 333, 4_096, 10_001):
+        sketch.update(np.ones(size))
+
+    weight = sum(len(level) * 2**h for h, level in enumerate(sketch.levels))
+    assert weight == sketch.n == 14_438
+
+
+def test_kll_ignores_missing_values():
+    sketch = KLLSketch(k=200, seed=0)
+    sketch.update(np.array([1.0, np.nan, 3.0, np.nan, 2.0]))
+
+    assert sketch.n == 3
+    assert sketch.get_quantiles([0.5]) == [2.0]
+
+
+def test_kll_of_nothing_is_nan():
+    assert np.isnan(KLLSketch(k=200).get_quantiles([0.5])[0])
+
+
+def test_merged_kll_sketches_match_one_sketch_of_the_union():
+    rng = np.random.default_rng(1)
+    first, second = rng.normal(size=50_000), rng.normal(loc=3, size=30_000)
+    merged = KLLSketch(k=200, seed=0)
+    merged.update(first)
+    other = KLLSketch(k=200, seed=1)
+    other.update(second)
+    merged.merge(other)
+
+    union = np.concatenate([first, second])
+    assert merged.n == len(union)
+    assert get_rank_errors(merged, union, [0.1, 0.5, 0.9]).max() < 0.02
+
+
+def test_count_leading_zeros():
+    values = np.array([1, 2, 3, 2**40, 2**63, 2**64 - 1], dtype=np.uint64)
+
+    assert count_leading_zeros(values).tolist() == [63, 62, 62, 23, 0, 0]
+
+
+def hash_strings(n: int, offset: int = 0) -> np.ndarray:
+    values = pd.Series([f"CUST-{i}" for i in range(offset, offset + n)])
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def test_hyperloglog_count_is_within_its_standard_error():
+    for n in (10, 1_000, 100_000):
+        sketch = HyperLogLog(precision=14)
+        sketch.update(hash_strings(n))
+        # The standard error at precision 14 is 1.04 / sqrt(2 ** 14), about 0.8%
+        assert abs(sketch.get_count() - n) <= max(1, 0.03 * n)
+
+
+def test_hyperloglog_ignores_repeated_values():
+    sketch = HyperLogLog(precision=12)
+    hashes = hash_strings(5_000)
+    for _ in range(3):
+        sketch.update(hashes)
+
+    assert abs(sketch.get_count() - 5_000) <= 0.05 * 5_000
+
+
+def test_merged_hyperloglogs_count_the_union():
+    first, second = HyperLogLog(precision=14), HyperLogLog(precision=14)
+    first.update(hash_strings(20_000))
+    second.update(hash_strings(20_000, offset=10_000))
+
+    assert abs(first.merge(second).get_count() - 30_000) <= 0.03 * 30_000
+
+
+def test_chunked_correlation_matches_numpy():
+    rng = np.random.default_rng(2)
+    values = rng.normal(size=(10_000, 4)) @ rng.normal(size=(4, 4)) + [1e6, 0, -3, 5]
+    accumulator = CovarianceAccumulator(4)
+    for chunk in np.array_split(values, 13):
+        accumulator.update(chunk)
+
+    assert accumulator.n == len(values)
+    np.testing.assert_allclose(accumulator.mean, values.mean(axis=0))
+    np.testing.assert_allclose(accumulator.get_correlation(), np.corrcoef(values, rowvar=False), atol=1e-10)
+
+
+def test_correlation_skips_rows_with_missing_values_and_merges():
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=(2_000, 3))
+    values[::7, 1] = np.nan
+    first, second = CovarianceAccumulator(3), CovarianceAccumulator(3)
+    first.update(values[:900])
+    second.update(values[900:])
+    first.merge(second)
+
+    complete = values[~np.isnan(values).any(axis=1)]
+    assert first.n == len(complete)
+    np.testing.assert_allclose(first.get_correlation(), np.corrcoef(complete, rowvar=False), atol=1e-10)
+
+
+def test_correlation_of_a_constant_column_is_nan():
+    values = np.column_stack([np.arange(100.0), np.full(100, 2.0)])
+    accumulator = CovarianceAccumulator(2)
+    accumulator.update(values)
+
+    correlation = accumulator.get_correlation()
+    assert correlation[0, 0] == pytest.approx(1.0)
+    assert np.isnan(correlation[1]).all() and np.isnan(correlation[:, 1]).all()
+
+
+def test_reservoir_sample_is_bounded_and_drawn_from_the_stream():
+    sample = ReservoirSample(size=1_000, seed=0)
+    for chunk in np.array_split(np.arange(100_000, dtype=np.float64), 50):
+        sample.update(chunk)
+    sample.update(np.array([np.nan, np.nan]))
+
+    assert sample.n == 100_000
+    assert len(sample.values) == 1_000
+    assert len(np.unique(sample.values)) == 1_000
+    assert np.isin(sample.values, np.arange(100_000)).all()
+
+
+def test_reservoir_sample_is_uniform_over_the_stream():
+    # Order of arrival must not matter: early and late values are kept at the same rate
+    counts = np.zeros(10)
+    for seed in range(200):
+        sample = ReservoirSample(size=100, seed=seed)
+        for chunk in np.array_split(np.arange(10_000, dtype=np.float64), 10):
+            sample.update(chunk)
+        counts += np.bincount((sample.values // 1_000).astype(int), minlength=10)
+
+    assert stats.chisquare(counts).pvalue > 0.001
+
+
+def test_merged_reservoir_samples_keep_the_size():
+    first, second = ReservoirSample(size=500, seed=0), ReservoirSample(size=500, seed=1)
+    first.update(np.zeros(10_000))
+    second.update(np.ones(30_000))
+    first.merge(second)
+
+    assert first.n == 40_000
+    assert len(first.values) == 500
+    assert 0.6 < first.values.mean() < 0.9
+
+
+def test_yeo_johnson_likelihood_matches_scipy():
+    values = np.random.default_rng(4).lognormal(size=5_000) - 0.5
+    lambdas = np.linspace(-2, 2, 9)
+    likelihood = YeoJohnsonLikelihood(lambdas)
+    for chunk in np.array_split(values, 7):
+        likelihood.update(chunk)
+
+    expected = [stats.yeojohnson_llf(lmbda, values) for lmbda in lambdas]
+    np.testing.assert_allclose(likelihood.get_log_likelihood(), expected, rtol=1e-9)
+
+
+def test_yeo_johnson_likelihood_lambda_is_close_to_scipy():
+    values = np.random.default_rng(5).gamma(2.0, 10.0, size=20_000)
+    first, second = YeoJohnsonLikelihood(np.linspace(-3, 3, 121)), YeoJohnsonLikelihood(np.linspace(-3, 3, 121))
+    first.update(values[:5_000])
+    second.update(values[5_000:])
+
+    assert first.merge(second).get_lambda() == pytest.approx(stats.yeojohnson_normmax(values), abs=1e-3)